@@ -9,11 +9,21 @@ from sensirion_i2c_driver import I2cConnection
 from sensirion_i2c_sht.sht2x import Sht2xI2cDevice
 from sensirion_i2c_sht.sht3x import Sht3xI2cDevice
 from sensirion_i2c_sht.sht4x import Sht4xI2cDevice
+from sensirion_i2c_sht.simulation import SimulatedI2cTransceiver, \
+    FaultInjectingI2cTransceiver, SimulatedSht2x, SimulatedSht3x, \
+    SimulatedSht4x, SimulatedSts4x, SimulatedShtc3
+from contextlib import contextmanager
 import pytest
+import sys
 
 from sensirion_i2c_sht.shtc3 import Shtc3I2cDevice
 from sensirion_i2c_sht.sts4x import Sts4xI2cDevice
 
+# The asynchronous devices require the async/await syntax of Python 3.5
+collect_ignore_glob = []
+if sys.version_info < (3, 5):
+    collect_ignore_glob.append("tests/*/test_async_device.py")
+
 
 def pytest_addoption(parser):
     """
@@ -22,6 +32,9 @@ def pytest_addoption(parser):
     parser.addoption("--serial-port", action="store", type="string")
     parser.addoption("--serial-bitrate", action="store", type="int",
                      default=460800)
+    parser.addoption("--simulated", action="store_true", default=False,
+                     help="Run the device tests with simulated devices "
+                          "instead of a SensorBridge")
 
 
 def _get_serial_port(config, validate=False):
@@ -47,6 +60,8 @@ def pytest_report_header(config):
     Add extra information to test report header
     """
     lines = []
+    lines.append("Simulated devices: " +
+                 str(config.getoption("--simulated")))
     lines.append("SensorBridge serial port: " + str(_get_serial_port(config)))
     lines.append("SensorBridge serial bitrate: " +
                  str(_get_serial_bitrate(config)))
@@ -62,86 +77,78 @@ def bridge(request):
         yield dev
 
 
-@pytest.fixture
-def sht2x(bridge):
-    # Configure SensorBridge port 1 for SHT2x
+@contextmanager
+def _i2c_transceiver(request, simulated_device):
+    """
+    Get the I²C transceiver for a device, i.e. SensorBridge port 1, or the
+    passed simulated device if the '--simulated' argument is given.
+    """
+    if request.config.getoption("--simulated"):
+        yield SimulatedI2cTransceiver([simulated_device])
+        return
+
+    # Configure SensorBridge port 1
+    bridge = request.getfixturevalue("bridge")
     bridge.set_i2c_frequency(SensorBridgePort.ONE, frequency=100e3)
     bridge.set_supply_voltage(SensorBridgePort.ONE, voltage=3.3)
     bridge.switch_supply_on(SensorBridgePort.ONE)
 
-    # Create SHT2x device
-    i2c_transceiver = SensorBridgeI2cProxy(bridge, port=SensorBridgePort.ONE)
-    sht2x = Sht2xI2cDevice(I2cConnection(i2c_transceiver))
-
-    yield sht2x
+    yield SensorBridgeI2cProxy(bridge, port=SensorBridgePort.ONE)
 
     # make sure the channel is powered off after executing tests
     bridge.switch_supply_off(SensorBridgePort.ONE)
 
 
 @pytest.fixture
-def sht3x(bridge):
-    # Configure SensorBridge port 1 for SHT3x
-    bridge.set_i2c_frequency(SensorBridgePort.ONE, frequency=100e3)
-    bridge.set_supply_voltage(SensorBridgePort.ONE, voltage=3.3)
-    bridge.switch_supply_on(SensorBridgePort.ONE)
-
-    # Create SHT3x device
-    i2c_transceiver = SensorBridgeI2cProxy(bridge, port=SensorBridgePort.ONE)
-    sht3x = Sht3xI2cDevice(I2cConnection(i2c_transceiver))
-
-    yield sht3x
-
-    # make sure the channel is powered off after executing tests
-    bridge.switch_supply_off(SensorBridgePort.ONE)
+def sht2x(request):
+    with _i2c_transceiver(request, SimulatedSht2x()) as i2c_transceiver:
+        yield Sht2xI2cDevice(I2cConnection(i2c_transceiver))
 
 
 @pytest.fixture
-def sht4x(bridge):
-    # Configure SensorBridge port 1 for SHT4x
-    bridge.set_i2c_frequency(SensorBridgePort.ONE, frequency=100e3)
-    bridge.set_supply_voltage(SensorBridgePort.ONE, voltage=3.3)
-    bridge.switch_supply_on(SensorBridgePort.ONE)
-
-    # Create SHT4x device
-    i2c_transceiver = SensorBridgeI2cProxy(bridge, port=SensorBridgePort.ONE)
-    sht4x = Sht4xI2cDevice(I2cConnection(i2c_transceiver))
+def sht3x(request):
+    with _i2c_transceiver(request, SimulatedSht3x()) as i2c_transceiver:
+        yield Sht3xI2cDevice(I2cConnection(i2c_transceiver))
 
-    yield sht4x
 
-    # make sure the channel is powered off after executing tests
-    bridge.switch_supply_off(SensorBridgePort.ONE)
+@pytest.fixture
+def sht4x(request):
+    with _i2c_transceiver(request, SimulatedSht4x()) as i2c_transceiver:
+        yield Sht4xI2cDevice(I2cConnection(i2c_transceiver))
 
 
 @pytest.fixture
-def sts4x(bridge):
-    # Configure SensorBridge port 1 for STS4x
-    bridge.set_i2c_frequency(SensorBridgePort.ONE, frequency=100e3)
-    bridge.set_supply_voltage(SensorBridgePort.ONE, voltage=3.3)
-    bridge.switch_supply_on(SensorBridgePort.ONE)
-
-    # Create STS4x device
-    i2c_transceiver = SensorBridgeI2cProxy(bridge, port=SensorBridgePort.ONE)
-    sts4x = Sts4xI2cDevice(I2cConnection(i2c_transceiver))
+def sts4x(request):
+    with _i2c_transceiver(request, SimulatedSts4x()) as i2c_transceiver:
+        yield Sts4xI2cDevice(I2cConnection(i2c_transceiver))
 
-    yield sts4x
 
-    # make sure the channel is powered off after executing tests
-    bridge.switch_supply_off(SensorBridgePort.ONE)
+@pytest.fixture
+def shtc3(request):
+    with _i2c_transceiver(request, SimulatedShtc3()) as i2c_transceiver:
+        yield Shtc3I2cDevice(I2cConnection(i2c_transceiver))
 
 
 @pytest.fixture
-def shtc3(bridge):
-    # Configure SensorBridge port 1 for SHTC3
-    bridge.set_i2c_frequency(SensorBridgePort.ONE, frequency=100e3)
-    bridge.set_supply_voltage(SensorBridgePort.ONE, voltage=3.3)
-    bridge.switch_supply_on(SensorBridgePort.ONE)
-
-    # Create SHTC3 device
-    i2c_transceiver = SensorBridgeI2cProxy(bridge, port=SensorBridgePort.ONE)
-    shtc3 = Shtc3I2cDevice(I2cConnection(i2c_transceiver))
+def simulated_sht4x():
+    """
+    A simulated SHT4x (independent of the '--simulated' argument), returned
+    as tuple of the simulated device, the transceiver and the device driver.
+    The transceiver injects faults once their rates are set.
+    """
+    simulated = SimulatedSht4x()
+    transceiver = FaultInjectingI2cTransceiver(
+        SimulatedI2cTransceiver([simulated]))
+    return simulated, transceiver, Sht4xI2cDevice(I2cConnection(transceiver))
 
-    yield shtc3
 
-    # make sure the channel is powered off after executing tests
-    bridge.switch_supply_off(SensorBridgePort.ONE)
+@pytest.fixture
+def run_coroutine():
+    """
+    Run a coroutine in a new event loop and return its result, like
+    ``asyncio.run()`` which requires Python 3.7.
+    """
+    import asyncio  # not available on Python 2
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
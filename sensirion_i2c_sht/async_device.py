@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver.errors import I2cNackError
+from .commands import get_write_phase, get_read_phase, get_raw_command
+from functools import partial
+from time import monotonic
+import asyncio
+import threading
+import weakref
+
+# Transfers on the same connection must not be executed concurrently by the
+# threads of the executor, thus they are serialized with one lock per
+# connection.
+_connection_locks = weakref.WeakKeyDictionary()
+_connection_locks_lock = threading.Lock()
+
+
+def _get_connection_lock(connection):
+    with _connection_locks_lock:
+        lock = _connection_locks.get(connection)
+        if lock is None:
+            lock = threading.Lock()
+            _connection_locks[connection] = lock
+        return lock
+
+
+def _locked_execute(connection, slave_address, command):
+    with _get_connection_lock(connection):
+        return connection.execute(slave_address, command,
+                                  wait_post_process=False)
+
+
+async def _sleep_until(timestamp):
+    remaining = timestamp - monotonic()
+    if remaining > 0.:
+        await asyncio.sleep(remaining)
+
+
+class AsyncShtI2cDeviceBase(object):
+    """
+    Base class for the asyncio variants of the I²C devices of this package.
+
+    An asynchronous device wraps the corresponding blocking device and
+    provides the same methods as coroutines. Instead of blocking in
+    :py:func:`time.sleep`, they await :py:func:`asyncio.sleep` for the
+    measurement duration and post processing time of the executed commands,
+    so a single event loop can serve many devices concurrently.
+
+    The bus transfers themselves are executed in an executor (see
+    :py:meth:`asyncio.loop.run_in_executor`), whereas transfers on the same
+    connection are serialized. If the connection provides a coroutine method
+    ``execute_async()`` with the same signature as
+    :py:meth:`~sensirion_i2c_driver.connection.I2cConnection.execute`, it is
+    awaited instead.
+
+    .. note:: The :py:attr:`~sensirion_i2c_sht.device.ShtI2cDeviceBase.ready_polling`
+              and :py:attr:`~sensirion_i2c_sht.device.ShtI2cDeviceBase.poll_interval`
+              settings of the wrapped device are respected.
+    """  # noqa: E501
+
+    def __init__(self, device, executor=None):
+        """
+        Constructs a new asynchronous I²C device.
+
+        :param ~sensirion_i2c_sht.device.ShtI2cDeviceBase device:
+            The blocking device to wrap.
+        :param ~concurrent.futures.Executor executor:
+            The executor to run the bus transfers in. If None, the default
+            executor of the event loop is used.
+        """
+        super(AsyncShtI2cDeviceBase, self).__init__()
+        self._device = device
+        self._executor = executor
+
+    @property
+    def device(self):
+        """
+        The wrapped blocking device.
+
+        :type: ~sensirion_i2c_sht.device.ShtI2cDeviceBase
+        """
+        return self._device
+
+    @property
+    def connection(self):
+        """
+        Get the used I²C connection.
+
+        :type: ~sensirion_i2c_driver.connection.I2cConnection
+        """
+        return self._device.connection
+
+    @property
+    def slave_address(self):
+        """
+        Get the I²C slave address.
+
+        :type: byte
+        """
+        return self._device.slave_address
+
+    async def execute(self, command):
+        """
+        Execute an I²C command on this device.
+
+        :param ~sensirion_i2c_driver.command.I2cCommand command:
+            The command to be executed.
+        :return:
+            The interpreted response of the executed command.
+        :rtype:
+            Depends on the executed command.
+        """
+        # Any command sent to the device makes a pending measurement of the
+        # wrapped device unavailable.
+        self._device._pending_measurement = None
+        if (command.rx_length is not None) and (command.read_delay > 0.):
+            await self._transfer(get_write_phase(command))
+            result = await self._read_phase(command, monotonic())
+        else:
+            result = await self._transfer(command)
+        if command.post_processing_time > 0.:
+            await asyncio.sleep(command.post_processing_time)
+        return result
+
+    async def _execute_raw(self, command, buffer=None, offset=0):
+        """
+        Execute a measurement command and return its raw ticks, or store them
+        into a buffer. See
+        :py:meth:`~sensirion_i2c_sht.device.ShtI2cDeviceBase._execute_raw`.
+        """
+        self._device._check_buffer(buffer)
+        return self._device._store_ticks(
+            await self.execute(get_raw_command(command)), buffer, offset)
+
+    async def _read_phase(self, command, start_time):
+        """
+        Read the result of a command which was sent at the given time, with
+        ready polling if it is enabled.
+        """
+        read_command = get_read_phase(command)
+        ready_time = start_time + command.read_delay
+        typical_read_delay = getattr(command, 'typical_read_delay', None)
+        if self._device.ready_polling and (typical_read_delay is not None) \
+                and (not self.connection.is_multi_channel):
+            await _sleep_until(start_time + typical_read_delay)
+            while True:
+                try:
+                    return await self._transfer(read_command)
+                except I2cNackError:
+                    remaining = ready_time - monotonic()
+                    if remaining <= 0.:
+                        raise
+                    await asyncio.sleep(
+                        min(self._device.poll_interval, remaining))
+        await _sleep_until(ready_time)
+        return await self._transfer(read_command)
+
+    async def _transfer(self, command):
+        """
+        Execute a single bus transfer without waiting for the post processing
+        time.
+        """
+        execute_async = getattr(self.connection, 'execute_async', None)
+        if execute_async is not None:
+            return await execute_async(self.slave_address, command,
+                                       wait_post_process=False)
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(_locked_execute, self.connection,
+                                    self.slave_address, command))
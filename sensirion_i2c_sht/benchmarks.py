@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+"""
+Benchmarks of the driver hot paths of every family, executed with a
+:py:class:`NullI2cTransceiver`, i.e. measuring only the cost of this package
+(command construction, CRC checks, response interpretation and objects,
+multi-channel results and bulk decoding), without any bus communication.
+
+.. sourcecode:: bash
+
+    python -m sensirion_i2c_sht.benchmarks --output results.json
+    python -m sensirion_i2c_sht.benchmarks --compare results.json
+
+For every benchmark, the calls per second, the time per sample (a call of a
+multi-channel or bulk benchmark processes many samples) and the memory
+allocated per sample (peak traced by :py:mod:`tracemalloc`, Python 3 only)
+are reported.
+"""
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver import I2cConnection
+from sensirion_i2c_driver.transceiver_v1 import I2cTransceiverV1
+from .commands import shared_command
+from .crc import CRC8_INIT_FF, CRC8_INIT_00
+from .conversion import numpy
+from .frames import decode_frames
+from .version import version
+from .sht2x import Sht2xI2cDevice, Sht2xTemperature
+from .sht2x.commands import Sht2xI2cMeasureTemperature
+from .sht3x import Sht3xI2cDevice, Sht3xTemperature
+from .sht3x.commands import Sht3xI2cCmdMeasHighRes
+from .sht4x import Sht4xI2cDevice, Sht4xTemperature
+from .sht4x.commands import Sht4xI2cCmdMeasHighRes
+from .sts4x import Sts4xI2cDevice, Sts4xTemperature
+from .sts4x.commands import Sts4xI2cCmdMeasHighRes
+from .shtc3 import Shtc3I2cDevice, Shtc3Temperature
+from .shtc3.commands import Shtc3I2cCmdMeasureNormalModeTicks
+from .shtc3 import conversion as shtc3_conversion
+import argparse
+import json
+import platform
+import time
+
+try:
+    from time import perf_counter
+except ImportError:  # Python 2
+    from time import time as perf_counter
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+#: Device class, measurement command class, response class, CRC, words per
+#: measurement frame and measurement method name of every family.
+FAMILIES = {
+    'sht2x': (Sht2xI2cDevice, Sht2xI2cMeasureTemperature, Sht2xTemperature,
+              CRC8_INIT_00, 1, 'single_shot_measurement'),
+    'sht3x': (Sht3xI2cDevice, Sht3xI2cCmdMeasHighRes, Sht3xTemperature,
+              CRC8_INIT_FF, 2, 'single_shot_measurement'),
+    'sht4x': (Sht4xI2cDevice, Sht4xI2cCmdMeasHighRes, Sht4xTemperature,
+              CRC8_INIT_FF, 2, 'single_shot_measurement'),
+    'sts4x': (Sts4xI2cDevice, Sts4xI2cCmdMeasHighRes, Sts4xTemperature,
+              CRC8_INIT_FF, 1, 'single_shot_measurement'),
+    'shtc3': (Shtc3I2cDevice, Shtc3I2cCmdMeasureNormalModeTicks,
+              Shtc3Temperature, CRC8_INIT_FF, 2, 'measure'),
+}
+
+#: Names of all benchmarks executed for every family.
+BENCHMARKS = ('command', 'crc', 'interpret', 'response', 'single_shot',
+              'single_shot_raw', 'multi_channel', 'bulk_decode')
+
+
+def _encode(words, crc):
+    data = bytearray()
+    for word in words:
+        data += bytearray([word >> 8, word & 0xFF])
+        data.append(crc(data[-2:]))
+    return bytes(data)
+
+
+class NullI2cTransceiver(I2cTransceiverV1):
+    """
+    I²C transceiver which does not communicate at all, but immediately
+    responds to every read with valid CRC protected data (and ignores read
+    delays). It allows measuring the overhead of the driver itself.
+    """
+
+    def __init__(self, crc=CRC8_INIT_FF, channel_count=None, word=0x6666):
+        """
+        Constructs a new null transceiver.
+
+        :param ~sensirion_i2c_sht.crc.Crc8 crc:
+            The CRC of the response data.
+        :param int channel_count:
+            The number of channels to simulate a multi-channel transceiver,
+            or None for a single-channel transceiver.
+        :param int word:
+            The 16-bit word which is repeated in every response.
+        """
+        super(NullI2cTransceiver, self).__init__()
+        self._channel_count = channel_count
+        self._data = _encode([word] * 32, crc)
+
+    @property
+    def description(self):
+        return "Null I2C transceiver"
+
+    @property
+    def channel_count(self):
+        return self._channel_count
+
+    def transceive(self, slave_address, tx_data, rx_length, read_delay,
+                   timeout):
+        result = (self.STATUS_OK, None, self._data[:rx_length or 0])
+        if self._channel_count is None:
+            return result
+        return [result] * self._channel_count
+
+
+def _benchmarks(family, channels, frames):
+    """
+    Create the benchmark functions of a family.
+
+    :return:
+        For every benchmark name, the function to call and the number of
+        samples processed by a call.
+    :rtype: dict
+    """
+    device_class, command_class, response_class, crc, words, method = \
+        FAMILIES[family]
+    command = command_class()
+    frame = _encode([0x6666] * words, crc)
+    bulk = frame * frames
+    device = device_class(I2cConnection(NullI2cTransceiver(crc)))
+    multi_channel_device = device_class(I2cConnection(
+        NullI2cTransceiver(crc, channel_count=channels)))
+    if family != 'shtc3':
+        single_shot = getattr(device, method)
+        single_shot_raw = getattr(device, method + '_raw')
+        multi_channel = getattr(multi_channel_device,
+                                method + '_multi_channel')
+    else:
+        # without wake-up and sleep, whose post processing time would
+        # dominate the benchmark
+        shared = shared_command(command_class)
+
+        def single_shot():
+            return device.execute(shared)
+
+        def single_shot_raw():
+            return device._execute_raw(shared)
+
+        def multi_channel():
+            return multi_channel_device._execute_multi_channel(
+                shared, shtc3_conversion)
+
+    return {
+        'command': (command_class, 1),
+        'crc': (lambda: crc.verify_words(frame), 1),
+        'interpret': (lambda: command.interpret_response(frame), 1),
+        'response': (lambda: response_class(0x6666), 1),
+        'single_shot': (single_shot, 1),
+        'single_shot_raw': (single_shot_raw, 1),
+        'multi_channel': (multi_channel, channels),
+        'bulk_decode': (lambda: decode_frames(bulk, words, crc), frames),
+    }
+
+
+def _allocated_bytes(function):
+    """
+    Get the peak memory allocated by a call of a function, or None if
+    tracemalloc is not available.
+    """
+    if tracemalloc is None:
+        return None
+    function()  # warm up caches
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        function()
+        return tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+
+def measure(function, samples_per_call=1, min_time=0.2):
+    """
+    Measure the performance of a function.
+
+    :param callable function:
+        The function to call without arguments.
+    :param int samples_per_call:
+        The number of samples processed by one call.
+    :param float min_time:
+        Minimum measurement duration in Seconds. The number of calls is
+        doubled until a measurement takes at least this time.
+    :return:
+        The number of calls, calls per second, nanoseconds per sample and
+        allocated bytes per sample.
+    :rtype: dict
+    """
+    calls = 1
+    while True:
+        start = perf_counter()
+        for _ in range(calls):
+            function()
+        elapsed = perf_counter() - start
+        if elapsed >= min_time:
+            break
+        calls *= 2
+    allocated = _allocated_bytes(function)
+    return dict(
+        calls=calls,
+        calls_per_second=calls / elapsed,
+        ns_per_sample=elapsed * 1e9 / (calls * samples_per_call),
+        alloc_bytes_per_sample=None if allocated is None
+        else allocated / samples_per_call,
+    )
+
+
+def run(families=None, benchmarks=None, min_time=0.2, channels=16,
+        frames=1000):
+    """
+    Run benchmarks.
+
+    :param list families:
+        The families to benchmark (keys of :py:data:`FAMILIES`), or None for
+        all.
+    :param list benchmarks:
+        The benchmarks to run (items of :py:data:`BENCHMARKS`), or None for
+        all.
+    :param float min_time:
+        Minimum duration of every benchmark in Seconds.
+    :param int channels:
+        Number of channels of the multi-channel benchmark.
+    :param int frames:
+        Number of frames of the bulk decode benchmark.
+    :return:
+        The results, with some information about the environment.
+    :rtype: dict
+    """
+    results = []
+    for family in families or sorted(FAMILIES):
+        functions = _benchmarks(family, channels, frames)
+        for benchmark in benchmarks or BENCHMARKS:
+            function, samples_per_call = functions[benchmark]
+            result = measure(function, samples_per_call, min_time)
+            result.update(family=family, benchmark=benchmark,
+                          samples_per_call=samples_per_call)
+            results.append(result)
+    return dict(
+        version=version,
+        python=platform.python_version(),
+        implementation=platform.python_implementation(),
+        platform=platform.platform(),
+        numpy=numpy is not None,
+        time=time.time(),
+        results=results,
+    )
+
+
+def _format(results, baseline=None):
+    """
+    Format results as a table, optionally with the change of the time per
+    sample relative to a baseline.
+    """
+    reference = {}
+    for result in (baseline or {}).get('results', []):
+        reference[(result['family'], result['benchmark'])] = \
+            result['ns_per_sample']
+    lines = ['{:<7} {:<16} {:>12} {:>12} {:>12} {:>8}'.format(
+        'family', 'benchmark', 'calls/s', 'ns/sample', 'bytes/sample',
+        'change')]
+    for result in results['results']:
+        allocated = result['alloc_bytes_per_sample']
+        old = reference.get((result['family'], result['benchmark']))
+        lines.append('{:<7} {:<16} {:>12.0f} {:>12.1f} {:>12} {:>8}'.format(
+            result['family'], result['benchmark'],
+            result['calls_per_second'], result['ns_per_sample'],
+            '-' if allocated is None else '{:.1f}'.format(allocated),
+            '-' if not old else '{:+.0%}'.format(
+                result['ns_per_sample'] / old - 1.)))
+    return '\n'.join(lines)
+
+
+def main(args=None):
+    """
+    Run the benchmarks from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description='Benchmark the driver hot paths of every family.')
+    parser.add_argument('--family', action='append', choices=sorted(FAMILIES),
+                        help='Family to benchmark (default: all)')
+    parser.add_argument('--benchmark', action='append', choices=BENCHMARKS,
+                        help='Benchmark to run (default: all)')
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help='Minimum duration per benchmark in Seconds')
+    parser.add_argument('--channels', type=int, default=16,
+                        help='Channels of the multi-channel benchmark')
+    parser.add_argument('--frames', type=int, default=1000,
+                        help='Frames of the bulk decode benchmark')
+    parser.add_argument('--output', help='Write the results to a JSON file')
+    parser.add_argument('--compare', help='JSON file of previous results to '
+                                          'compare with')
+    args = parser.parse_args(args)
+    results = run(args.family, args.benchmark, args.min_time, args.channels,
+                  args.frames)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print(_format(results, baseline))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    return results
+
+
+if __name__ == '__main__':
+    main()
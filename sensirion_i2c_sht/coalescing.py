@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+import threading
+
+try:
+    from time import monotonic
+except ImportError:  # Python 2
+    from time import time as monotonic
+
+
+class _Flight(object):
+    """
+    A measurement which is in progress, shared by all callers requesting it.
+    """
+
+    def __init__(self):
+        super(_Flight, self).__init__()
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class MeasurementCoalescer(object):
+    """
+    Shares measurements of a device between concurrent callers, e.g. the
+    threads of a gateway serving many clients:
+
+    - **Single flight**: Callers requesting a measurement while the same
+      measurement (same method and settings) is in progress wait for it and
+      get its result, instead of triggering another one.
+    - **Cache**: Callers requesting a measurement within :py:attr:`ttl`
+      after the same measurement finished get its result without accessing
+      the device.
+
+    .. sourcecode:: python
+
+        coalescer = MeasurementCoalescer(sht3x, ttl=0.1)
+        # in any number of threads:
+        temperature, humidity = coalescer.single_shot_measurement()
+
+    The measurements of the device are serialized, i.e. the device is never
+    accessed by several threads at once through the coalescer. Errors are
+    raised to all callers waiting for the failed measurement and are not
+    cached.
+    """
+
+    def __init__(self, device, ttl=0.):
+        """
+        Creates a coalescer.
+
+        :param ~sensirion_i2c_sht.device.ShtI2cDeviceBase device:
+            The device to measure with.
+        :param float ttl:
+            Seconds after the end of a measurement during which its result
+            is returned from the cache. 0 to share only running
+            measurements.
+        """
+        super(MeasurementCoalescer, self).__init__()
+        self._device = device
+        self.ttl = float(ttl)  #: Seconds during which results are cached.
+        self._lock = threading.Lock()
+        self._device_lock = threading.Lock()
+        self._flights = {}
+        self._cache = {}
+        #: Number of measurements performed on the device.
+        self.measurements = 0
+        #: Number of calls which waited for a running measurement.
+        self.coalesced = 0
+        #: Number of calls served from the cache.
+        self.hits = 0
+
+    @property
+    def device(self):
+        """
+        The device to measure with.
+
+        :type: ~sensirion_i2c_sht.device.ShtI2cDeviceBase
+        """
+        return self._device
+
+    def single_shot_measurement(self, **kwargs):
+        """
+        Get the result of a single shot measurement, see
+        :py:meth:`measure`.
+
+        :param kwargs:
+            Measurement settings, e.g. ``repeatability``.
+        :return: The result of ``single_shot_measurement()`` of the device.
+        """
+        return self.measure('single_shot_measurement', **kwargs)
+
+    def measure(self, method='single_shot_measurement', **kwargs):
+        """
+        Get the result of a measurement, which is either taken from the
+        cache, the result of a running measurement or the result of a new
+        measurement.
+
+        :param str method:
+            Name of the device method which performs the measurement and
+            returns its result. It must not have side effects apart from the
+            measurement, since it is not called for every caller.
+        :param kwargs:
+            Measurement settings which are passed to the method, e.g.
+            ``repeatability``. Only calls with equal settings share results.
+        :return: The measurement result.
+        :raises Exception: The error raised by the measurement.
+        """
+        key = (method, tuple(sorted(kwargs.items())))
+        with self._lock:
+            cached = self._cache.get(key)
+            if (cached is not None) and (monotonic() - cached[0] <= self.ttl):
+                self.hits += 1
+                return cached[1]
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.measurements += 1
+            else:
+                self.coalesced += 1
+        if leader:
+            return self._measure(key, flight, method, kwargs)
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.value
+
+    def invalidate(self):
+        """
+        Discard all cached results, e.g. after changing the device settings.
+        """
+        with self._lock:
+            self._cache.clear()
+
+    def _measure(self, key, flight, method, kwargs):
+        """
+        Perform a measurement and publish its result to the waiting callers.
+        """
+        succeeded = False
+        try:
+            with self._device_lock:
+                flight.value = getattr(self._device, method)(**kwargs)
+            succeeded = True
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            if not (succeeded or flight.error):
+                flight.error = RuntimeError('The measurement was aborted.')
+            with self._lock:
+                del self._flights[key]
+                if succeeded:
+                    self._cache[key] = (monotonic(), flight.value)
+            flight.done.set()
+        return flight.value
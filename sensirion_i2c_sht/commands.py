@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver import I2cCommand
+
+
+class ShtI2cCmdWritePhase(I2cCommand):
+    """
+    Command which only performs the write operation of another command, i.e.
+    it sends the command to the device without reading the response.
+
+    Together with :py:class:`ShtI2cCmdReadPhase` this allows splitting a
+    command into separate transfers, for example to do something else while
+    the device performs a measurement.
+    """
+    def __init__(self, command):
+        """
+        Constructs a new command.
+
+        :param ~sensirion_i2c_driver.command.I2cCommand command:
+            The command to take the TX data from.
+        """
+        super(ShtI2cCmdWritePhase, self).__init__(
+            tx_data=command.tx_data,
+            rx_length=None,
+            read_delay=0.,
+            timeout=0.,
+        )
+        self._command = command
+
+
+class ShtI2cCmdReadPhase(I2cCommand):
+    """
+    Command which only performs the read operation of another command, i.e.
+    it reads and interprets the response of a command which was sent before
+    with :py:class:`ShtI2cCmdWritePhase`.
+    """
+    def __init__(self, command):
+        """
+        Constructs a new command.
+
+        :param ~sensirion_i2c_driver.command.I2cCommand command:
+            The command to read the response of.
+        """
+        super(ShtI2cCmdReadPhase, self).__init__(
+            tx_data=None,
+            rx_length=command.rx_length,
+            read_delay=0.,
+            timeout=command.timeout,
+            post_processing_time=command.post_processing_time,
+        )
+        self._command = command
+
+    def interpret_response(self, data):
+        """
+        Converts the raw response from the device with the wrapped command.
+
+        :param bytes data:
+            Received raw bytes from the read operation.
+        :return:
+            The interpreted response of the wrapped command.
+        """
+        return self._command.interpret_response(data)
+
+
+class ShtI2cCmdRaw(I2cCommand):
+    """
+    Command which performs the same transfer as a measurement command, but
+    returns the raw ticks from its ``interpret_ticks()`` method instead of
+    response objects.
+    """
+    def __init__(self, command):
+        """
+        Constructs a new command.
+
+        :param ~sensirion_i2c_driver.command.I2cCommand command:
+            The measurement command to execute.
+        """
+        super(ShtI2cCmdRaw, self).__init__(
+            tx_data=command.tx_data,
+            rx_length=command.rx_length,
+            read_delay=command.read_delay,
+            timeout=command.timeout,
+            post_processing_time=command.post_processing_time,
+        )
+        self._command = command
+
+        #: Typical delay in Seconds between write and read operation
+        #: (float/None).
+        self.typical_read_delay = getattr(command, 'typical_read_delay', None)
+
+    def interpret_response(self, data):
+        """
+        Converts the raw response from the device with the wrapped command.
+
+        :param bytes data:
+            Received raw bytes from the read operation.
+        :return:
+            The ticks as returned by ``interpret_ticks()`` of the wrapped
+            command.
+        """
+        return self._command.interpret_ticks(data)
+
+
+class ShtI2cCmdTransfer(I2cCommand):
+    """
+    Command which performs the same transfer as another command, but returns
+    the received raw bytes without interpreting them. This allows measuring
+    the transfer separately from the interpretation of the response.
+    """
+    def __init__(self, command):
+        """
+        Constructs a new command.
+
+        :param ~sensirion_i2c_driver.command.I2cCommand command:
+            The command to perform the transfer of.
+        """
+        super(ShtI2cCmdTransfer, self).__init__(
+            tx_data=command.tx_data,
+            rx_length=command.rx_length,
+            read_delay=command.read_delay,
+            timeout=command.timeout,
+            post_processing_time=command.post_processing_time,
+        )
+        self._command = command
+
+    def interpret_response(self, data):
+        """
+        Returns the raw response unchanged.
+
+        :param bytes data:
+            Received raw bytes from the read operation.
+        :return: The received raw bytes.
+        :rtype: bytes
+        """
+        return data
+
+
+_shared_commands = {}
+
+
+def shared_command(command_class):
+    """
+    Get the shared instance of a command class whose constructor does not
+    take any arguments.
+
+    Commands are not modified when they are executed, so a single instance of
+    each such class can be used by all devices. This avoids building the
+    command and its TX data again for every execution.
+
+    :param type command_class:
+        The command class.
+    :return: The shared instance of the command class.
+    :rtype: ~sensirion_i2c_driver.command.I2cCommand
+    """
+    command = _shared_commands.get(command_class)
+    if command is None:
+        command = _shared_commands.setdefault(command_class, command_class())
+    return command
+
+
+def get_write_phase(command):
+    """
+    Get the :py:class:`ShtI2cCmdWritePhase` of a command. It is created
+    only once per command object.
+
+    :param ~sensirion_i2c_driver.command.I2cCommand command:
+        The command to get the write phase of.
+    :rtype: ShtI2cCmdWritePhase
+    """
+    phase = getattr(command, '_sht_write_phase', None)
+    if phase is None:
+        phase = ShtI2cCmdWritePhase(command)
+        command._sht_write_phase = phase
+    return phase
+
+
+def get_read_phase(command):
+    """
+    Get the :py:class:`ShtI2cCmdReadPhase` of a command. It is created only
+    once per command object.
+
+    :param ~sensirion_i2c_driver.command.I2cCommand command:
+        The command to get the read phase of.
+    :rtype: ShtI2cCmdReadPhase
+    """
+    phase = getattr(command, '_sht_read_phase', None)
+    if phase is None:
+        phase = ShtI2cCmdReadPhase(command)
+        command._sht_read_phase = phase
+    return phase
+
+
+def get_raw_command(command):
+    """
+    Get the :py:class:`ShtI2cCmdRaw` of a measurement command. It is created
+    only once per command object.
+
+    :param ~sensirion_i2c_driver.command.I2cCommand command:
+        The measurement command to get the raw variant of.
+    :rtype: ShtI2cCmdRaw
+    """
+    raw = getattr(command, '_sht_raw_command', None)
+    if raw is None:
+        raw = ShtI2cCmdRaw(command)
+        command._sht_raw_command = raw
+    return raw
+
+
+def get_transfer(command):
+    """
+    Get the :py:class:`ShtI2cCmdTransfer` of a command. It is created only
+    once per command object.
+
+    :param ~sensirion_i2c_driver.command.I2cCommand command:
+        The command to get the transfer of.
+    :rtype: ShtI2cCmdTransfer
+    """
+    transfer = getattr(command, '_sht_transfer', None)
+    if transfer is None:
+        transfer = ShtI2cCmdTransfer(command)
+        command._sht_transfer = transfer
+    return transfer
+
+
+def get_wrapped_command(command):
+    """
+    Get the command which is wrapped by the command classes of this module
+    (e.g. :py:class:`ShtI2cCmdRaw`), i.e. the command originally executed by
+    a device.
+
+    :param ~sensirion_i2c_driver.command.I2cCommand command:
+        The (possibly wrapping) command.
+    :return: The wrapped command, or the passed command if it is no wrapper.
+    :rtype: ~sensirion_i2c_driver.command.I2cCommand
+    """
+    while isinstance(command, (ShtI2cCmdWritePhase, ShtI2cCmdReadPhase,
+                               ShtI2cCmdRaw, ShtI2cCmdTransfer)):
+        command = command._command
+    return command
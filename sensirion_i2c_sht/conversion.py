@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from array import array
+
+try:
+    import numpy
+except ImportError:  # NumPy is an optional dependency
+    numpy = None
+
+
+def convert_ticks(ticks, formula):
+    """
+    Apply a conversion formula to many raw ticks at once.
+
+    If NumPy is installed, the formula is evaluated on a whole
+    :py:class:`numpy.ndarray` of float64 at once. Otherwise it is applied to
+    each tick one after the other. Both ways evaluate exactly the same
+    operations as the response types of the sensor families, so the results
+    are identical to the values of the corresponding response objects.
+
+    :param iterable ticks:
+        The raw ticks, e.g. a :py:class:`numpy.ndarray`, an
+        :py:class:`array.array` of type ``'H'`` or a list of int.
+    :param callable formula:
+        Function converting ticks to the physical value, which must work
+        both with a single number and with a NumPy array.
+    :return:
+        The converted values as a :py:class:`numpy.ndarray` if NumPy is
+        installed, otherwise as an :py:class:`array.array` of type ``'d'``.
+    :rtype: numpy.ndarray / array.array
+    """
+    if numpy is not None:
+        return formula(numpy.asarray(ticks, dtype=numpy.float64))
+    return array('d', [formula(t) for t in ticks])
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver.errors import I2cChecksumError
+
+
+class Crc8(object):
+    """
+    Table-driven CRC-8 calculator as used by all sensors of this package.
+
+    An instance can be called like a function to calculate the CRC of the
+    passed data, i.e. it can be used as a replacement for
+    :py:class:`~sensirion_i2c_driver.crc_calculator.CrcCalculator`. In
+    addition it provides methods to check and remove all CRCs of a received
+    buffer at once.
+    """
+
+    def __init__(self, polynomial, init_value):
+        """
+        Constructs a calculator object with the given CRC parameters.
+
+        :param int polynomial:
+            The polynomial of the CRC, without leading '1' (e.g. 0x31 for the
+            polynomial x^8 + x^5 + x^4 + 1).
+        :param int init_value:
+            Initialization value of the CRC.
+        """
+        super(Crc8, self).__init__()
+        self._init_value = init_value
+        self._word_table = None
+        self._table = bytearray(256)
+        for i in range(256):
+            crc = i
+            for _ in range(8):
+                if crc & 0x80:
+                    crc = ((crc << 1) ^ polynomial) & 0xFF
+                else:
+                    crc = (crc << 1) & 0xFF
+            self._table[i] = crc
+
+    def __call__(self, data):
+        """
+        Calculate the CRC of the given data.
+
+        :param iterable data:
+            The input data (iterable with 8-bit integers).
+        :return:
+            The calculated CRC.
+        :rtype:
+            int
+        """
+        table = self._table
+        crc = self._init_value
+        for value in bytearray(data):  # Python 2 compatibility
+            crc = table[crc ^ value]
+        return crc
+
+    @property
+    def word_table(self):
+        """
+        Table with the CRC of every 16-bit word, i.e. ``word_table[word]``
+        is the CRC of the two bytes of ``word`` (big endian). It is created
+        on first access.
+
+        :type: bytearray
+        """
+        if self._word_table is None:
+            table = self._table
+            init_value = self._init_value
+            self._word_table = bytearray(
+                table[table[init_value ^ (word >> 8)] ^ (word & 0xFF)]
+                for word in range(65536))
+        return self._word_table
+
+    def verify_words(self, data):
+        """
+        Validates the CRCs of data consisting of 16-bit words, each followed
+        by its CRC, and returns the data with all CRCs removed.
+
+        :param bytes data:
+            Received raw bytes from the read operation.
+        :return:
+            The received bytes, or None if there is no data received.
+        :rtype:
+            bytes or None
+        :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
+            If a received CRC was wrong.
+        """
+        data = bytearray(data)  # Python 2 compatibility
+        complete = len(data) - len(data) % 3
+        msb, lsb, crcs = data[0:complete:3], data[1:complete:3], \
+            data[2:complete:3]
+        table = self._table
+        init_value = self._init_value
+        for i in range(len(crcs)):
+            expected_crc = table[table[init_value ^ msb[i]] ^ lsb[i]]
+            if crcs[i] != expected_crc:
+                raise I2cChecksumError(crcs[i], expected_crc, data)
+        payload = bytearray(len(msb) * 2)
+        payload[0::2] = msb
+        payload[1::2] = lsb
+        payload += data[complete:]  # incomplete trailing word
+        return bytes(payload) if len(payload) else None
+
+    def verify_bytes(self, data):
+        """
+        Validates the CRCs of data consisting of bytes, each followed by its
+        CRC, and returns the data with all CRCs removed.
+
+        :param bytes data:
+            Received raw bytes from the read operation.
+        :return:
+            The received bytes (without CRCs).
+        :rtype:
+            list(int)
+        :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
+            If a received CRC was wrong.
+        """
+        data = bytearray(data)  # Python 2 compatibility
+        payload, crcs = data[0::2], data[1::2]
+        table = self._table
+        init_value = self._init_value
+        for i in range(len(crcs)):
+            expected_crc = table[init_value ^ payload[i]]
+            if crcs[i] != expected_crc:
+                raise I2cChecksumError(crcs[i], expected_crc, data)
+        return list(payload)
+
+
+#: CRC-8 with polynomial 0x31 and initialization value 0xFF, used by SHT3x,
+#: SHT4x, STS4x and SHTC3.
+CRC8_INIT_FF = Crc8(0x31, 0xFF)
+
+#: CRC-8 with polynomial 0x31 and initialization value 0x00, used by SHT2x.
+CRC8_INIT_00 = Crc8(0x31, 0x00)
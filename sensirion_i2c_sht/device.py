@@ -0,0 +1,666 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver import I2cDevice
+from sensirion_i2c_driver.errors import I2cError, I2cNackError
+from .commands import get_write_phase, get_read_phase, get_raw_command, \
+    get_transfer, get_wrapped_command
+from .instrumentation import Transaction
+from .multi_channel import MultiChannelResult
+import time
+
+try:
+    from time import monotonic
+except ImportError:  # Python 2
+    from time import time as monotonic
+
+
+class MeasurementHandle(object):
+    """
+    Handle of a measurement which was started with a ``start_measurement()``
+    method of a device, but not read yet.
+
+    A measurement consists of one or more stages, each of them being a
+    command which is sent to the device and whose result is read after the
+    measurement duration. For example the SHT2x measures temperature and
+    humidity one after the other. The properties :py:attr:`command`,
+    :py:attr:`start_time` and :py:attr:`ready_time` always refer to the
+    current stage.
+
+    All times are in Seconds, based on the same clock as
+    :py:func:`time.monotonic`.
+    """
+
+    def __init__(self, device, commands, start_time, finish=None):
+        """
+        Creates a handle for a started measurement.
+
+        :param ShtI2cDeviceBase device:
+            The device which performs the measurement.
+        :param list commands:
+            The commands of all measurement stages. The first one was already
+            sent to the device.
+        :param float start_time:
+            Time when the first command was sent to the device.
+        :param callable finish:
+            Called with the results of all stages (one argument per stage)
+            once the last stage has been read, returning the result of the
+            measurement. If None, the result of the (only) stage is returned.
+        """
+        super(MeasurementHandle, self).__init__()
+        self._device = device
+        self._commands = list(commands)
+        self._stage = 0
+        self._start_time = start_time
+        self._finish = finish
+        self._stage_results = []
+        self._done = False
+        self._result = None
+        self._transaction = None
+
+    @property
+    def command(self):
+        """
+        The command of the current measurement stage.
+
+        :type: ~sensirion_i2c_driver.command.I2cCommand
+        """
+        return self._commands[self._stage]
+
+    @property
+    def start_time(self):
+        """
+        Time when the current measurement stage was started.
+
+        :type: float
+        """
+        return self._start_time
+
+    @property
+    def ready_time(self):
+        """
+        Earliest time when the result of the current measurement stage is
+        guaranteed to be available, i.e. the start time plus the maximum
+        measurement duration.
+
+        :type: float
+        """
+        return self._start_time + self.command.read_delay
+
+    @property
+    def done(self):
+        """
+        Whether all measurement stages have been read.
+
+        :type: bool
+        """
+        return self._done
+
+    def is_ready(self):
+        """
+        Check whether the result of the current measurement stage is
+        guaranteed to be available.
+
+        :return: True if :py:attr:`ready_time` has passed.
+        :rtype: bool
+        """
+        return monotonic() >= self.ready_time
+
+    def wait(self):
+        """
+        Block until :py:attr:`ready_time` has passed.
+        """
+        remaining = self.ready_time - monotonic()
+        if remaining > 0.:
+            time.sleep(remaining)
+
+    def step(self):
+        """
+        Read the result of the current measurement stage, waiting until it is
+        available if needed, and start the next stage (if any).
+
+        :return: True if all stages have been read, False otherwise.
+        :rtype: bool
+        :raises RuntimeError:
+            If the device received another command in the meantime, i.e. the
+            result of this measurement is lost.
+        """
+        if self._done:
+            return True
+        if len(self._stage_results) < len(self._commands):
+            if self._device._pending_measurement is not self:
+                raise RuntimeError('The measurement result was discarded by '
+                                   'another command.')
+            try:
+                self._stage_results.append(self._device._read_phase(self))
+                if len(self._stage_results) < len(self._commands):
+                    self._stage += 1
+                    self._start_time = self._device._write_phase(
+                        self.command, self._transaction)
+                    return False
+            except Exception as e:
+                if self._transaction is not None:
+                    self._device._end_transaction(self._transaction, e)
+                    self._transaction = None
+                raise
+            self._device._pending_measurement = None
+            if self._transaction is not None:
+                self._device._end_transaction(self._transaction)
+                self._transaction = None
+        # All stages have been read. If finishing fails (e.g. sending the
+        # device to sleep), the handle stays pending with the stage results
+        # kept, so the next call only retries finishing.
+        if self._finish is not None:
+            try:
+                self._result = self._finish(*self._stage_results)
+            except Exception:
+                self._device._pending_measurement = self
+                raise
+            if self._device._pending_measurement is self:
+                self._device._pending_measurement = None
+        else:
+            self._result = self._stage_results[0]
+        self._done = True
+        return True
+
+    def result(self):
+        """
+        Read the measurement result from the device, waiting until it is
+        available if needed. The result is read only once, subsequent calls
+        return the same result.
+
+        :return: The result of the measurement.
+        :raises RuntimeError:
+            If the device received another command in the meantime, i.e. the
+            result of this measurement is lost.
+        """
+        while not self.step():
+            pass
+        return self._result
+
+
+class ShtI2cDeviceBase(I2cDevice):
+    """
+    Base class for the I²C devices of this package, providing the
+    functionality which is common to all sensor families.
+    """
+
+    #: Whether the sensor family supports the :py:attr:`pre_trigger` mode.
+    _pre_trigger_supported = False
+
+    def __init__(self, connection, slave_address):
+        """
+        Constructs a new I²C device.
+
+        :param ~sensirion_i2c_driver.connection.I2cConnection connection:
+            The I²C connection to use for communication.
+        :param byte slave_address:
+            The I²C slave address.
+        """
+        super(ShtI2cDeviceBase, self).__init__(connection, slave_address)
+        self._ready_polling = False
+        self._poll_interval = 0.001
+        self._pending_measurement = None
+        self._instrumentation = None
+        self._pre_trigger = False
+        self._max_age = 1.
+        self._pre_triggered = None
+        self._last_trigger_time = None
+
+    @property
+    def ready_polling(self):
+        """
+        Set this to True to read measurement results as soon as they are
+        available instead of always waiting for the maximum measurement
+        duration.
+
+        In this mode, the read header is first sent after the typical
+        measurement duration and then repeated every
+        :py:attr:`poll_interval` as long as the device does not acknowledge
+        it, i.e. is still measuring. If the device still does not acknowledge
+        after the maximum measurement duration, the
+        :py:class:`~sensirion_i2c_driver.errors.I2cNackError` is raised.
+
+        .. note:: Ready polling only applies to single-channel connections.
+                  On multi-channel connections the maximum measurement
+                  duration is always awaited.
+
+        :type: Bool
+        """
+        return self._ready_polling
+
+    @ready_polling.setter
+    def ready_polling(self, value):
+        self._ready_polling = value
+
+    @property
+    def poll_interval(self):
+        """
+        Interval (in Seconds) between two read attempts if
+        :py:attr:`ready_polling` is enabled. Defaults to 1ms.
+
+        :type: float
+        """
+        return self._poll_interval
+
+    @poll_interval.setter
+    def poll_interval(self, value):
+        self._poll_interval = float(value)
+
+    @property
+    def instrumentation(self):
+        """
+        Callback which is called with a
+        :py:class:`~sensirion_i2c_sht.instrumentation.Transaction` after
+        every command executed by this device, containing the timestamps of
+        all its phases (write, read delay, read, CRC check, ...). For example
+        a :py:class:`~sensirion_i2c_sht.instrumentation.TimingCollector` can
+        be used. None (default) disables the instrumentation.
+
+        .. note:: With instrumentation enabled, commands with a read delay
+                  are always sent and read in separate transfers (like with
+                  ``start_measurement()``), to measure the phases
+                  separately.
+
+        :type: callable/None
+        """
+        return self._instrumentation
+
+    @instrumentation.setter
+    def instrumentation(self, value):
+        self._instrumentation = value
+
+    @property
+    def pre_trigger(self):
+        """
+        Set this to True to hide the measurement duration of single shot
+        measurements: Right after reading a result, the next measurement is
+        triggered, so the next ``single_shot_measurement()`` (or
+        ``single_shot_measurement_raw()``) call only needs to read the
+        already finished result.
+
+        The returned result was thus measured when the previous call
+        returned (see :py:attr:`last_trigger_time`). If it is older than
+        :py:attr:`max_age`, or the measurement settings have changed, it is
+        discarded and a new measurement is performed instead. Any other
+        command waits until the pre-triggered measurement is finished, as
+        the device does not accept commands while measuring.
+
+        .. note:: Pre-triggering is only supported by SHT3x, SHT4x and STS4x
+                  and only applies to single-channel connections and to
+                  commands executed by the (synchronous) device itself.
+
+        :type: Bool
+        :raises ValueError:
+            If the sensor family does not support pre-triggering.
+        """
+        return self._pre_trigger
+
+    @pre_trigger.setter
+    def pre_trigger(self, value):
+        if value and not self._pre_trigger_supported:
+            raise ValueError('Pre-triggering is not supported by this '
+                             'device.')
+        self._pre_trigger = value
+
+    @property
+    def max_age(self):
+        """
+        Maximum age (in Seconds, since it was triggered) of a pre-triggered
+        measurement result to be returned if :py:attr:`pre_trigger` is
+        enabled. Defaults to 1s.
+
+        :type: float
+        """
+        return self._max_age
+
+    @max_age.setter
+    def max_age(self, value):
+        self._max_age = float(value)
+
+    @property
+    def last_trigger_time(self):
+        """
+        Time when the measurement returned by the last single shot
+        measurement in :py:attr:`pre_trigger` mode was triggered, based on
+        the same clock as :py:func:`time.monotonic`. None if no such
+        measurement was performed yet.
+
+        :type: float/None
+        """
+        return self._last_trigger_time
+
+    def execute(self, command):
+        """
+        Execute an I²C command on this device.
+
+        :param ~sensirion_i2c_driver.command.I2cCommand command:
+            The command to be executed.
+        :return:
+            The interpreted response of the executed command.
+        :rtype:
+            Depends on the executed command.
+        """
+        if self._pre_triggered is not None:
+            self._discard_pre_triggered()
+        # Any command sent to the device makes a pending measurement result
+        # unavailable.
+        self._pending_measurement = None
+        if self._instrumentation is not None:
+            return self._execute_instrumented(command)
+        typical_read_delay = getattr(command, 'typical_read_delay', None)
+        if self._ready_polling and (typical_read_delay is not None) and \
+                (not self.connection.is_multi_channel):
+            return self._start_measurement(command).result()
+        return super(ShtI2cDeviceBase, self).execute(command)
+
+    def _execute_instrumented(self, command):
+        """
+        Execute an I²C command on this device and pass the timing of its
+        phases to the instrumentation callback.
+        """
+        if (command.rx_length is not None) and (command.read_delay > 0.):
+            return self._start_measurement(command).result()
+        if command.rx_length is None:
+            phase = 'write'
+        elif command.tx_data is None:
+            phase = 'read'
+        else:
+            phase = 'transfer'
+        transaction = self._begin_transaction(command)
+        try:
+            result = self._transfer(command, transaction, phase)
+        except Exception as e:
+            self._end_transaction(transaction, e)
+            raise
+        self._end_transaction(transaction)
+        return result
+
+    def read_measurement(self):
+        """
+        Read the result of the measurement started with
+        ``start_measurement()``, waiting until it is available if needed.
+
+        :return:
+            The same result as the corresponding blocking measurement method
+            of the device.
+        :raises RuntimeError:
+            If no measurement was started.
+        """
+        if self._pending_measurement is None:
+            raise RuntimeError('No measurement was started.')
+        return self._pending_measurement.result()
+
+    def _execute_raw(self, command, buffer=None, offset=0):
+        """
+        Execute a measurement command and return its raw ticks, or store them
+        into a buffer.
+
+        :param ~sensirion_i2c_driver.command.I2cCommand command:
+            The measurement command to execute.
+        :param buffer:
+            See :py:meth:`_store_ticks`.
+        :param int offset:
+            See :py:meth:`_store_ticks`.
+        """
+        self._check_buffer(buffer)
+        return self._store_ticks(self._measure(get_raw_command(command)),
+                                 buffer, offset)
+
+    def _measure(self, command):
+        """
+        Execute a single shot measurement command. In :py:attr:`pre_trigger`
+        mode, the result of the measurement triggered by the previous call is
+        read instead (if it is still valid) and the next measurement is
+        triggered.
+
+        :param ~sensirion_i2c_driver.command.I2cCommand command:
+            The measurement command to execute.
+        :return: The interpreted response of the command.
+        """
+        if (not self._pre_trigger) or self.connection.is_multi_channel or \
+                (getattr(command, 'typical_read_delay', None) is None):
+            return self.execute(command)
+        handle = self._pre_triggered
+        self._pre_triggered = None
+        if (handle is None) or (handle is not self._pending_measurement) or \
+                (handle.command is not command) or \
+                (monotonic() - handle.start_time > self._max_age):
+            if handle is not None:
+                self._pre_triggered = handle
+                self._discard_pre_triggered()
+            handle = self._start_measurement(command)
+        result = handle.result()
+        self._last_trigger_time = handle.start_time
+        try:
+            self._pre_triggered = self._start_measurement(command)
+        except I2cError:
+            pass  # the next call triggers a new measurement
+        return result
+
+    def _discard_pre_triggered(self):
+        """
+        Discard the pre-triggered measurement, waiting until the device has
+        finished it if needed.
+        """
+        handle = self._pre_triggered
+        self._pre_triggered = None
+        if handle is self._pending_measurement:
+            self._pending_measurement = None
+            handle.wait()
+
+    def _execute_multi_channel(self, command, conversion):
+        """
+        Execute a measurement command on all channels and return the ticks
+        and converted values of all channels as columns.
+
+        :param ~sensirion_i2c_driver.command.I2cCommand command:
+            The measurement command to execute.
+        :param module conversion:
+            The conversion module of the sensor family.
+        :rtype: ~sensirion_i2c_sht.multi_channel.MultiChannelResult
+        """
+        return MultiChannelResult(
+            self._execute_all_channels(get_raw_command(command)), conversion)
+
+    def _execute_all_channels(self, command):
+        """
+        Execute a command and return a list containing the response or the
+        raised :py:class:`~sensirion_i2c_driver.errors.I2cError` of every
+        channel. On single-channel connections, the list has one item.
+        """
+        try:
+            result = self.execute(command)
+        except I2cError as e:
+            return [e]
+        return result if self.connection.is_multi_channel else [result]
+
+    def _check_buffer(self, buffer):
+        """
+        Check if storing ticks into a buffer is possible before starting a
+        measurement.
+        """
+        if (buffer is not None) and self.connection.is_multi_channel:
+            raise ValueError('Storing ticks into a buffer is not supported '
+                             'on multi-channel connections.')
+
+    def _store_ticks(self, ticks, buffer, offset):
+        """
+        Store the ticks of a measurement into a buffer.
+
+        :param int/tuple ticks:
+            The ticks to store.
+        :param buffer:
+            Writable sequence to store the ticks into, e.g. an
+            :py:class:`array.array` of type ``'H'``. If None, the ticks are
+            returned instead.
+        :param int offset:
+            Index of the buffer where to store the first value.
+        :return:
+            The ticks if no buffer is passed, otherwise the index following
+            the stored values.
+        """
+        if buffer is None:
+            return ticks
+        if not isinstance(ticks, tuple):
+            ticks = (ticks,)
+        for i, value in enumerate(ticks):
+            buffer[offset + i] = value
+        return offset + len(ticks)
+
+    def _start_measurement(self, command, next_commands=(), finish=None):
+        """
+        Send a measurement command to the device without reading its result.
+
+        :param ~sensirion_i2c_driver.command.I2cCommand command:
+            The measurement command to send.
+        :param list next_commands:
+            Commands of further measurement stages, which are sent one after
+            the other as soon as the result of the previous stage was read.
+        :param callable finish:
+            See :py:class:`MeasurementHandle`.
+        :return: The handle of the started measurement.
+        :rtype: MeasurementHandle
+        """
+        if self._pre_triggered is not None:
+            self._discard_pre_triggered()
+        transaction = self._begin_transaction(command)
+        try:
+            start_time = self._write_phase(command, transaction)
+        except Exception as e:
+            if transaction is not None:
+                self._end_transaction(transaction, e)
+            raise
+        handle = MeasurementHandle(self, [command] + list(next_commands),
+                                   start_time, finish)
+        handle._transaction = transaction
+        self._pending_measurement = handle
+        return handle
+
+    def _write_phase(self, command, transaction=None):
+        """
+        Send a command to the device without reading its response.
+
+        :param ~sensirion_i2c_driver.command.I2cCommand command:
+            The command to send.
+        :param ~sensirion_i2c_sht.instrumentation.Transaction transaction:
+            The transaction to record the phase in, or None.
+        :return: Time when the command was sent.
+        :rtype: float
+        """
+        self._transfer(get_write_phase(command), transaction, 'write',
+                       wait_post_process=False)
+        return monotonic()
+
+    def _read_phase(self, handle):
+        """
+        Read the result of the current stage of a started measurement, with
+        ready polling if it is enabled.
+        """
+        command = handle.command
+        transaction = handle._transaction
+        read_command = get_read_phase(command)
+        typical_read_delay = getattr(command, 'typical_read_delay', None)
+        if self._ready_polling and (typical_read_delay is not None) and \
+                (not self.connection.is_multi_channel):
+            self._read_delay(
+                handle.start_time + typical_read_delay - monotonic(),
+                transaction)
+            while True:
+                try:
+                    return self._transfer(read_command, transaction, 'read')
+                except I2cNackError:
+                    remaining = handle.ready_time - monotonic()
+                    if remaining <= 0.:
+                        raise
+                    self._read_delay(min(self._poll_interval, remaining),
+                                     transaction)
+        self._read_delay(handle.ready_time - monotonic(), transaction)
+        return self._transfer(read_command, transaction, 'read')
+
+    def _read_delay(self, duration, transaction):
+        """
+        Wait for a measurement result and record the phase in a transaction
+        (if not None).
+        """
+        if duration > 0.:
+            start = monotonic()
+            time.sleep(duration)
+            if transaction is not None:
+                transaction.add('read_delay', start, monotonic())
+
+    def _transfer(self, command, transaction, phase, wait_post_process=True):
+        """
+        Execute a command on the connection. If a transaction is passed, the
+        timing of the transfer, the post processing and the interpretation of
+        the response are recorded separately.
+
+        :param ~sensirion_i2c_driver.command.I2cCommand command:
+            The command to execute.
+        :param ~sensirion_i2c_sht.instrumentation.Transaction transaction:
+            The transaction to record the phases in, or None.
+        :param str phase:
+            Name of the phase of the transfer.
+        :param bool wait_post_process:
+            Whether to wait for the post processing time of the command.
+        :return: The interpreted response of the command.
+        """
+        if transaction is None:
+            return self.connection.execute(self.slave_address, command,
+                                           wait_post_process)
+        start = monotonic()
+        try:
+            data = self.connection.execute(
+                self.slave_address,
+                command if command.rx_length is None else get_transfer(command),
+                wait_post_process=False)
+        finally:
+            transaction.add(phase, start, monotonic())
+        if wait_post_process and (command.post_processing_time > 0.):
+            start = monotonic()
+            time.sleep(command.post_processing_time)
+            transaction.add('post_processing', start, monotonic())
+        if command.rx_length is None:
+            return data
+        multi_channel = self.connection.is_multi_channel
+        channels = data if multi_channel else [data]
+        start = monotonic()
+        results = [_interpret(command, channel) for channel in channels]
+        transaction.add('interpret', start, monotonic())
+        if multi_channel:
+            return results
+        if isinstance(results[0], Exception):
+            raise results[0]
+        return results[0]
+
+    def _begin_transaction(self, command):
+        """
+        Create the transaction of a command, or return None if the
+        instrumentation is disabled.
+        """
+        if self._instrumentation is None:
+            return None
+        return Transaction(get_wrapped_command(command), self.slave_address)
+
+    def _end_transaction(self, transaction, error=None):
+        """
+        Pass a completed transaction to the instrumentation callback.
+        """
+        transaction.error = error
+        callback = self._instrumentation
+        if callback is not None:
+            callback(transaction)
+
+
+def _interpret(command, data):
+    """
+    Interpret the data received on a channel, returning either the response
+    or the raised exception.
+    """
+    if isinstance(data, Exception):
+        return data
+    try:
+        return command.interpret_response(data)
+    except Exception as e:
+        return e
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver.errors import I2cChecksumError
+from .crc import CRC8_INIT_FF
+from array import array
+import sys
+
+try:
+    import numpy
+except ImportError:  # NumPy is an optional dependency
+    numpy = None
+
+
+def decode_frames(data, words_per_frame=2, crc=CRC8_INIT_FF):
+    """
+    Decode many concatenated measurement frames at once, e.g. as received
+    from a multi-channel transceiver or read from a recorded log.
+
+    Each frame consists of ``words_per_frame`` 16-bit words, each followed by
+    its CRC, i.e. it has the same format as the response of a measurement
+    command. All CRCs are validated.
+
+    .. sourcecode:: python
+
+        # SHT3x/SHT4x/SHTC3 frames: temperature and humidity
+        temperature_ticks, humidity_ticks = decode_frames(data)
+        degrees_celsius = ticks_to_degrees_celsius(temperature_ticks)
+
+        # SHT2x frames: a single word with another CRC
+        ticks, = decode_frames(data, 1, CRC8_INIT_00)
+
+    :param bytes-like data:
+        The concatenated frames, e.g. :py:class:`bytes` or
+        :py:class:`memoryview`. With NumPy, the data is not copied.
+    :param int words_per_frame:
+        Number of words per frame, e.g. 2 for temperature and humidity.
+    :param ~sensirion_i2c_sht.crc.Crc8 crc:
+        The CRC used by the sensor.
+    :return:
+        One array of ticks per word of the frame (e.g. temperature ticks and
+        humidity ticks), as :py:class:`numpy.ndarray` of uint16 if NumPy is
+        installed, otherwise as :py:class:`array.array` of type ``'H'``.
+    :rtype: tuple
+    :raise ValueError:
+        If the data length is not a multiple of the frame length.
+    :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
+        If any received CRC is wrong.
+    """
+    columns, valid = _decode(data, words_per_frame, crc)
+    if valid is not None:
+        index = [i for i, ok in enumerate(valid) if not ok][0]
+        word = columns[index % words_per_frame][index // words_per_frame]
+        received_crc = bytearray(data)[index * 3 + 2]
+        raise I2cChecksumError(received_crc, crc.word_table[word], data)
+    return columns
+
+
+def decode_frames_masked(data, words_per_frame=2, crc=CRC8_INIT_FF):
+    """
+    Same as :py:func:`decode_frames`, but instead of raising an exception
+    if a CRC is wrong, the validity of every frame is returned. This allows
+    to keep all valid frames of a log containing some corrupted frames.
+
+    :return:
+        The tick arrays as returned by :py:func:`decode_frames` (also
+        containing the ticks of invalid frames), and a sequence of bool
+        telling for every frame whether all of its CRCs are correct (a
+        :py:class:`numpy.ndarray` if NumPy is installed, otherwise a list).
+    :rtype: tuple
+    :raise ValueError:
+        If the data length is not a multiple of the frame length.
+    """
+    columns, valid = _decode(data, words_per_frame, crc)
+    frame_count = len(columns[0])
+    if valid is None:
+        if numpy is not None:
+            return columns, numpy.ones(frame_count, dtype=bool)
+        return columns, [True] * frame_count
+    if numpy is not None:
+        return columns, valid.reshape(-1, words_per_frame).all(axis=1)
+    return columns, [all(valid[i:i + words_per_frame])
+                     for i in range(0, len(valid), words_per_frame)]
+
+
+def _decode(data, words_per_frame, crc):
+    """
+    Split frames into tick columns and check their CRCs.
+
+    :return:
+        The tick columns, and the validity of every word (or None if all CRCs
+        are correct).
+    """
+    if len(data) % (3 * words_per_frame) != 0:
+        raise ValueError('The data length is not a multiple of the frame '
+                         'length.')
+    if numpy is not None:
+        raw = numpy.frombuffer(data, dtype=numpy.uint8).reshape(-1, 3)
+        words = (raw[:, 0].astype(numpy.uint16) << 8) | raw[:, 1]
+        table = numpy.frombuffer(crc.word_table, dtype=numpy.uint8)
+        valid = table[words] == raw[:, 2]
+        columns = words.reshape(-1, words_per_frame).T
+        return tuple(columns), (None if valid.all() else valid)
+    data = bytearray(data)  # Python 2 compatibility
+    payload = bytearray(len(data) // 3 * 2)
+    payload[0::2] = data[0::3]
+    payload[1::2] = data[1::3]
+    words = array('H', bytes(payload))
+    if sys.byteorder == 'little':
+        words.byteswap()
+    expected = bytearray(map(crc.word_table.__getitem__, words))
+    received = data[2::3]
+    columns = tuple(words[i::words_per_frame] for i in range(words_per_frame))
+    if expected == received:
+        return columns, None
+    return columns, [e == r for e, r in zip(expected, received)]
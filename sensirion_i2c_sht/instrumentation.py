@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from contextlib import contextmanager
+from collections import deque
+
+#: Names of all phases of a transaction, in the order they occur.
+PHASES = ('write', 'read_delay', 'read', 'transfer', 'post_processing',
+          'interpret')
+
+
+class Transaction(object):
+    """
+    Timing of all phases of a command executed by a device, which is passed
+    to the :py:attr:`~sensirion_i2c_sht.device.ShtI2cDeviceBase.instrumentation`
+    callback of the device once the command is completed (or failed).
+
+    The phases are:
+
+    - ``write``: Sending the command to the device.
+    - ``read_delay``: Waiting until the response is available, i.e. the
+      measurement duration. With ready polling enabled, there is one such
+      phase before every read attempt.
+    - ``read``: Reading the response from the device. With ready polling
+      enabled, there is one such phase for every read attempt.
+    - ``transfer``: Sending the command and reading the response in a single
+      transfer, for commands without read delay (e.g. with clock stretching).
+    - ``post_processing``: Waiting until the device is ready for the next
+      command.
+    - ``interpret``: Validating the CRCs of the received data and
+      converting it to the response objects.
+
+    Measurements started with ``start_measurement()`` are a single
+    transaction from sending the command until the result is read, containing
+    the phases of all measurement stages (e.g. temperature and humidity of
+    the SHT2x).
+
+    All times are in Seconds, based on the same clock as
+    :py:func:`time.monotonic`.
+    """  # noqa: E501
+
+    def __init__(self, command, slave_address):
+        """
+        Creates a transaction without phases.
+
+        :param ~sensirion_i2c_driver.command.I2cCommand command:
+            The executed command.
+        :param byte slave_address:
+            The I²C slave address of the device.
+        """
+        super(Transaction, self).__init__()
+        #: The executed command. Internal wrappers (e.g. raw tick commands)
+        #: are resolved to the wrapped command.
+        self.command = command
+        #: The class of the executed command, e.g.
+        #: :py:class:`~sensirion_i2c_sht.sht4x.commands.Sht4xI2cCmdMeasHighRes`.
+        self.command_class = type(command)
+        #: The I²C slave address of the device.
+        self.slave_address = slave_address
+        #: List of the phases as tuples of name, start time and end time.
+        self.phases = []
+        #: The exception raised by the command, or None if it succeeded.
+        self.error = None
+
+    def add(self, phase, start, end):
+        """
+        Add a phase.
+
+        :param str phase: Name of the phase, see :py:data:`PHASES`.
+        :param float start: Start time of the phase.
+        :param float end: End time of the phase.
+        """
+        self.phases.append((phase, start, end))
+
+    @property
+    def start(self):
+        """
+        Start time of the first phase, or None if there are no phases.
+
+        :type: float/None
+        """
+        return self.phases[0][1] if self.phases else None
+
+    @property
+    def end(self):
+        """
+        End time of the last phase, or None if there are no phases.
+
+        :type: float/None
+        """
+        return self.phases[-1][2] if self.phases else None
+
+    @property
+    def duration(self):
+        """
+        Time from the start of the first phase until the end of the last
+        phase in Seconds.
+
+        :type: float
+        """
+        return (self.end - self.start) if self.phases else 0.
+
+    def durations(self):
+        """
+        Get the total duration of every phase.
+
+        :return: The duration in Seconds by phase name.
+        :rtype: dict
+        """
+        durations = {}
+        for phase, start, end in self.phases:
+            durations[phase] = durations.get(phase, 0.) + (end - start)
+        return durations
+
+    def __repr__(self):
+        return '<Transaction {} 0x{:02X}: {}>'.format(
+            self.command_class.__name__, self.slave_address, ', '.join(
+                '{} {:.3f} ms'.format(phase, (end - start) * 1e3)
+                for phase, start, end in self.phases))
+
+
+class CallbackChain(object):
+    """
+    Instrumentation callback which calls several other callbacks, e.g. to
+    record metrics and a trace at the same time.
+    """
+
+    def __init__(self, callbacks):
+        """
+        Creates a chain of callbacks.
+
+        :param list callbacks: The callbacks to call, in this order.
+        """
+        super(CallbackChain, self).__init__()
+        self.callbacks = list(callbacks)  #: The chained callbacks.
+
+    def __call__(self, transaction):
+        for callback in self.callbacks:
+            callback(transaction)
+
+
+def chain_callbacks(*callbacks):
+    """
+    Combine instrumentation callbacks, e.g. a new one with the one already
+    set on a device.
+
+    :param callbacks: The callbacks to combine. None is ignored.
+    :return:
+        A :py:class:`CallbackChain`, or the only passed callback, or None if
+        no callback is passed.
+    :rtype: callable/None
+    """
+    flat = []
+    for callback in callbacks:
+        if isinstance(callback, CallbackChain):
+            flat.extend(callback.callbacks)
+        elif callback is not None:
+            flat.append(callback)
+    if len(flat) > 1:
+        return CallbackChain(flat)
+    return flat[0] if flat else None
+
+
+class TimingCollector(object):
+    """
+    Instrumentation callback which collects the transactions of devices,
+    e.g. to find out where the time goes when a measurement loop overruns
+    its budget:
+
+    .. sourcecode:: python
+
+        collector = TimingCollector()
+        with collector.attach(sht4x):
+            sht4x.single_shot_measurement()
+        for transaction in collector.transactions:
+            print(transaction)
+    """
+
+    def __init__(self, max_transactions=None):
+        """
+        Creates a collector.
+
+        :param int max_transactions:
+            Maximum number of collected transactions. If reached, the oldest
+            ones are discarded. None means no limit.
+        """
+        super(TimingCollector, self).__init__()
+        #: The collected transactions (oldest first).
+        self.transactions = deque(maxlen=max_transactions)
+
+    def __call__(self, transaction):
+        self.transactions.append(transaction)
+
+    @contextmanager
+    def attach(self, *devices):
+        """
+        Context manager which adds the collector to the instrumentation
+        callbacks of devices, and restores their previous callbacks when
+        leaving.
+
+        :param devices:
+            The :py:class:`~sensirion_i2c_sht.device.ShtI2cDeviceBase`
+            devices to instrument.
+        """
+        previous = [device.instrumentation for device in devices]
+        for device in devices:
+            device.instrumentation = chain_callbacks(device.instrumentation,
+                                                     self)
+        try:
+            yield self
+        finally:
+            for device, callback in zip(devices, previous):
+                device.instrumentation = callback
+
+    def durations(self):
+        """
+        Get the total duration of every phase of all collected transactions.
+
+        :return: The duration in Seconds by phase name.
+        :rtype: dict
+        """
+        durations = {}
+        for transaction in self.transactions:
+            for phase, duration in transaction.durations().items():
+                durations[phase] = durations.get(phase, 0.) + duration
+        return durations
+
+    def clear(self):
+        """
+        Discard all collected transactions.
+        """
+        self.transactions.clear()
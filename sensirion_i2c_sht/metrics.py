@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver.errors import I2cChecksumError, I2cNackError, \
+    I2cTimeoutError
+from .instrumentation import chain_callbacks
+from bisect import bisect_left
+from functools import partial
+import math
+import threading
+
+#: Error counter names, see :py:meth:`MetricsRegistry.record`.
+ERRORS = ('checksum', 'nack', 'timeout', 'other')
+
+
+class LatencyHistogram(object):
+    """
+    Histogram of latencies with logarithmic buckets, i.e. the upper bound of
+    every bucket is twice the upper bound of the previous bucket. Thus it
+    covers latencies from microseconds to minutes with a constant relative
+    resolution and a fixed, small memory footprint.
+    """
+
+    #: Upper bounds (inclusive) of the buckets in Seconds, from 2^-20 s
+    #: (about 1 µs) to 2^7 s (128 s). Larger values are counted in an
+    #: additional overflow bucket.
+    BOUNDS = tuple(2. ** exponent for exponent in range(-20, 8))
+
+    def __init__(self):
+        """
+        Creates an empty histogram.
+        """
+        super(LatencyHistogram, self).__init__()
+        #: Number of values of every bucket (not cumulative), the last one
+        #: being the overflow bucket.
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0  #: Number of values.
+        self.sum = 0.  #: Sum of all values in Seconds.
+        self.max = 0.  #: Largest value in Seconds.
+
+    def observe(self, value):
+        """
+        Add a value.
+
+        :param float value: The latency in Seconds.
+        """
+        self.counts[bisect_left(self.BOUNDS, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self):
+        """
+        Mean of all values in Seconds, or None if the histogram is empty.
+
+        :type: float/None
+        """
+        return self.sum / self.count if self.count else None
+
+    def percentile(self, percentile):
+        """
+        Get an upper estimate of a percentile (nearest-rank method), i.e. the
+        upper bound of the bucket containing it (but at most the largest
+        value).
+
+        :param float percentile: The percentile, e.g. 99.
+        :return: The latency in Seconds, or None if the histogram is empty.
+        :rtype: float/None
+        """
+        if not self.count:
+            return None
+        rank = max(int(math.ceil(percentile / 100. * self.count)), 1)
+        for bound, count in zip(self.BOUNDS, self.counts):
+            rank -= count
+            if rank <= 0:
+                return min(bound, self.max)
+        return self.max
+
+    def copy(self):
+        """
+        Get a copy of the histogram.
+
+        :rtype: LatencyHistogram
+        """
+        histogram = LatencyHistogram()
+        histogram.counts = list(self.counts)
+        histogram.count = self.count
+        histogram.sum = self.sum
+        histogram.max = self.max
+        return histogram
+
+    def as_dict(self):
+        """
+        Get the histogram as a dict, e.g. to store it as JSON.
+
+        :rtype: dict
+        """
+        return dict(bounds=list(self.BOUNDS), counts=list(self.counts),
+                    count=self.count, sum=self.sum, max=self.max,
+                    p50=self.percentile(50), p99=self.percentile(99))
+
+
+class CommandMetrics(object):
+    """
+    Metrics of one command class executed by one device, see
+    :py:class:`MetricsRegistry`.
+    """
+
+    def __init__(self):
+        """
+        Creates empty metrics.
+        """
+        super(CommandMetrics, self).__init__()
+        self.count = 0  #: Number of executions (including failed ones).
+        #: Number of raised errors by type, see :py:data:`ERRORS`.
+        self.errors = dict((error, 0) for error in ERRORS)
+        #: Number of repeated read attempts of ready polling.
+        self.retries = 0
+        #: Number of heater activations.
+        self.heater_activations = 0
+        #: Total time in Seconds the heater was activated for, i.e. the sum of
+        #: the heater durations of the commands.
+        self.heater_time = 0.
+        #: Histogram of the total duration of the executions.
+        self.latency = LatencyHistogram()
+        #: Histograms of the durations of every phase, by phase name (see
+        #: :py:data:`~sensirion_i2c_sht.instrumentation.PHASES`). A phase
+        #: occurring several times in one execution is observed once with
+        #: its total duration.
+        self.phases = {}
+
+    def copy(self):
+        """
+        Get a copy of the metrics.
+
+        :rtype: CommandMetrics
+        """
+        metrics = CommandMetrics()
+        metrics.count = self.count
+        metrics.errors = dict(self.errors)
+        metrics.retries = self.retries
+        metrics.heater_activations = self.heater_activations
+        metrics.heater_time = self.heater_time
+        metrics.latency = self.latency.copy()
+        metrics.phases = dict((phase, histogram.copy())
+                              for phase, histogram in self.phases.items())
+        return metrics
+
+    def as_dict(self):
+        """
+        Get the metrics as a dict, e.g. to store them as JSON.
+
+        :rtype: dict
+        """
+        return dict(count=self.count, errors=dict(self.errors),
+                    retries=self.retries,
+                    heater_activations=self.heater_activations,
+                    heater_time=self.heater_time,
+                    latency=self.latency.as_dict(),
+                    phases=dict((phase, histogram.as_dict())
+                                for phase, histogram in self.phases.items()))
+
+
+class MetricsRegistry(object):
+    """
+    Aggregates the
+    :py:class:`~sensirion_i2c_sht.instrumentation.Transaction` of devices
+    into metrics per device and command class: latency histograms of the
+    executions and their phases, and counters of errors, ready polling
+    retries and heater activations.
+
+    .. sourcecode:: python
+
+        registry = MetricsRegistry()
+        registry.attach(sht4x, name='outdoor')
+        while True:
+            sht4x.single_shot_measurement()
+            ...
+        metrics = registry.snapshot()['outdoor']['Sht4xI2cCmdMeasHighRes']
+        print(metrics.latency.percentile(99), metrics.errors['checksum'])
+
+    Recording and taking snapshots are thread-safe, i.e. the metrics can be
+    read by another thread than the one executing the commands.
+
+    .. note:: Errors are counted if they are raised. On multi-channel
+              connections, errors of single channels are returned within
+              the results instead, so they are not counted.
+    """
+
+    def __init__(self):
+        """
+        Creates an empty registry.
+        """
+        super(MetricsRegistry, self).__init__()
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def attach(self, device, name=None):
+        """
+        Record the transactions of a device, by adding the registry to its
+        instrumentation callbacks.
+
+        :param ~sensirion_i2c_sht.device.ShtI2cDeviceBase device:
+            The device to record.
+        :param str name:
+            Name of the device in the metrics. Defaults to its slave address
+            (e.g. ``'0x44'``), which needs to be overridden if devices on
+            different buses have the same slave address.
+        :return: The instrumentation callback added to the device.
+        :rtype: callable
+        """
+        callback = partial(self.record, device=name)
+        device.instrumentation = chain_callbacks(device.instrumentation,
+                                                 callback)
+        return callback
+
+    def record(self, transaction, device=None):
+        """
+        Add a transaction to the metrics.
+
+        Errors are counted by type: ``checksum`` for
+        :py:class:`~sensirion_i2c_driver.errors.I2cChecksumError`, ``nack``
+        for :py:class:`~sensirion_i2c_driver.errors.I2cNackError`,
+        ``timeout`` for
+        :py:class:`~sensirion_i2c_driver.errors.I2cTimeoutError` and
+        ``other`` for any other exception.
+
+        :param ~sensirion_i2c_sht.instrumentation.Transaction transaction:
+            The transaction to add.
+        :param str device:
+            Name of the device, defaults to the slave address of the
+            transaction.
+        """
+        if device is None:
+            device = '0x{:02X}'.format(transaction.slave_address)
+        durations = transaction.durations()
+        key = (device, transaction.command_class.__name__)
+        with self._lock:
+            metrics = self._metrics.get(key)
+            if metrics is None:
+                metrics = self._metrics[key] = CommandMetrics()
+            metrics.count += 1
+            metrics.latency.observe(transaction.duration)
+            for phase, duration in durations.items():
+                histogram = metrics.phases.get(phase)
+                if histogram is None:
+                    histogram = metrics.phases[phase] = LatencyHistogram()
+                histogram.observe(duration)
+            error = transaction.error
+            if error is not None:
+                metrics.errors[_error_type(error)] += 1
+            phases = [phase for phase, _, _ in transaction.phases]
+            if 'write' in phases:
+                metrics.retries += max(
+                    phases.count('read') - phases.count('write'), 0)
+            if hasattr(transaction.command, 'heater_duration'):
+                metrics.heater_activations += 1
+                metrics.heater_time += \
+                    transaction.command.heater_duration or 0.
+
+    def snapshot(self):
+        """
+        Get a copy of the current metrics, which is not modified by
+        subsequently recorded transactions.
+
+        :return:
+            The :py:class:`CommandMetrics` by command class name, by device
+            name.
+        :rtype: dict
+        """
+        with self._lock:
+            items = [(key, metrics.copy())
+                     for key, metrics in self._metrics.items()]
+        snapshot = {}
+        for (device, command), metrics in items:
+            snapshot.setdefault(device, {})[command] = metrics
+        return snapshot
+
+    def as_dict(self):
+        """
+        Get a snapshot of the metrics as nested dicts, e.g. to store it as
+        JSON.
+
+        :rtype: dict
+        """
+        return dict((device, dict((command, metrics.as_dict())
+                                  for command, metrics in commands.items()))
+                    for device, commands in self.snapshot().items())
+
+    def reset(self):
+        """
+        Discard all metrics.
+        """
+        with self._lock:
+            self._metrics.clear()
+
+
+def _error_type(error):
+    """
+    Get the error counter name of an exception.
+    """
+    if isinstance(error, I2cChecksumError):
+        return 'checksum'
+    if isinstance(error, I2cNackError):
+        return 'nack'
+    if isinstance(error, I2cTimeoutError):
+        return 'timeout'
+    return 'other'
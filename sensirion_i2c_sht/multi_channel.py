@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from array import array
+
+try:
+    import numpy
+except ImportError:  # NumPy is an optional dependency
+    numpy = None
+
+
+def _ticks_array(values):
+    if numpy is not None:
+        return numpy.array(values, dtype=numpy.uint16)
+    return array('H', values)
+
+
+class MultiChannelResult(object):
+    """
+    Columnar result of a measurement on all channels of a multi-channel
+    connection.
+
+    Instead of a list containing one response tuple or exception per
+    channel, the ticks and converted values of all channels are provided as
+    arrays (:py:class:`numpy.ndarray` if NumPy is installed, otherwise
+    :py:class:`array.array`), with the index being the channel number.
+    Channels whose measurement failed are marked in :py:attr:`valid`, their
+    ticks are 0 and their converted values are NaN.
+
+    .. sourcecode:: python
+
+        result = sht3x.single_shot_measurement_multi_channel()
+        for channel in range(result.channel_count):
+            if result.valid[channel]:
+                print(result.degrees_celsius[channel])
+            else:
+                print(result.errors[channel])
+    """
+
+    def __init__(self, results, conversion):
+        """
+        Creates an instance from the per-channel results of a raw
+        measurement.
+
+        :param list results:
+            For every channel either the ticks (an int, or a tuple of the
+            temperature and humidity ticks) or the raised exception, e.g. an
+            :py:class:`~sensirion_i2c_driver.errors.I2cError`.
+        :param module conversion:
+            The conversion module of the sensor family, e.g.
+            :py:mod:`sensirion_i2c_sht.sht3x.conversion`.
+        """
+        super(MultiChannelResult, self).__init__()
+        self._conversion = conversion
+        self._errors = []
+        temperature_ticks = []
+        humidity_ticks = []
+        for result in results:
+            if isinstance(result, Exception):
+                self._errors.append(result)
+                temperature_ticks.append(0)
+                humidity_ticks.append(0)
+            else:
+                self._errors.append(None)
+                if isinstance(result, tuple):
+                    temperature_ticks.append(result[0])
+                    humidity_ticks.append(result[1])
+                else:
+                    temperature_ticks.append(result)
+                    humidity_ticks.append(0)
+        self._has_humidity = hasattr(conversion, 'ticks_to_percent_rh')
+        self._temperature_ticks = _ticks_array(temperature_ticks)
+        self._humidity_ticks = _ticks_array(humidity_ticks) \
+            if self._has_humidity else None
+        self._valid = [error is None for error in self._errors]
+        if numpy is not None:
+            self._valid = numpy.array(self._valid, dtype=bool)
+        self._converted = {}
+
+    @property
+    def channel_count(self):
+        """
+        The number of channels.
+
+        :type: int
+        """
+        return len(self._errors)
+
+    @property
+    def errors(self):
+        """
+        The raised exception of every channel, or None for channels without
+        error.
+
+        :type: list
+        """
+        return self._errors
+
+    @property
+    def valid(self):
+        """
+        Whether the measurement of every channel succeeded.
+
+        :type: numpy.ndarray / list(bool)
+        """
+        return self._valid
+
+    @property
+    def temperature_ticks(self):
+        """
+        The temperature ticks of every channel.
+
+        :type: numpy.ndarray / array.array
+        """
+        return self._temperature_ticks
+
+    @property
+    def humidity_ticks(self):
+        """
+        The humidity ticks of every channel, or None if the sensor does not
+        measure humidity.
+
+        :type: numpy.ndarray / array.array / None
+        """
+        return self._humidity_ticks
+
+    @property
+    def degrees_celsius(self):
+        """
+        The temperature in °C of every channel.
+
+        :type: numpy.ndarray / array.array
+        """
+        return self._convert('ticks_to_degrees_celsius',
+                             self._temperature_ticks)
+
+    @property
+    def degrees_fahrenheit(self):
+        """
+        The temperature in °F of every channel.
+
+        :type: numpy.ndarray / array.array
+        """
+        return self._convert('ticks_to_degrees_fahrenheit',
+                             self._temperature_ticks)
+
+    @property
+    def percent_rh(self):
+        """
+        The humidity in %RH of every channel, or None if the sensor does not
+        measure humidity.
+
+        :type: numpy.ndarray / array.array / None
+        """
+        if not self._has_humidity:
+            return None
+        return self._convert('ticks_to_percent_rh', self._humidity_ticks)
+
+    def _convert(self, name, ticks):
+        """
+        Convert ticks with a function of the conversion module (only once)
+        and set the values of invalid channels to NaN.
+        """
+        values = self._converted.get(name)
+        if values is None:
+            values = getattr(self._conversion, name)(ticks)
+            if numpy is not None:
+                values[~self._valid] = numpy.nan
+            else:
+                for channel, valid in enumerate(self._valid):
+                    if not valid:
+                        values[channel] = float('nan')
+            self._converted[name] = values
+        return values
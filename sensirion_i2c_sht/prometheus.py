@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+"""
+Exporter of the metrics of a
+:py:class:`~sensirion_i2c_sht.metrics.MetricsRegistry` in the Prometheus text
+format, served over a local HTTP port or a Unix socket:
+
+.. sourcecode:: python
+
+    registry = MetricsRegistry()
+    registry.attach(sht4x, name='outdoor')
+    with PrometheusExporter(registry, port=9110):
+        while True:
+            sht4x.single_shot_measurement()
+
+The following metrics are exported, all labelled with ``device`` and
+``command`` (the command class name):
+
+- ``sht_commands_total``: Executed commands, e.g.
+  ``rate(sht_commands_total[1m])`` are the measurements per second.
+- ``sht_errors_total``: Raised errors, additionally labelled with ``type``
+  (``checksum``, ``nack``, ``timeout`` or ``other``), e.g. the CRC error
+  rate is ``rate(sht_errors_total{type="checksum"}[1m])``.
+- ``sht_retries_total``: Repeated read attempts of ready polling.
+- ``sht_bus_seconds_total``: Time spent in bus transfers (write, read and
+  combined transfer phases).
+- ``sht_heater_activations_total`` and ``sht_heater_seconds_total``: Heater
+  activations and their duration, i.e. ``rate(sht_heater_seconds_total[5m])``
+  is the heater duty cycle.
+- ``sht_latency_seconds``: Histogram of the command execution time.
+- ``sht_phase_seconds``: Histogram of the duration of every phase,
+  additionally labelled with ``phase``.
+
+Every scrape renders a snapshot of the registry, which is copied within a
+short lock, so scrapes do not block the acquisition.
+"""
+
+from __future__ import absolute_import, division, print_function
+import os
+import socket
+import stat
+import threading
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn, UnixStreamServer
+except ImportError:  # Python 2
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn, UnixStreamServer
+
+#: Content type of the Prometheus text format.
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+#: Phases which are counted as bus time.
+BUS_PHASES = ('write', 'read', 'transfer')
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"') \
+        .replace('\n', '\\n')
+
+
+def _labels(**labels):
+    return '{' + ','.join('{}="{}"'.format(name, _escape(value))
+                          for name, value in sorted(labels.items())) + '}'
+
+
+def _number(value):
+    if isinstance(value, int):
+        return str(value)
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value))
+
+
+def _histogram(lines, name, histogram, **labels):
+    """
+    Append the lines of a histogram with cumulative buckets.
+    """
+    cumulative = 0
+    for bound, count in zip(histogram.BOUNDS, histogram.counts):
+        cumulative += count
+        lines.append('{}_bucket{} {}'.format(
+            name, _labels(le=_number(bound), **labels), cumulative))
+    lines.append('{}_bucket{} {}'.format(name, _labels(le='+Inf', **labels),
+                                         histogram.count))
+    lines.append('{}_sum{} {}'.format(name, _labels(**labels),
+                                      _number(histogram.sum)))
+    lines.append('{}_count{} {}'.format(name, _labels(**labels),
+                                        histogram.count))
+
+
+def render(registry):
+    """
+    Render the metrics of a registry in the Prometheus text format.
+
+    :param ~sensirion_i2c_sht.metrics.MetricsRegistry registry:
+        The registry to render.
+    :return: The metrics in the Prometheus text format.
+    :rtype: str
+    """
+    entries = sorted((device, command, metrics)
+                     for device, commands in registry.snapshot().items()
+                     for command, metrics in commands.items())
+    counters = [
+        ('sht_commands_total', 'Executed commands.',
+         lambda m: m.count),
+        ('sht_retries_total', 'Repeated read attempts of ready polling.',
+         lambda m: m.retries),
+        ('sht_bus_seconds_total', 'Time spent in bus transfers.',
+         lambda m: sum(m.phases[phase].sum for phase in BUS_PHASES
+                       if phase in m.phases)),
+        ('sht_heater_activations_total', 'Heater activations.',
+         lambda m: m.heater_activations),
+        ('sht_heater_seconds_total', 'Duration of heater activations.',
+         lambda m: m.heater_time),
+    ]
+    lines = []
+    for name, description, value in counters:
+        lines.append('# HELP {} {}'.format(name, description))
+        lines.append('# TYPE {} counter'.format(name))
+        for device, command, metrics in entries:
+            lines.append('{}{} {}'.format(
+                name, _labels(device=device, command=command),
+                _number(value(metrics))))
+    lines.append('# HELP sht_errors_total Raised errors by type.')
+    lines.append('# TYPE sht_errors_total counter')
+    for device, command, metrics in entries:
+        for error, count in sorted(metrics.errors.items()):
+            lines.append('sht_errors_total{} {}'.format(
+                _labels(device=device, command=command, type=error), count))
+    lines.append('# HELP sht_latency_seconds Command execution time.')
+    lines.append('# TYPE sht_latency_seconds histogram')
+    for device, command, metrics in entries:
+        _histogram(lines, 'sht_latency_seconds', metrics.latency,
+                   device=device, command=command)
+    lines.append('# HELP sht_phase_seconds Duration of command phases.')
+    lines.append('# TYPE sht_phase_seconds histogram')
+    for device, command, metrics in entries:
+        for phase, histogram in sorted(metrics.phases.items()):
+            _histogram(lines, 'sht_phase_seconds', histogram, device=device,
+                       command=command, phase=phase)
+    return '\n'.join(lines) + '\n'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    Request handler serving the rendered metrics on every path.
+    """
+
+    def do_GET(self):
+        body = render(self.server.registry).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self):
+        # Unix sockets have no client address
+        return str(self.client_address[0]) if self.client_address else ''
+
+    def log_message(self, format, *args):
+        pass  # do not log every scrape
+
+
+class _HttpServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _UnixHttpServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = self.socket.accept()
+        return request, ('', 0)
+
+
+class PrometheusExporter(object):
+    """
+    Serves the metrics of a registry in the Prometheus text format from a
+    background thread, over HTTP on a local TCP port or on a Unix socket.
+    """
+
+    def __init__(self, registry, port=9110, host='127.0.0.1',
+                 unix_socket=None):
+        """
+        Creates an exporter. It is started with :py:meth:`start` or by
+        entering it as context manager.
+
+        :param ~sensirion_i2c_sht.metrics.MetricsRegistry registry:
+            The registry to export.
+        :param int port:
+            The TCP port to listen on. 0 selects a free port, see
+            :py:attr:`address`.
+        :param str host:
+            The address to listen on. Defaults to the loopback interface,
+            i.e. the metrics are only available locally.
+        :param str unix_socket:
+            Path of a Unix socket to listen on instead of a TCP port.
+        """
+        super(PrometheusExporter, self).__init__()
+        self._registry = registry
+        self._port = port
+        self._host = host
+        self._unix_socket = unix_socket
+        self._server = None
+        self._thread = None
+
+    @property
+    def address(self):
+        """
+        The address the exporter is listening on, i.e. a tuple of host and
+        port, or the path of the Unix socket. None if not started.
+
+        :type: tuple/str/None
+        """
+        return self._server.server_address if self._server else None
+
+    def start(self):
+        """
+        Start serving the metrics.
+
+        :raises RuntimeError:
+            If the exporter is already started, or the Unix socket path is
+            in use or exists but is not a socket.
+        """
+        if self._server is not None:
+            raise RuntimeError('The exporter is already started.')
+        if self._unix_socket is not None:
+            if os.path.exists(self._unix_socket):
+                if not stat.S_ISSOCK(os.stat(self._unix_socket).st_mode):
+                    raise RuntimeError('The path {} exists and is not a '
+                                       'socket.'.format(self._unix_socket))
+                # remove stale socket of a previous process
+                probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                try:
+                    probe.connect(self._unix_socket)
+                    raise RuntimeError('The socket {} is already in use.'
+                                       .format(self._unix_socket))
+                except socket.error:
+                    os.remove(self._unix_socket)
+                finally:
+                    probe.close()
+            server = _UnixHttpServer(self._unix_socket, _Handler)
+        else:
+            server = _HttpServer((self._host, self._port), _Handler)
+        server.registry = self._registry
+        self._server = server
+        self._thread = threading.Thread(target=server.serve_forever,
+                                        name='PrometheusExporter')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop serving the metrics and close the socket.
+        """
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        if self._unix_socket is not None:
+            try:
+                os.remove(self._unix_socket)
+            except OSError:
+                pass
+        self._server = None
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+import threading
+
+try:
+    from time import monotonic
+except ImportError:  # Python 2
+    from time import time as monotonic
+
+import logging
+log = logging.getLogger(__name__)
+
+
+class Sample(object):
+    """
+    A measurement result published by a :py:class:`Sampler`.
+    """
+
+    def __init__(self, value, time, sequence):
+        """
+        Creates a sample.
+
+        :param value:
+            The measurement result, as returned by the measurement method of
+            the device.
+        :param float time:
+            Time when the result was read, based on the same clock as
+            :py:func:`time.monotonic`.
+        :param int sequence:
+            Number of the sample, starting at 1.
+        """
+        super(Sample, self).__init__()
+        self.value = value  #: The measurement result.
+        self.time = time  #: Time when the result was read.
+        self.sequence = sequence  #: Number of the sample, starting at 1.
+
+    @property
+    def age(self):
+        """
+        Seconds since the result was read.
+
+        :type: float
+        """
+        return monotonic() - self.time
+
+    def __repr__(self):
+        return 'Sample({!r}, time={:.6f}, sequence={})'.format(
+            self.value, self.time, self.sequence)
+
+
+class Sampler(object):
+    """
+    Performs measurements with a device at a fixed rate on a background
+    thread and keeps the latest result, so that any number of consumers can
+    get the current value without accessing the bus:
+
+    .. sourcecode:: python
+
+        with Sampler(sht4x, interval=0.5) as sampler:
+            while True:
+                temperature, humidity = sampler.get(max_age=2.)
+                ...
+
+    The latest :py:class:`Sample` is published by replacing a single
+    attribute, i.e. reading it never blocks and needs no lock.
+
+    While the sampler is running, it owns the device, i.e. no other thread
+    must execute commands on it (or on other devices on the same bus, unless
+    the connection is thread-safe). Errors raised by the measurement do not
+    stop the sampler: they are logged, counted in :py:attr:`errors` and
+    kept in :py:attr:`last_error`, and :py:meth:`get` raises the last error
+    if no valid sample is available.
+    """
+
+    def __init__(self, device, interval=1.,
+                 method='single_shot_measurement', **kwargs):
+        """
+        Creates a sampler. It does not start sampling until :py:meth:`start`
+        is called (or the sampler is entered as context manager).
+
+        :param ~sensirion_i2c_sht.device.ShtI2cDeviceBase device:
+            The device to measure with.
+        :param float interval:
+            Seconds between the start of two measurements. If a measurement
+            takes longer, the next one starts immediately.
+        :param str method:
+            Name of the device method which performs a measurement and
+            returns its result, e.g. ``'single_shot_measurement_raw'``.
+        :param kwargs:
+            Measurement settings which are passed to the method, e.g.
+            ``repeatability``.
+        """
+        super(Sampler, self).__init__()
+        self._device = device
+        self._measure = getattr(device, method)
+        self._kwargs = kwargs
+        self.interval = float(interval)  #: Seconds between two measurements.
+        self._latest = None
+        self._last_error = None
+        self._errors = 0
+        self._thread = None
+        self._stop = threading.Event()
+
+    @property
+    def device(self):
+        """
+        The device to measure with.
+
+        :type: ~sensirion_i2c_sht.device.ShtI2cDeviceBase
+        """
+        return self._device
+
+    @property
+    def latest(self):
+        """
+        The latest sample, or None if no measurement succeeded yet.
+
+        :type: Sample/None
+        """
+        return self._latest
+
+    @property
+    def last_error(self):
+        """
+        The exception raised by the latest measurement, or None if it
+        succeeded (or no measurement was performed yet).
+
+        :type: Exception/None
+        """
+        return self._last_error
+
+    @property
+    def errors(self):
+        """
+        Number of failed measurements.
+
+        :type: int
+        """
+        return self._errors
+
+    @property
+    def running(self):
+        """
+        Whether the sampling thread is running.
+
+        :type: bool
+        """
+        return (self._thread is not None) and self._thread.is_alive()
+
+    def get(self, max_age=None):
+        """
+        Get the value of the latest sample.
+
+        :param float max_age:
+            Maximum age of the sample in Seconds, None to accept any age.
+        :return: The latest measurement result.
+        :raises Exception:
+            The error of the latest failed measurement, if no sample is
+            available which is recent enough.
+        :raises RuntimeError:
+            If no sample is available and no measurement failed yet.
+        """
+        sample = self._latest
+        if (sample is not None) and \
+                ((max_age is None) or (sample.age <= max_age)):
+            return sample.value
+        error = self._last_error
+        if error is not None:
+            raise error
+        if sample is None:
+            raise RuntimeError('No sample available yet.')
+        raise RuntimeError('The latest sample is {:.3f}s old.'.format(
+            sample.age))
+
+    def start(self):
+        """
+        Start the sampling thread.
+
+        :raises RuntimeError: If the sampler is already running.
+        """
+        if self.running:
+            raise RuntimeError('The sampler is already running.')
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name='Sampler 0x{:02X}'.format(
+                self._device.slave_address))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """
+        Stop the sampling thread, waiting until a running measurement is
+        finished, i.e. the device can be used by the caller afterwards.
+
+        :param float timeout:
+            Maximum Seconds to wait for the thread, None to wait forever.
+        :raises RuntimeError: If the thread did not stop within the timeout.
+        """
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+            if thread.is_alive():
+                raise RuntimeError('The sampling thread did not stop.')
+            self._thread = None
+
+    def sample(self):
+        """
+        Perform one measurement and publish its result.
+
+        :return: The published sample.
+        :rtype: Sample
+        :raises Exception: The error raised by the measurement.
+        """
+        try:
+            value = self._measure(**self._kwargs)
+        except Exception as e:
+            self._errors += 1
+            self._last_error = e
+            raise
+        latest = self._latest
+        sample = Sample(value, monotonic(),
+                        1 if latest is None else latest.sequence + 1)
+        self._last_error = None
+        self._latest = sample
+        return sample
+
+    def _run(self):
+        """
+        Main loop of the sampling thread.
+        """
+        next_time = monotonic()
+        while not self._stop.is_set():
+            try:
+                self.sample()
+            except Exception as e:
+                log.warning("Measurement of device 0x{:02X} failed: {}"
+                            .format(self._device.slave_address, e))
+            next_time = max(next_time + self.interval, monotonic())
+            self._stop.wait(next_time - monotonic())
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+import logging
+log = logging.getLogger(__name__)
+
+
+class MeasurementScheduler(object):
+    """
+    Performs measurements with many devices at once by overlapping their
+    measurement durations.
+
+    Instead of measuring with one device after the other, a sweep first
+    triggers the measurement on all devices, then reads the results in the
+    order they become available. Thus a sweep takes roughly one measurement
+    duration instead of the sum of all of them.
+
+    Devices of all sensor families of this package can be mixed, also if
+    they are connected to different buses. Devices sharing a bus must have
+    different slave addresses.
+
+    .. sourcecode:: python
+
+        scheduler = MeasurementScheduler([sht3x_1, sht3x_2, sht4x])
+        for result in scheduler.sweep():
+            print(result)
+    """
+
+    def __init__(self, devices=()):
+        """
+        Creates a scheduler.
+
+        :param list devices:
+            The devices to measure with, using the default measurement
+            settings. Use :py:meth:`add_device` to pass custom settings.
+        """
+        super(MeasurementScheduler, self).__init__()
+        self._entries = []
+        for device in devices:
+            self.add_device(device)
+
+    @property
+    def devices(self):
+        """
+        The devices to measure with, in the order they were added.
+
+        :type: list
+        """
+        return [device for device, _, _ in self._entries]
+
+    def add_device(self, device, start_method='start_measurement',
+                   **kwargs):
+        """
+        Add a device to measure with.
+
+        :param ~sensirion_i2c_sht.device.ShtI2cDeviceBase device:
+            The device to add.
+        :param str start_method:
+            Name of the device method which starts the measurement and
+            returns its :py:class:`~sensirion_i2c_sht.device.MeasurementHandle`,
+            e.g. ``'start_heater'`` to run a heater cycle on a SHT4x while
+            the other devices are measuring.
+        :param kwargs:
+            Measurement settings which are passed to the start method of the
+            device, e.g. ``repeatability``.
+        """
+        self._entries.append((device, getattr(device, start_method), kwargs))
+
+    def sweep(self):
+        """
+        Perform one measurement with all devices.
+
+        :return:
+            A list containing the result of every device (in the order the
+            devices were added), with the same data type as returned by
+            ``read_measurement()`` of the corresponding device. If the
+            measurement of a device failed, the list contains the raised
+            exception object instead, so that the results of all other
+            devices are still available.
+        :rtype: list
+        """
+        results = [None] * len(self._entries)
+        pending = []
+        for index, (device, start, kwargs) in enumerate(self._entries):
+            try:
+                pending.append((index, start(**kwargs)))
+            except Exception as e:
+                log.warning("Failed to start measurement on {}: {}".format(
+                    device, e))
+                results[index] = e
+        while len(pending):
+            index, handle = min(pending, key=lambda p: p[1].ready_time)
+            try:
+                if handle.step():
+                    results[index] = handle.result()
+                    pending.remove((index, handle))
+            except Exception as e:
+                log.warning("Failed to read measurement: {}".format(e))
+                results[index] = e
+                pending.remove((index, handle))
+        return results
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from ..async_device import AsyncShtI2cDeviceBase
+from ..commands import shared_command, get_raw_command
+from .commands import Sht2xI2cMeasureTemperature, Sht2xI2cMeasureHumidity, \
+    Sht2xI2cCmdSoftReset, Sht2xI2cCmdReadOtp, Sht2xI2cCmdReadMetalRom
+from .device import Sht2xI2cDevice
+
+
+class AsyncSht2xI2cDevice(AsyncShtI2cDeviceBase):
+    """
+    SHT2x I²C device class to allow executing I²C commands with asyncio.
+
+    See :py:class:`~sensirion_i2c_sht.async_device.AsyncShtI2cDeviceBase` for
+    details.
+    """
+
+    def __init__(self, connection, slave_address=0x40, executor=None):
+        """
+        Constructs a new asynchronous SHT2x I²C device.
+
+        :param ~sensirion_i2c_driver.connection.I2cConnection connection:
+            The I²C connection to use for communication.
+        :param byte slave_address:
+            The I²C slave address, defaults to 0x40.
+        :param ~concurrent.futures.Executor executor:
+            The executor to run the bus transfers in. If None, the default
+            executor of the event loop is used.
+        """
+        super(AsyncSht2xI2cDevice, self).__init__(
+            Sht2xI2cDevice(connection, slave_address), executor)
+
+    async def single_shot_measurement(self):
+        """
+        Trigger a measurement and read the temperature and humidity.
+
+        See :py:meth:`~sensirion_i2c_sht.sht2x.device.Sht2xI2cDevice.single_shot_measurement`.
+        """  # noqa: E501
+        temperature = await self.execute(
+            shared_command(Sht2xI2cMeasureTemperature))
+        humidity = await self.execute(
+            shared_command(Sht2xI2cMeasureHumidity))
+        return self.device._combine_measurement(temperature, humidity)
+
+    async def single_shot_measurement_raw(self, buffer=None, offset=0):
+        """
+        Trigger a measurement and read the raw temperature and humidity ticks.
+
+        See :py:meth:`~sensirion_i2c_sht.sht2x.device.Sht2xI2cDevice.single_shot_measurement_raw`.
+        """  # noqa: E501
+        self.device._check_buffer(buffer)
+        temperature = await self.execute(
+            get_raw_command(shared_command(Sht2xI2cMeasureTemperature)))
+        humidity = await self.execute(
+            get_raw_command(shared_command(Sht2xI2cMeasureHumidity)))
+        return self.device._store_ticks(
+            self.device._combine_measurement(temperature, humidity), buffer,
+            offset)
+
+    async def soft_reset(self):
+        """
+        Perform a soft reset for the device.
+
+        See :py:meth:`~sensirion_i2c_sht.sht2x.device.Sht2xI2cDevice.soft_reset`.
+        """  # noqa: E501
+        return await self.execute(shared_command(Sht2xI2cCmdSoftReset))
+
+    async def read_serial_number(self):
+        """
+        Read the extended serial number from the device.
+
+        :return: The extended serial number.
+        :rtype: int
+        """
+        data_bytes_otp = await self.execute(Sht2xI2cCmdReadOtp(0x0F, 4))
+        data_words_metrom = await self.execute(Sht2xI2cCmdReadMetalRom(2))
+        return self.device._combine_serial_number(data_bytes_otp,
+                                                  data_words_metrom)
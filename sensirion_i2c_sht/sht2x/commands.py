@@ -2,8 +2,8 @@
 # (c) Copyright 2020 Sensirion AG, Switzerland
 
 from __future__ import absolute_import, division, print_function
-from sensirion_i2c_driver import SensirionI2cCommand, CrcCalculator, I2cCommand
-from sensirion_i2c_driver.errors import I2cChecksumError
+from sensirion_i2c_driver import SensirionI2cCommand, I2cCommand
+from ..crc import CRC8_INIT_00
 from .response_types import Sht2xTemperature, Sht2xHumidity
 from struct import unpack
 
@@ -13,7 +13,8 @@ class Sht2xI2cCmdBase(SensirionI2cCommand):
     Sht2x I²C base command.
     """
     def __init__(self, command, tx_data, rx_length, read_delay, timeout,
-                 command_bytes=1, post_processing_time=0.0):
+                 command_bytes=1, post_processing_time=0.0,
+                 typical_read_delay=None):
         """
         Constructs a new SHT2x I²C command.
 
@@ -51,6 +52,10 @@ class Sht2xI2cCmdBase(SensirionI2cCommand):
             example after a device reset command, the device might need some
             time until it is ready again. Usually this is 0.0s, i.e. no post
             processing is needed.
+        :param float typical_read_delay:
+            Typical duration (in Seconds) the device needs to prepare the RX
+            data. Used as first read attempt if ready polling is enabled. None
+            means that the command does not support ready polling.
         """
         super(Sht2xI2cCmdBase, self).__init__(
             command=command,
@@ -58,11 +63,31 @@ class Sht2xI2cCmdBase(SensirionI2cCommand):
             rx_length=rx_length,
             read_delay=read_delay,
             timeout=timeout,
-            crc=CrcCalculator(8, 0x31, 0x00),
+            crc=CRC8_INIT_00,
             command_bytes=command_bytes,
             post_processing_time=post_processing_time,
         )
 
+        #: Typical delay in Seconds between write and read operation
+        #: (float/None).
+        self.typical_read_delay = typical_read_delay
+
+    def interpret_response(self, data):
+        """
+        Validates the CRCs of the received data from the device and returns
+        the data with all CRCs removed.
+
+        :param bytes data:
+            Received raw bytes from the read operation.
+        :return:
+            The received bytes, or None if there is no data received.
+        :rtype:
+            bytes or None
+        :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
+            If a received CRC was wrong.
+        """
+        return self._crc.verify_words(data)
+
 
 class Sht2xI2cMeasureHumidity(Sht2xI2cCmdBase):
     """
@@ -78,6 +103,7 @@ class Sht2xI2cMeasureHumidity(Sht2xI2cCmdBase):
             rx_length=3,
             read_delay=0.029,
             timeout=0,
+            typical_read_delay=0.022,
         )
 
     def interpret_response(self, data):
@@ -88,8 +114,19 @@ class Sht2xI2cMeasureHumidity(Sht2xI2cCmdBase):
         :return: The read humidity.
         :rtype: :py:class:`~sensirion_i2c_sht.sht2x.response_types.Sht2xHumidity`
         """  # noqa: E501
-        checked_data = SensirionI2cCommand.interpret_response(self, data)
-        return Sht2xHumidity(unpack(">H", checked_data)[0])
+        return Sht2xHumidity(self.interpret_ticks(data))
+
+    def interpret_ticks(self, data):
+        """
+        Converts the raw response from the device to the raw ticks, without
+        creating a response object.
+
+        :param bytes data: Received raw bytes from the read operation.
+        :return: The read humidity ticks.
+        :rtype: int
+        """
+        checked_data = Sht2xI2cCmdBase.interpret_response(self, data)
+        return unpack(">H", checked_data)[0]
 
 
 class Sht2xI2cMeasureTemperature(Sht2xI2cCmdBase):
@@ -106,6 +143,7 @@ class Sht2xI2cMeasureTemperature(Sht2xI2cCmdBase):
             rx_length=3,
             read_delay=0.085,
             timeout=0,
+            typical_read_delay=0.066,
         )
 
     def interpret_response(self, data):
@@ -116,8 +154,19 @@ class Sht2xI2cMeasureTemperature(Sht2xI2cCmdBase):
         :return: The read temperature.
         :rtype: :py:class:`~sensirion_i2c_sht.sht2x.response_types.Sht2xTemperature`
         """  # noqa: E501
-        checked_data = SensirionI2cCommand.interpret_response(self, data)
-        return Sht2xTemperature(unpack(">H", checked_data)[0])
+        return Sht2xTemperature(self.interpret_ticks(data))
+
+    def interpret_ticks(self, data):
+        """
+        Converts the raw response from the device to the raw ticks, without
+        creating a response object.
+
+        :param bytes data: Received raw bytes from the read operation.
+        :return: The read temperature ticks.
+        :rtype: int
+        """
+        checked_data = Sht2xI2cCmdBase.interpret_response(self, data)
+        return unpack(">H", checked_data)[0]
 
 
 class Sht2xI2cCmdSoftReset(Sht2xI2cCmdBase):
@@ -154,7 +203,7 @@ class Sht2xI2cCmdReadOtp(I2cCommand):
             rx_length=number_of_bytes_to_read * 2,
             read_delay=0., timeout=0.
         )
-        self._crc = CrcCalculator(8, 0x31, 0x00)
+        self._crc = CRC8_INIT_00
 
     def interpret_response(self, data):
         """
@@ -164,18 +213,8 @@ class Sht2xI2cCmdReadOtp(I2cCommand):
         :return: The read bytes from the OTP.
         :rtype: list(int)
         """
-        data = bytearray(data)  # Python 2 compatibility
-        otp_bytes = []
         # Each byte is followed by a crc
-        for i in range(len(data)):
-            if i % 2 == 0:
-                otp_bytes.append(data[i])
-            else:
-                received_crc = data[i]
-                expected_crc = self._crc(data[i - 1:i])
-                if received_crc != expected_crc:
-                    raise I2cChecksumError(received_crc, expected_crc, data)
-        return otp_bytes
+        return self._crc.verify_bytes(data)
 
 
 class Sht2xI2cCmdReadMetalRom(Sht2xI2cCmdBase):
@@ -205,7 +244,7 @@ class Sht2xI2cCmdReadMetalRom(Sht2xI2cCmdBase):
         :return: The read words from the metal ROM.
         :rtype: list(int)
         """
-        checked_data = SensirionI2cCommand.interpret_response(self, data)
+        checked_data = Sht2xI2cCmdBase.interpret_response(self, data)
         n_words = int(len(checked_data) / 2)
         words = unpack(">{}H".format(n_words), checked_data)
         return words
@@ -2,13 +2,16 @@
 # (c) Copyright 2020 Sensirion AG, Switzerland
 
 from __future__ import absolute_import, division, print_function
-from sensirion_i2c_driver.device import I2cDevice
 from sensirion_i2c_driver.errors import I2cError
+from ..commands import shared_command, get_raw_command
+from ..device import ShtI2cDeviceBase
+from ..multi_channel import MultiChannelResult
+from . import conversion
 from .commands import Sht2xI2cMeasureTemperature, Sht2xI2cMeasureHumidity, \
     Sht2xI2cCmdSoftReset, Sht2xI2cCmdReadOtp, Sht2xI2cCmdReadMetalRom
 
 
-class Sht2xI2cDevice(I2cDevice):
+class Sht2xI2cDevice(ShtI2cDeviceBase):
     """
     SHT2x I²C device class to allow executing I²C commands.
     """
@@ -38,8 +41,91 @@ class Sht2xI2cDevice(I2cDevice):
         :rtype:
             tuple
         """  # noqa: E501
-        temperature = self.execute(Sht2xI2cMeasureTemperature())
-        humidity = self.execute(Sht2xI2cMeasureHumidity())
+        temperature = self.execute(shared_command(Sht2xI2cMeasureTemperature))
+        humidity = self.execute(shared_command(Sht2xI2cMeasureHumidity))
+        return self._combine_measurement(temperature, humidity)
+
+    def single_shot_measurement_raw(self, buffer=None, offset=0):
+        """
+        Trigger a measurement and read the raw temperature and humidity ticks,
+        without creating response objects. The ticks can be converted later,
+        e.g. in bulk with :py:mod:`~sensirion_i2c_sht.sht2x.conversion`.
+
+        :param buffer:
+            Optional writable sequence, e.g. an :py:class:`array.array` of
+            type ``'H'``, to store the temperature and humidity ticks into
+            instead of returning them. Not supported on multi-channel
+            connections.
+        :param int offset:
+            Index of ``buffer`` where to store the temperature ticks, followed
+            by the humidity ticks.
+        :return:
+            The temperature and humidity ticks, or the index of ``buffer``
+            following the stored ticks if a buffer is passed.
+        :rtype:
+            tuple(int, int) / int
+        :raises ValueError:
+            If a buffer is passed on a multi-channel connection.
+        """
+        self._check_buffer(buffer)
+        temperature = self.execute(
+            get_raw_command(shared_command(Sht2xI2cMeasureTemperature)))
+        humidity = self.execute(
+            get_raw_command(shared_command(Sht2xI2cMeasureHumidity)))
+        return self._store_ticks(
+            self._combine_measurement(temperature, humidity), buffer, offset)
+
+    def single_shot_measurement_multi_channel(self):
+        """
+        Trigger a measurement on all channels of a multi-channel connection
+        and read the results as columns, i.e. as arrays with one item per
+        channel instead of a list of response objects and exceptions. Errors
+        do not raise an exception but are reported per channel. Works on
+        single-channel connections too, returning one channel.
+
+        :return: The ticks, converted values and errors of all channels.
+        :rtype: :py:class:`~sensirion_i2c_sht.multi_channel.MultiChannelResult`
+        """
+        temperature = self._execute_all_channels(
+            get_raw_command(shared_command(Sht2xI2cMeasureTemperature)))
+        humidity = self._execute_all_channels(
+            get_raw_command(shared_command(Sht2xI2cMeasureHumidity)))
+        return MultiChannelResult(
+            [t if isinstance(t, Exception) else
+             rh if isinstance(rh, Exception) else (t, rh)
+             for t, rh in zip(temperature, humidity)], conversion)
+
+    def start_measurement(self):
+        """
+        Trigger a measurement without waiting for its result. The result can
+        be read afterwards with
+        :py:meth:`~sensirion_i2c_sht.device.ShtI2cDeviceBase.read_measurement`
+        (or the :py:meth:`~sensirion_i2c_sht.device.MeasurementHandle.result`
+        method of the returned handle), which allows doing other things while
+        the device is measuring.
+
+        The temperature is measured first. The humidity measurement is
+        started as soon as the temperature was read, i.e. by the
+        :py:meth:`~sensirion_i2c_sht.device.MeasurementHandle.step` or
+        :py:meth:`~sensirion_i2c_sht.device.MeasurementHandle.result` method
+        of the returned handle.
+
+        .. note:: Any other command sent to the device before the result is
+                  read discards the measurement result.
+
+        :return: The handle of the started measurement.
+        :rtype: :py:class:`~sensirion_i2c_sht.device.MeasurementHandle`
+        """
+        return self._start_measurement(
+            shared_command(Sht2xI2cMeasureTemperature),
+            next_commands=[shared_command(Sht2xI2cMeasureHumidity)],
+            finish=self._combine_measurement)
+
+    def _combine_measurement(self, temperature, humidity):
+        """
+        Combine the responses of the temperature and humidity measurement
+        into one result.
+        """
         if self.connection.is_multi_channel:
             result = list()
             for t, rh in zip(temperature, humidity):
@@ -63,7 +149,7 @@ class Sht2xI2cDevice(I2cDevice):
         Perform a soft reset for the device. This can be used to force the
         system into a well-defined state without removing the power supply.
         """
-        return self.execute(Sht2xI2cCmdSoftReset())
+        return self.execute(shared_command(Sht2xI2cCmdSoftReset))
 
     def read_serial_number(self):
         """
@@ -75,6 +161,13 @@ class Sht2xI2cDevice(I2cDevice):
         # read both from otp and metrom
         data_bytes_otp = self.execute(Sht2xI2cCmdReadOtp(0x0F, 4))
         data_words_metrom = self.execute(Sht2xI2cCmdReadMetalRom(2))
+        return self._combine_serial_number(data_bytes_otp, data_words_metrom)
+
+    def _combine_serial_number(self, data_bytes_otp, data_words_metrom):
+        """
+        Combine the data read from the OTP and from the metal ROM into the
+        extended serial number.
+        """
         if self.connection.is_multi_channel:
             serials = list()
             for part1, part2 in zip(data_bytes_otp, data_words_metrom):
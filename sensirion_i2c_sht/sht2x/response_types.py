@@ -2,6 +2,7 @@
 # (c) Copyright 2020 Sensirion AG, Switzerland
 
 from __future__ import absolute_import, division, print_function
+from .conversion import _degrees_celsius, _degrees_fahrenheit, _percent_rh
 
 import logging
 log = logging.getLogger(__name__)
@@ -18,20 +19,40 @@ class Sht2xTemperature(object):
     :param int ticks:
         The read ticks as received from the device.
     """
+    __slots__ = ('ticks', '_degrees_celsius', '_degrees_fahrenheit')
+
     def __init__(self, ticks):
         """
         Creates an instance from the received raw data.
         """
-        super(Sht2xTemperature, self).__init__()
-
         #: The ticks (int) as received from the device.
         self.ticks = ticks
 
-        #: The converted temperature in °C.
-        self.degrees_celsius = -46.85 + 175.72 * ticks / 65535.
+    @property
+    def degrees_celsius(self):
+        """
+        The converted temperature in °C.
+
+        :type: float
+        """
+        try:
+            return self._degrees_celsius
+        except AttributeError:
+            self._degrees_celsius = _degrees_celsius(self.ticks)
+            return self._degrees_celsius
+
+    @property
+    def degrees_fahrenheit(self):
+        """
+        The converted temperature in °F.
 
-        #: The converted temperature in °F.
-        self.degrees_fahrenheit = self.degrees_celsius * 9. / 5. + 32.
+        :type: float
+        """
+        try:
+            return self._degrees_fahrenheit
+        except AttributeError:
+            self._degrees_fahrenheit = _degrees_fahrenheit(self.ticks)
+            return self._degrees_fahrenheit
 
     def __str__(self):
         return '{:0.1f} °C'.format(self.degrees_celsius)
@@ -48,17 +69,27 @@ class Sht2xHumidity(object):
     :param int ticks:
         The read ticks as received from the device.
     """
+    __slots__ = ('ticks', '_percent_rh')
+
     def __init__(self, ticks):
         """
         Creates an instance from the received raw data.
         """
-        super(Sht2xHumidity, self).__init__()
-
         #: The ticks (int) as received from the device.
         self.ticks = ticks
 
-        #: The converted humidity in %RH.
-        self.percent_rh = -6. + 125. * ticks / 65535.
+    @property
+    def percent_rh(self):
+        """
+        The converted humidity in %RH.
+
+        :type: float
+        """
+        try:
+            return self._percent_rh
+        except AttributeError:
+            self._percent_rh = _percent_rh(self.ticks)
+            return self._percent_rh
 
     def __str__(self):
         return '{:0.1f} %RH'.format(self.percent_rh)
@@ -4,6 +4,7 @@
 from __future__ import absolute_import, division, print_function
 from .device import Sht3xI2cDevice  # noqa: F401
 from .data_types import Sht3xRepeatability  # noqa: F401
+from .data_types import Sht3xMeasurementFrequency  # noqa: F401
 from .response_types import Sht3xTemperature  # noqa: F401
 from .response_types import Sht3xHumidity  # noqa: F401
 from .response_types import Sht3xStatusRegister  # noqa: F401
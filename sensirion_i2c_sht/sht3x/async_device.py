@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from ..async_device import AsyncShtI2cDeviceBase
+from ..commands import shared_command
+from .commands import Sht3xI2cCmdEnableART, Sht3xI2cCmdHeaterOn, \
+    Sht3xI2cCmdHeaterOff, Sht3xI2cCmdReadStatusRegister, \
+    Sht3xI2cCmdResetStatusRegister, Sht3xI2cCmdSoftReset, \
+    Sht3xI2cCmdReadSerial, Sht3xI2cCmdFetchData, Sht3xI2cCmdBreak
+from .data_types import Sht3xRepeatability, Sht3xMeasurementFrequency
+from .device import Sht3xI2cDevice
+
+
+class AsyncSht3xI2cDevice(AsyncShtI2cDeviceBase):
+    """
+    SHT3x I²C device class to allow executing I²C commands with asyncio.
+
+    See :py:class:`~sensirion_i2c_sht.async_device.AsyncShtI2cDeviceBase` for
+    details.
+    """
+
+    def __init__(self, connection, slave_address=0x44, executor=None):
+        """
+        Constructs a new asynchronous SHT3x I²C device.
+
+        :param ~sensirion_i2c_driver.connection.I2cConnection connection:
+            The I²C connection to use for communication.
+        :param byte slave_address:
+            The I²C slave address, defaults to 0x44.
+        :param ~concurrent.futures.Executor executor:
+            The executor to run the bus transfers in. If None, the default
+            executor of the event loop is used.
+        """
+        super(AsyncSht3xI2cDevice, self).__init__(
+            Sht3xI2cDevice(connection, slave_address), executor)
+
+    async def single_shot_measurement(
+            self, repeatability=Sht3xRepeatability.HIGH,
+            clock_stretching=False):
+        """
+        Trigger a measurement and read the temperature and humidity.
+
+        See :py:meth:`~sensirion_i2c_sht.sht3x.device.Sht3xI2cDevice.single_shot_measurement`.
+
+        .. note:: With clock stretching enabled, the measurement duration is
+                  spent in the bus transfer, i.e. in the executor.
+        """  # noqa: E501
+        return await self.execute(self.device._single_shot_command(
+            repeatability, clock_stretching))
+
+    async def single_shot_measurement_raw(
+            self, repeatability=Sht3xRepeatability.HIGH,
+            clock_stretching=False, buffer=None, offset=0):
+        """
+        Trigger a measurement and read the raw temperature and humidity ticks.
+
+        See :py:meth:`~sensirion_i2c_sht.sht3x.device.Sht3xI2cDevice.single_shot_measurement_raw`.
+        """  # noqa: E501
+        return await self._execute_raw(
+            self.device._single_shot_command(repeatability, clock_stretching), buffer, offset)
+
+    async def start_periodic_measurement(
+            self, frequency=Sht3xMeasurementFrequency.MPS_1,
+            repeatability=Sht3xRepeatability.HIGH):
+        """
+        Start the periodic data acquisition mode.
+
+        See :py:meth:`~sensirion_i2c_sht.sht3x.device.Sht3xI2cDevice.start_periodic_measurement`.
+        """  # noqa: E501
+        return await self.execute(
+            self.device._periodic_command(frequency, repeatability))
+
+    async def fetch_data(self):
+        """
+        Read the latest result of the periodic data acquisition mode.
+
+        See :py:meth:`~sensirion_i2c_sht.sht3x.device.Sht3xI2cDevice.fetch_data`.
+        """  # noqa: E501
+        return await self.execute(shared_command(Sht3xI2cCmdFetchData))
+
+    async def fetch_data_raw(self, buffer=None, offset=0):
+        """
+        Read the latest result of the periodic data acquisition mode as raw
+        ticks.
+
+        See :py:meth:`~sensirion_i2c_sht.sht3x.device.Sht3xI2cDevice.fetch_data_raw`.
+        """  # noqa: E501
+        return await self._execute_raw(shared_command(Sht3xI2cCmdFetchData),
+                                       buffer, offset)
+
+    async def stop_periodic_measurement(self):
+        """
+        Stop the periodic data acquisition mode.
+
+        See :py:meth:`~sensirion_i2c_sht.sht3x.device.Sht3xI2cDevice.stop_periodic_measurement`.
+        """  # noqa: E501
+        return await self.execute(shared_command(Sht3xI2cCmdBreak))
+
+    async def art_enable(self):
+        """
+        Enable the ART (accelerated response time
+        """
+        return await self.execute(shared_command(Sht3xI2cCmdEnableART))
+
+    async def heater_on(self):
+        """
+        Switch on the internal heater.
+        """
+        return await self.execute(shared_command(Sht3xI2cCmdHeaterOn))
+
+    async def heater_off(self):
+        """
+        Switch off the internal heater.
+        """
+        return await self.execute(shared_command(Sht3xI2cCmdHeaterOff))
+
+    async def read_status_register(self):
+        """
+        Read out the status register.
+
+        :return: The status register.
+        :rtype: :py:class:`~sensirion_i2c_sht.sht3x.response_types.Sht3xStatusRegister`
+        """  # noqa: E501
+        return await self.execute(
+            shared_command(Sht3xI2cCmdReadStatusRegister))
+
+    async def clear_status_register(self):
+        """
+        Clear the status register. All flags (Bit 15, 11, 10, 4) in the status
+        register can be cleared (set to zero).
+        """
+        return await self.execute(
+            shared_command(Sht3xI2cCmdResetStatusRegister))
+
+    async def soft_reset(self):
+        """
+        Perform a soft reset for the device.
+
+        See :py:meth:`~sensirion_i2c_sht.sht3x.device.Sht3xI2cDevice.soft_reset`.
+        """  # noqa: E501
+        return await self.execute(shared_command(Sht3xI2cCmdSoftReset))
+
+    async def read_serial_number(self):
+        """
+        Read the serial number from the device.
+
+        :return: The serial number.
+        :rtype: int
+        """
+        return await self.execute(shared_command(Sht3xI2cCmdReadSerial))
@@ -2,7 +2,8 @@
 # (c) Copyright 2020 Sensirion AG, Switzerland
 
 from __future__ import absolute_import, division, print_function
-from sensirion_i2c_driver import SensirionI2cCommand, CrcCalculator
+from sensirion_i2c_driver import SensirionI2cCommand
+from ..crc import CRC8_INIT_FF
 from .response_types import Sht3xTemperature, Sht3xHumidity, \
     Sht3xStatusRegister
 from struct import unpack
@@ -13,7 +14,7 @@ class Sht3xI2cCmdBase(SensirionI2cCommand):
     SHT3x I²C base command.
     """
     def __init__(self, command, tx_data, rx_length, read_delay, timeout,
-                 post_processing_time=0.0):
+                 post_processing_time=0.0, typical_read_delay=None):
         """
         Constructs a new SHT3x I²C command.
 
@@ -49,6 +50,10 @@ class Sht3xI2cCmdBase(SensirionI2cCommand):
             example after a device reset command, the device might need some
             time until it is ready again. Usually this is 0.0s, i.e. no post
             processing is needed.
+        :param float typical_read_delay:
+            Typical duration (in Seconds) the device needs to prepare the RX
+            data. Used as first read attempt if ready polling is enabled. None
+            means that the command does not support ready polling.
         """
         super(Sht3xI2cCmdBase, self).__init__(
             command=command,
@@ -56,18 +61,38 @@ class Sht3xI2cCmdBase(SensirionI2cCommand):
             rx_length=rx_length,
             read_delay=read_delay,
             timeout=timeout,
-            crc=CrcCalculator(8, 0x31, 0xFF),
+            crc=CRC8_INIT_FF,
             command_bytes=2,
             post_processing_time=post_processing_time,
         )
 
+        #: Typical delay in Seconds between write and read operation
+        #: (float/None).
+        self.typical_read_delay = typical_read_delay
+
+    def interpret_response(self, data):
+        """
+        Validates the CRCs of the received data from the device and returns
+        the data with all CRCs removed.
+
+        :param bytes data:
+            Received raw bytes from the read operation.
+        :return:
+            The received bytes, or None if there is no data received.
+        :rtype:
+            bytes or None
+        :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
+            If a received CRC was wrong.
+        """
+        return self._crc.verify_words(data)
+
 
 class Sht3xI2cCmdMeasBase(Sht3xI2cCmdBase):
     """
-    Base SHT3x command for a single shot measurement with clock stretching
-    disabled.
+    Base SHT3x command for a single shot measurement.
     """
-    def __init__(self, command, read_delay):
+    def __init__(self, command, read_delay, timeout=0.,
+                 typical_read_delay=None):
         """
         Constructs a new command.
 
@@ -81,13 +106,20 @@ class Sht3xI2cCmdMeasBase(Sht3xI2cCmdBase):
             if the device needs some time to prepare the RX data, e.g. if it
             has to perform a measurement. Set to 0.0 to indicate that no delay
             is needed, i.e. the device does not need any processing time.
+        :param float timeout:
+            Timeout (in Seconds) to be used in case of clock stretching. Set
+            to 0.0 (the default) for commands with clock stretching disabled.
+        :param float typical_read_delay:
+            Typical duration (in Seconds) of the measurement, or None if ready
+            polling is not supported.
         """
         super(Sht3xI2cCmdMeasBase, self).__init__(
             command=command,
             tx_data=b'',
             rx_length=6,
             read_delay=read_delay,
-            timeout=0.,
+            timeout=timeout,
+            typical_read_delay=typical_read_delay,
         )
 
     def interpret_response(self, data):
@@ -106,11 +138,23 @@ class Sht3xI2cCmdMeasBase(Sht3xI2cCmdBase):
         :rtype:
             tuple
         """  # noqa: E501
-        checked_data = SensirionI2cCommand.interpret_response(self, data)
-        temperature_ticks, humidity_ticks = unpack(">2H", checked_data)
+        temperature_ticks, humidity_ticks = self.interpret_ticks(data)
         return Sht3xTemperature(temperature_ticks), \
             Sht3xHumidity(humidity_ticks)
 
+    def interpret_ticks(self, data):
+        """
+        Converts the raw response from the device to the raw ticks, without
+        creating response objects.
+
+        :param bytes data:
+            Received raw bytes from the read operation.
+        :return: The temperature ticks and the humidity ticks.
+        :rtype: tuple(int, int)
+        """
+        checked_data = Sht3xI2cCmdBase.interpret_response(self, data)
+        return unpack(">2H", checked_data)
+
 
 class Sht3xI2cCmdMeasHighRes(Sht3xI2cCmdMeasBase):
     """
@@ -124,6 +168,7 @@ class Sht3xI2cCmdMeasHighRes(Sht3xI2cCmdMeasBase):
         super(Sht3xI2cCmdMeasHighRes, self).__init__(
             command=0x2400,
             read_delay=0.02,
+            typical_read_delay=0.0125,
         )
 
 
@@ -139,6 +184,7 @@ class Sht3xI2cCmdMeasMediumRes(Sht3xI2cCmdMeasBase):
         super(Sht3xI2cCmdMeasMediumRes, self).__init__(
             command=0x240B,
             read_delay=0.01,
+            typical_read_delay=0.0045,
         )
 
 
@@ -154,6 +200,322 @@ class Sht3xI2cCmdMeasLowRes(Sht3xI2cCmdMeasBase):
         super(Sht3xI2cCmdMeasLowRes, self).__init__(
             command=0x2416,
             read_delay=0.005,
+            typical_read_delay=0.0025,
+        )
+
+
+class Sht3xI2cCmdMeasHighResClockStretching(Sht3xI2cCmdMeasBase):
+    """
+    SHT3x command for a single shot measurement with high repeatability and
+    clock stretching enabled.
+    """
+    def __init__(self):
+        """
+        Constructs a new command.
+        """
+        super(Sht3xI2cCmdMeasHighResClockStretching, self).__init__(
+            command=0x2C06,
+            read_delay=0.,
+            timeout=0.02,
+        )
+
+
+class Sht3xI2cCmdMeasMediumResClockStretching(Sht3xI2cCmdMeasBase):
+    """
+    SHT3x command for a single shot measurement with medium repeatability and
+    clock stretching enabled.
+    """
+    def __init__(self):
+        """
+        Constructs a new command.
+        """
+        super(Sht3xI2cCmdMeasMediumResClockStretching, self).__init__(
+            command=0x2C0D,
+            read_delay=0.,
+            timeout=0.01,
+        )
+
+
+class Sht3xI2cCmdMeasLowResClockStretching(Sht3xI2cCmdMeasBase):
+    """
+    SHT3x command for a single shot measurement with low repeatability and
+    clock stretching enabled.
+    """
+    def __init__(self):
+        """
+        Constructs a new command.
+        """
+        super(Sht3xI2cCmdMeasLowResClockStretching, self).__init__(
+            command=0x2C10,
+            read_delay=0.,
+            timeout=0.005,
+        )
+
+
+class Sht3xI2cCmdPeriodicBase(Sht3xI2cCmdBase):
+    """
+    Base SHT3x command to start the periodic data acquisition mode.
+    """
+    def __init__(self, command):
+        """
+        Constructs a new command.
+
+        :param int command:
+            The command word to be sent to the device.
+        """
+        super(Sht3xI2cCmdPeriodicBase, self).__init__(
+            command=command,
+            tx_data=b'',
+            rx_length=None,
+            read_delay=0.,
+            timeout=0.,
+        )
+
+
+class Sht3xI2cCmdPeriodic05MpsHighRes(Sht3xI2cCmdPeriodicBase):
+    """
+    SHT3x command to start the periodic data acquisition mode with 0.5
+    measurements per second and high repeatability.
+    """
+    def __init__(self):
+        """
+        Constructs a new command.
+        """
+        super(Sht3xI2cCmdPeriodic05MpsHighRes, self).__init__(
+            command=0x2032,
+        )
+
+
+class Sht3xI2cCmdPeriodic05MpsMediumRes(Sht3xI2cCmdPeriodicBase):
+    """
+    SHT3x command to start the periodic data acquisition mode with 0.5
+    measurements per second and medium repeatability.
+    """
+    def __init__(self):
+        """
+        Constructs a new command.
+        """
+        super(Sht3xI2cCmdPeriodic05MpsMediumRes, self).__init__(
+            command=0x2024,
+        )
+
+
+class Sht3xI2cCmdPeriodic05MpsLowRes(Sht3xI2cCmdPeriodicBase):
+    """
+    SHT3x command to start the periodic data acquisition mode with 0.5
+    measurements per second and low repeatability.
+    """
+    def __init__(self):
+        """
+        Constructs a new command.
+        """
+        super(Sht3xI2cCmdPeriodic05MpsLowRes, self).__init__(
+            command=0x202F,
+        )
+
+
+class Sht3xI2cCmdPeriodic1MpsHighRes(Sht3xI2cCmdPeriodicBase):
+    """
+    SHT3x command to start the periodic data acquisition mode with 1
+    measurements per second and high repeatability.
+    """
+    def __init__(self):
+        """
+        Constructs a new command.
+        """
+        super(Sht3xI2cCmdPeriodic1MpsHighRes, self).__init__(
+            command=0x2130,
+        )
+
+
+class Sht3xI2cCmdPeriodic1MpsMediumRes(Sht3xI2cCmdPeriodicBase):
+    """
+    SHT3x command to start the periodic data acquisition mode with 1
+    measurements per second and medium repeatability.
+    """
+    def __init__(self):
+        """
+        Constructs a new command.
+        """
+        super(Sht3xI2cCmdPeriodic1MpsMediumRes, self).__init__(
+            command=0x2126,
+        )
+
+
+class Sht3xI2cCmdPeriodic1MpsLowRes(Sht3xI2cCmdPeriodicBase):
+    """
+    SHT3x command to start the periodic data acquisition mode with 1
+    measurements per second and low repeatability.
+    """
+    def __init__(self):
+        """
+        Constructs a new command.
+        """
+        super(Sht3xI2cCmdPeriodic1MpsLowRes, self).__init__(
+            command=0x212D,
+        )
+
+
+class Sht3xI2cCmdPeriodic2MpsHighRes(Sht3xI2cCmdPeriodicBase):
+    """
+    SHT3x command to start the periodic data acquisition mode with 2
+    measurements per second and high repeatability.
+    """
+    def __init__(self):
+        """
+        Constructs a new command.
+        """
+        super(Sht3xI2cCmdPeriodic2MpsHighRes, self).__init__(
+            command=0x2236,
+        )
+
+
+class Sht3xI2cCmdPeriodic2MpsMediumRes(Sht3xI2cCmdPeriodicBase):
+    """
+    SHT3x command to start the periodic data acquisition mode with 2
+    measurements per second and medium repeatability.
+    """
+    def __init__(self):
+        """
+        Constructs a new command.
+        """
+        super(Sht3xI2cCmdPeriodic2MpsMediumRes, self).__init__(
+            command=0x2220,
+        )
+
+
+class Sht3xI2cCmdPeriodic2MpsLowRes(Sht3xI2cCmdPeriodicBase):
+    """
+    SHT3x command to start the periodic data acquisition mode with 2
+    measurements per second and low repeatability.
+    """
+    def __init__(self):
+        """
+        Constructs a new command.
+        """
+        super(Sht3xI2cCmdPeriodic2MpsLowRes, self).__init__(
+            command=0x222B,
+        )
+
+
+class Sht3xI2cCmdPeriodic4MpsHighRes(Sht3xI2cCmdPeriodicBase):
+    """
+    SHT3x command to start the periodic data acquisition mode with 4
+    measurements per second and high repeatability.
+    """
+    def __init__(self):
+        """
+        Constructs a new command.
+        """
+        super(Sht3xI2cCmdPeriodic4MpsHighRes, self).__init__(
+            command=0x2334,
+        )
+
+
+class Sht3xI2cCmdPeriodic4MpsMediumRes(Sht3xI2cCmdPeriodicBase):
+    """
+    SHT3x command to start the periodic data acquisition mode with 4
+    measurements per second and medium repeatability.
+    """
+    def __init__(self):
+        """
+        Constructs a new command.
+        """
+        super(Sht3xI2cCmdPeriodic4MpsMediumRes, self).__init__(
+            command=0x2322,
+        )
+
+
+class Sht3xI2cCmdPeriodic4MpsLowRes(Sht3xI2cCmdPeriodicBase):
+    """
+    SHT3x command to start the periodic data acquisition mode with 4
+    measurements per second and low repeatability.
+    """
+    def __init__(self):
+        """
+        Constructs a new command.
+        """
+        super(Sht3xI2cCmdPeriodic4MpsLowRes, self).__init__(
+            command=0x2329,
+        )
+
+
+class Sht3xI2cCmdPeriodic10MpsHighRes(Sht3xI2cCmdPeriodicBase):
+    """
+    SHT3x command to start the periodic data acquisition mode with 10
+    measurements per second and high repeatability.
+    """
+    def __init__(self):
+        """
+        Constructs a new command.
+        """
+        super(Sht3xI2cCmdPeriodic10MpsHighRes, self).__init__(
+            command=0x2737,
+        )
+
+
+class Sht3xI2cCmdPeriodic10MpsMediumRes(Sht3xI2cCmdPeriodicBase):
+    """
+    SHT3x command to start the periodic data acquisition mode with 10
+    measurements per second and medium repeatability.
+    """
+    def __init__(self):
+        """
+        Constructs a new command.
+        """
+        super(Sht3xI2cCmdPeriodic10MpsMediumRes, self).__init__(
+            command=0x2721,
+        )
+
+
+class Sht3xI2cCmdPeriodic10MpsLowRes(Sht3xI2cCmdPeriodicBase):
+    """
+    SHT3x command to start the periodic data acquisition mode with 10
+    measurements per second and low repeatability.
+    """
+    def __init__(self):
+        """
+        Constructs a new command.
+        """
+        super(Sht3xI2cCmdPeriodic10MpsLowRes, self).__init__(
+            command=0x272A,
+        )
+
+
+class Sht3xI2cCmdFetchData(Sht3xI2cCmdMeasBase):
+    """
+    SHT3x command to fetch the latest measurement result of the periodic data
+    acquisition mode.
+
+    .. note:: If no new measurement result is available, the device does not
+              acknowledge the read header.
+    """
+    def __init__(self):
+        """
+        Constructs a new command.
+        """
+        super(Sht3xI2cCmdFetchData, self).__init__(
+            command=0xE000,
+            read_delay=0.,
+        )
+
+
+class Sht3xI2cCmdBreak(Sht3xI2cCmdBase):
+    """
+    SHT3x command to stop the periodic data acquisition mode and return to the
+    single shot mode.
+    """
+    def __init__(self):
+        """
+        Constructs a new command.
+        """
+        super(Sht3xI2cCmdBreak, self).__init__(
+            command=0x3093,
+            tx_data=b'',
+            rx_length=None,
+            read_delay=0.,
+            timeout=0.,
+            post_processing_time=0.001,
         )
 
 
@@ -190,6 +552,10 @@ class Sht3xI2cCmdHeaterOn(Sht3xI2cCmdBase):
             timeout=0.,
         )
 
+        #: Duration in Seconds the heater is activated for (float/None). None
+        #: means until it is disabled with :py:class:`Sht3xI2cCmdHeaterOff`.
+        self.heater_duration = None
+
 
 class Sht3xI2cCmdHeaterOff(Sht3xI2cCmdBase):
     """
@@ -251,7 +617,7 @@ class Sht3xI2cCmdReadStatusRegister(Sht3xI2cCmdBase):
         :return: The status register.
         :rtype: :py:class:`~sensirion_i2c_sht.sht3x.response_types.Sht3xStatusRegister`
         """  # noqa: E501
-        checked_data = SensirionI2cCommand.interpret_response(self, data)
+        checked_data = Sht3xI2cCmdBase.interpret_response(self, data)
         return Sht3xStatusRegister(unpack(">H", checked_data)[0])
 
 
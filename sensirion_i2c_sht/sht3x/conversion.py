@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from ..conversion import convert_ticks
+
+
+def _degrees_celsius(ticks):
+    return -45. + 175. * ticks / 65535.
+
+
+def _degrees_fahrenheit(ticks):
+    return -49. + 315. * ticks / 65535.
+
+
+def _percent_rh(ticks):
+    return 100. * ticks / 65535.
+
+
+def ticks_to_degrees_celsius(ticks):
+    """
+    Convert many temperature ticks to °C at once, with the same formula as
+    :py:attr:`~sensirion_i2c_sht.sht3x.response_types.Sht3xTemperature.degrees_celsius`.
+
+    :param iterable ticks:
+        The raw ticks, e.g. a :py:class:`numpy.ndarray` or an
+        :py:class:`array.array` of type ``'H'``.
+    :return: The converted temperatures, see
+        :py:func:`~sensirion_i2c_sht.conversion.convert_ticks`.
+    :rtype: numpy.ndarray / array.array
+    """  # noqa: E501
+    return convert_ticks(ticks, _degrees_celsius)
+
+
+def ticks_to_degrees_fahrenheit(ticks):
+    """
+    Convert many temperature ticks to °F at once, with the same formula as
+    :py:attr:`~sensirion_i2c_sht.sht3x.response_types.Sht3xTemperature.degrees_fahrenheit`.
+
+    :param iterable ticks:
+        The raw ticks, e.g. a :py:class:`numpy.ndarray` or an
+        :py:class:`array.array` of type ``'H'``.
+    :return: The converted temperatures, see
+        :py:func:`~sensirion_i2c_sht.conversion.convert_ticks`.
+    :rtype: numpy.ndarray / array.array
+    """  # noqa: E501
+    return convert_ticks(ticks, _degrees_fahrenheit)
+
+
+def ticks_to_percent_rh(ticks):
+    """
+    Convert many humidity ticks to %RH at once, with the same formula as
+    :py:attr:`~sensirion_i2c_sht.sht3x.response_types.Sht3xHumidity.percent_rh`.
+
+    :param iterable ticks:
+        The raw ticks, e.g. a :py:class:`numpy.ndarray` or an
+        :py:class:`array.array` of type ``'H'``.
+    :return: The converted humidities, see
+        :py:func:`~sensirion_i2c_sht.conversion.convert_ticks`.
+    :rtype: numpy.ndarray / array.array
+    """  # noqa: E501
+    return convert_ticks(ticks, _percent_rh)
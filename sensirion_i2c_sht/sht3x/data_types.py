@@ -20,3 +20,19 @@ class Sht3xRepeatability(IntEnum):
     HIGH = 1    #: High repeatability
     MEDIUM = 2  #: Medium repeatability
     LOW = 3     #: Low repeatability
+
+
+class Sht3xMeasurementFrequency(IntEnum):
+    """
+    An enum containing all available measurement frequencies for the periodic
+    data acquisition mode.
+
+    .. note: The measurement frequency influences the overall energy
+             consumption of the sensor. Check the datasheet for further
+             information.
+    """
+    MPS_0_5 = 1  #: 0.5 measurements per second
+    MPS_1 = 2    #: 1 measurement per second
+    MPS_2 = 3    #: 2 measurements per second
+    MPS_4 = 4    #: 4 measurements per second
+    MPS_10 = 5   #: 10 measurements per second
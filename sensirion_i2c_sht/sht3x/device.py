@@ -2,19 +2,34 @@
 # (c) Copyright 2020 Sensirion AG, Switzerland
 
 from __future__ import absolute_import, division, print_function
-from sensirion_i2c_driver import I2cDevice
+from ..commands import shared_command
+from ..device import ShtI2cDeviceBase
+from . import conversion
 from .commands import Sht3xI2cCmdMeasHighRes, Sht3xI2cCmdMeasMediumRes, \
     Sht3xI2cCmdMeasLowRes, Sht3xI2cCmdEnableART, Sht3xI2cCmdHeaterOn, Sht3xI2cCmdHeaterOff, \
     Sht3xI2cCmdReadStatusRegister, Sht3xI2cCmdResetStatusRegister, \
-    Sht3xI2cCmdSoftReset, Sht3xI2cCmdReadSerial
-from .data_types import Sht3xRepeatability
+    Sht3xI2cCmdSoftReset, Sht3xI2cCmdReadSerial, \
+    Sht3xI2cCmdPeriodic05MpsHighRes, Sht3xI2cCmdPeriodic05MpsMediumRes, \
+    Sht3xI2cCmdPeriodic05MpsLowRes, Sht3xI2cCmdPeriodic1MpsHighRes, \
+    Sht3xI2cCmdPeriodic1MpsMediumRes, Sht3xI2cCmdPeriodic1MpsLowRes, \
+    Sht3xI2cCmdPeriodic2MpsHighRes, Sht3xI2cCmdPeriodic2MpsMediumRes, \
+    Sht3xI2cCmdPeriodic2MpsLowRes, Sht3xI2cCmdPeriodic4MpsHighRes, \
+    Sht3xI2cCmdPeriodic4MpsMediumRes, Sht3xI2cCmdPeriodic4MpsLowRes, \
+    Sht3xI2cCmdPeriodic10MpsHighRes, Sht3xI2cCmdPeriodic10MpsMediumRes, \
+    Sht3xI2cCmdPeriodic10MpsLowRes, Sht3xI2cCmdFetchData, Sht3xI2cCmdBreak, \
+    Sht3xI2cCmdMeasHighResClockStretching, \
+    Sht3xI2cCmdMeasMediumResClockStretching, \
+    Sht3xI2cCmdMeasLowResClockStretching
+from .data_types import Sht3xRepeatability, Sht3xMeasurementFrequency
 
 
-class Sht3xI2cDevice(I2cDevice):
+class Sht3xI2cDevice(ShtI2cDeviceBase):
     """
     SHT3x I²C device class to allow executing I²C commands.
     """
 
+    _pre_trigger_supported = True
+
     def __init__(self, connection, slave_address=0x44):
         """
         Constructs a new SHT3x I²C device.
@@ -26,14 +41,143 @@ class Sht3xI2cDevice(I2cDevice):
         """
         super(Sht3xI2cDevice, self).__init__(connection, slave_address)
 
-    def single_shot_measurement(self, repeatability=Sht3xRepeatability.HIGH):
+    def single_shot_measurement(self, repeatability=Sht3xRepeatability.HIGH,
+                                clock_stretching=False):
         """
         Trigger a measurement and read the temperature and humidity.
 
+        :param `~sensirion_i2c_sht.sht3x.data_types.Sht3xRepeatability` repeatability:
+            Configure the repeatability setting.
+        :param bool clock_stretching:
+            If ``True``, the device holds the clock line low until the
+            measurement is finished. The result is then read as soon as it is
+            available instead of after the maximum measurement duration. This
+            requires an I²C transceiver which supports clock stretching.
+        :raises ValueError:
+            If the passed repeatability is not valid.
+        :return:
+            The measured temperature and humidity.
+
+            - temperature (:py:class:`~sensirion_i2c_sht.sht3x.response_types.Sht3xTemperature`) -
+              Temperature response object.
+            - humidity (:py:class:`~sensirion_i2c_sht.sht3x.response_types.Sht3xHumidity`) -
+              Humidity response object.
+        :rtype:
+            tuple
+        """  # noqa: E501
+        return self._measure(
+            self._single_shot_command(repeatability, clock_stretching))
+
+    def single_shot_measurement_raw(
+            self, repeatability=Sht3xRepeatability.HIGH,
+            clock_stretching=False, buffer=None, offset=0):
+        """
+        Trigger a measurement and read the raw temperature and humidity ticks,
+        without creating response objects. The ticks can be converted later,
+        e.g. in bulk with :py:mod:`~sensirion_i2c_sht.sht3x.conversion`.
+
+        :param `~sensirion_i2c_sht.sht3x.data_types.Sht3xRepeatability` repeatability:
+            Configure the repeatability setting.
+        :param bool clock_stretching:
+            See :py:meth:`single_shot_measurement`.
+        :param buffer:
+            Optional writable sequence, e.g. an :py:class:`array.array` of
+            type ``'H'``, to store the temperature and humidity ticks into
+            instead of returning them. Not supported on multi-channel
+            connections.
+        :param int offset:
+            Index of ``buffer`` where to store the temperature ticks, followed
+            by the humidity ticks.
+        :return:
+            The temperature and humidity ticks, or the index of ``buffer``
+            following the stored ticks if a buffer is passed.
+        :rtype:
+            tuple(int, int) / int
+        :raises ValueError:
+            If the passed parameters are not valid.
+        """  # noqa: E501
+        return self._execute_raw(
+            self._single_shot_command(repeatability, clock_stretching),
+            buffer, offset)
+
+    def single_shot_measurement_multi_channel(
+            self, repeatability=Sht3xRepeatability.HIGH,
+            clock_stretching=False):
+        """
+        Trigger a measurement on all channels of a multi-channel connection
+        and read the results as columns, i.e. as arrays with one item per
+        channel instead of a list of response objects and exceptions. Errors
+        do not raise an exception but are reported per channel. Works on
+        single-channel connections too, returning one channel.
+
+        :param `~sensirion_i2c_sht.sht3x.data_types.Sht3xRepeatability` repeatability:
+            Configure the repeatability setting.
+        :param bool clock_stretching:
+            See :py:meth:`single_shot_measurement`.
+        :return: The ticks, converted values and errors of all channels.
+        :rtype: :py:class:`~sensirion_i2c_sht.multi_channel.MultiChannelResult`
+        :raises ValueError:
+            If the passed parameters are not valid.
+        """  # noqa: E501
+        return self._execute_multi_channel(
+            self._single_shot_command(repeatability, clock_stretching),
+            conversion)
+
+    def start_measurement(self, repeatability=Sht3xRepeatability.HIGH):
+        """
+        Trigger a measurement without waiting for its result. The result can
+        be read afterwards with
+        :py:meth:`~sensirion_i2c_sht.device.ShtI2cDeviceBase.read_measurement`
+        (or the :py:meth:`~sensirion_i2c_sht.device.MeasurementHandle.result`
+        method of the returned handle), which allows doing other things while
+        the device is measuring.
+
+        .. note:: Any other command sent to the device before the result is
+                  read discards the measurement result.
+
         :param `~sensirion_i2c_sht.sht3x.data_types.Sht3xRepeatability` repeatability:
             Configure the repeatability setting.
         :raises ValueError:
             If the passed repeatability is not valid.
+        :return: The handle of the started measurement.
+        :rtype: :py:class:`~sensirion_i2c_sht.device.MeasurementHandle`
+        """  # noqa: E501
+        return self._start_measurement(
+            self._single_shot_command(repeatability))
+
+    def start_periodic_measurement(
+            self, frequency=Sht3xMeasurementFrequency.MPS_1,
+            repeatability=Sht3xRepeatability.HIGH):
+        """
+        Start the periodic data acquisition mode. In this mode the device
+        measures continuously with the given frequency, and the latest result
+        can be read with :py:meth:`fetch_data` without waiting for a
+        measurement to complete.
+
+        .. note:: While the periodic data acquisition mode is running, the
+                  device only accepts :py:meth:`fetch_data`,
+                  :py:meth:`stop_periodic_measurement`, :py:meth:`soft_reset`
+                  and the heater and status register commands.
+
+        :param `~sensirion_i2c_sht.sht3x.data_types.Sht3xMeasurementFrequency` frequency:
+            Configure the measurement frequency.
+        :param `~sensirion_i2c_sht.sht3x.data_types.Sht3xRepeatability` repeatability:
+            Configure the repeatability setting.
+        :raises ValueError:
+            If the passed parameters are not valid.
+        """  # noqa: E501
+        return self.execute(
+            self._periodic_command(frequency, repeatability))
+
+    def fetch_data(self):
+        """
+        Read the latest result of the periodic data acquisition mode.
+
+        .. note:: Each result can only be read once. If no new result is
+                  available, the device does not acknowledge the read header
+                  and an :py:class:`~sensirion_i2c_driver.errors.I2cNackError`
+                  is raised.
+
         :return:
             The measured temperature and humidity.
 
@@ -44,33 +188,146 @@ class Sht3xI2cDevice(I2cDevice):
         :rtype:
             tuple
         """  # noqa: E501
-        if repeatability == Sht3xRepeatability.HIGH:
-            result = self.execute(Sht3xI2cCmdMeasHighRes())
-        elif repeatability == Sht3xRepeatability.MEDIUM:
-            result = self.execute(Sht3xI2cCmdMeasMediumRes())
-        elif repeatability == Sht3xRepeatability.LOW:
-            result = self.execute(Sht3xI2cCmdMeasLowRes())
+        return self.execute(shared_command(Sht3xI2cCmdFetchData))
+
+    def fetch_data_raw(self, buffer=None, offset=0):
+        """
+        Read the latest result of the periodic data acquisition mode as raw
+        ticks, without creating response objects. See :py:meth:`fetch_data`.
+
+        :param buffer:
+            Optional writable sequence, e.g. an :py:class:`array.array` of
+            type ``'H'``, to store the temperature and humidity ticks into
+            instead of returning them. Not supported on multi-channel
+            connections.
+        :param int offset:
+            Index of ``buffer`` where to store the temperature ticks, followed
+            by the humidity ticks.
+        :return:
+            The temperature and humidity ticks, or the index of ``buffer``
+            following the stored ticks if a buffer is passed.
+        :rtype:
+            tuple(int, int) / int
+        """
+        return self._execute_raw(shared_command(Sht3xI2cCmdFetchData),
+                                 buffer, offset)
+
+    def fetch_data_multi_channel(self):
+        """
+        Read the latest result of the periodic data acquisition mode of all
+        channels of a multi-channel connection as columns. See
+        :py:meth:`fetch_data` and
+        :py:meth:`single_shot_measurement_multi_channel`.
+
+        :return: The ticks, converted values and errors of all channels.
+        :rtype: :py:class:`~sensirion_i2c_sht.multi_channel.MultiChannelResult`
+        """
+        return self._execute_multi_channel(
+            shared_command(Sht3xI2cCmdFetchData), conversion)
+
+    def stop_periodic_measurement(self):
+        """
+        Stop the periodic data acquisition mode (also the one started with
+        :py:meth:`art_enable`) and return to the single shot mode.
+        """
+        return self.execute(shared_command(Sht3xI2cCmdBreak))
+
+    def _single_shot_command(self, repeatability, clock_stretching=False):
+        """
+        Get the single shot measurement command for the given settings.
+        """
+        if clock_stretching:
+            if repeatability == Sht3xRepeatability.HIGH:
+                command = shared_command(Sht3xI2cCmdMeasHighResClockStretching)
+            elif repeatability == Sht3xRepeatability.MEDIUM:
+                command = shared_command(
+                    Sht3xI2cCmdMeasMediumResClockStretching)
+            elif repeatability == Sht3xRepeatability.LOW:
+                command = shared_command(Sht3xI2cCmdMeasLowResClockStretching)
+            else:
+                raise ValueError('Unknown argument for repeatability.')
+        else:
+            if repeatability == Sht3xRepeatability.HIGH:
+                command = shared_command(Sht3xI2cCmdMeasHighRes)
+            elif repeatability == Sht3xRepeatability.MEDIUM:
+                command = shared_command(Sht3xI2cCmdMeasMediumRes)
+            elif repeatability == Sht3xRepeatability.LOW:
+                command = shared_command(Sht3xI2cCmdMeasLowRes)
+            else:
+                raise ValueError('Unknown argument for repeatability.')
+        return command
+
+    def _periodic_command(self, frequency, repeatability):
+        """
+        Get the command to start the periodic measurement with the given
+        settings.
+        """
+        if frequency == Sht3xMeasurementFrequency.MPS_0_5:
+            if repeatability == Sht3xRepeatability.HIGH:
+                command = shared_command(Sht3xI2cCmdPeriodic05MpsHighRes)
+            elif repeatability == Sht3xRepeatability.MEDIUM:
+                command = shared_command(Sht3xI2cCmdPeriodic05MpsMediumRes)
+            elif repeatability == Sht3xRepeatability.LOW:
+                command = shared_command(Sht3xI2cCmdPeriodic05MpsLowRes)
+            else:
+                raise ValueError('Unknown argument for repeatability.')
+        elif frequency == Sht3xMeasurementFrequency.MPS_1:
+            if repeatability == Sht3xRepeatability.HIGH:
+                command = shared_command(Sht3xI2cCmdPeriodic1MpsHighRes)
+            elif repeatability == Sht3xRepeatability.MEDIUM:
+                command = shared_command(Sht3xI2cCmdPeriodic1MpsMediumRes)
+            elif repeatability == Sht3xRepeatability.LOW:
+                command = shared_command(Sht3xI2cCmdPeriodic1MpsLowRes)
+            else:
+                raise ValueError('Unknown argument for repeatability.')
+        elif frequency == Sht3xMeasurementFrequency.MPS_2:
+            if repeatability == Sht3xRepeatability.HIGH:
+                command = shared_command(Sht3xI2cCmdPeriodic2MpsHighRes)
+            elif repeatability == Sht3xRepeatability.MEDIUM:
+                command = shared_command(Sht3xI2cCmdPeriodic2MpsMediumRes)
+            elif repeatability == Sht3xRepeatability.LOW:
+                command = shared_command(Sht3xI2cCmdPeriodic2MpsLowRes)
+            else:
+                raise ValueError('Unknown argument for repeatability.')
+        elif frequency == Sht3xMeasurementFrequency.MPS_4:
+            if repeatability == Sht3xRepeatability.HIGH:
+                command = shared_command(Sht3xI2cCmdPeriodic4MpsHighRes)
+            elif repeatability == Sht3xRepeatability.MEDIUM:
+                command = shared_command(Sht3xI2cCmdPeriodic4MpsMediumRes)
+            elif repeatability == Sht3xRepeatability.LOW:
+                command = shared_command(Sht3xI2cCmdPeriodic4MpsLowRes)
+            else:
+                raise ValueError('Unknown argument for repeatability.')
+        elif frequency == Sht3xMeasurementFrequency.MPS_10:
+            if repeatability == Sht3xRepeatability.HIGH:
+                command = shared_command(Sht3xI2cCmdPeriodic10MpsHighRes)
+            elif repeatability == Sht3xRepeatability.MEDIUM:
+                command = shared_command(Sht3xI2cCmdPeriodic10MpsMediumRes)
+            elif repeatability == Sht3xRepeatability.LOW:
+                command = shared_command(Sht3xI2cCmdPeriodic10MpsLowRes)
+            else:
+                raise ValueError('Unknown argument for repeatability.')
         else:
-            raise ValueError('Unknown argument for repeatability.')
-        return result
+            raise ValueError('Unknown argument for frequency.')
+        return command
 
     def art_enable(self):
         """
         Enable the ART (accelerated response time
         """
-        return self.execute(Sht3xI2cCmdEnableART())
+        return self.execute(shared_command(Sht3xI2cCmdEnableART))
 
     def heater_on(self):
         """
         Switch on the internal heater.
         """
-        return self.execute(Sht3xI2cCmdHeaterOn())
+        return self.execute(shared_command(Sht3xI2cCmdHeaterOn))
 
     def heater_off(self):
         """
         Switch off the internal heater.
         """
-        return self.execute(Sht3xI2cCmdHeaterOff())
+        return self.execute(shared_command(Sht3xI2cCmdHeaterOff))
 
     def read_status_register(self):
         """
@@ -79,21 +336,21 @@ class Sht3xI2cDevice(I2cDevice):
         :return: The status register.
         :rtype: :py:class:`~sensirion_i2c_sht.sht3x.response_types.Sht3xStatusRegister`
         """  # noqa: E501
-        return self.execute(Sht3xI2cCmdReadStatusRegister())
+        return self.execute(shared_command(Sht3xI2cCmdReadStatusRegister))
 
     def clear_status_register(self):
         """
         Clear the status register. All flags (Bit 15, 11, 10, 4) in the status
         register can be cleared (set to zero).
         """
-        return self.execute(Sht3xI2cCmdResetStatusRegister())
+        return self.execute(shared_command(Sht3xI2cCmdResetStatusRegister))
 
     def soft_reset(self):
         """
         Perform a soft reset for the device. This can be used to force the
         system into a well-defined state without removing the power supply.
         """
-        return self.execute(Sht3xI2cCmdSoftReset())
+        return self.execute(shared_command(Sht3xI2cCmdSoftReset))
 
     def read_serial_number(self):
         """
@@ -102,4 +359,4 @@ class Sht3xI2cDevice(I2cDevice):
         :return: The serial number.
         :rtype: int
         """
-        return self.execute(Sht3xI2cCmdReadSerial())
+        return self.execute(shared_command(Sht3xI2cCmdReadSerial))
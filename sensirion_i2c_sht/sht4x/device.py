@@ -2,7 +2,9 @@
 # (c) Copyright 2021 Sensirion AG, Switzerland
 
 from __future__ import absolute_import, division, print_function
-from sensirion_i2c_driver import I2cDevice
+from ..commands import shared_command
+from ..device import ShtI2cDeviceBase
+from . import conversion
 from .commands import Sht4xI2cCmdMeasHighRes, Sht4xI2cCmdMeasMediumRes, \
     Sht4xI2cCmdMeasLowRes, Sht4xI2cCmdSoftReset, Sht4xI2cCmdReadSerial, \
     Sht4xI2cCmdHeaterHighPowerLong, Sht4xI2cCmdHeaterHighPowerShort, \
@@ -12,11 +14,13 @@ from .data_types import Sht4xRepeatability, Sht4xHeaterActivationDuration, \
     Sht4xHeaterPower
 
 
-class Sht4xI2cDevice(I2cDevice):
+class Sht4xI2cDevice(ShtI2cDeviceBase):
     """
     SHT4x I²C device class to allow executing I²C commands.
     """
 
+    _pre_trigger_supported = True
+
     def __init__(self, connection, slave_address=0x44):
         """
         Constructs a new SHT4x I²C device.
@@ -46,15 +50,90 @@ class Sht4xI2cDevice(I2cDevice):
         :rtype:
             tuple
         """  # noqa: E501
+        return self._measure(self._single_shot_command(repeatability))
+
+    def single_shot_measurement_raw(self, repeatability=Sht4xRepeatability.HIGH,
+                                    buffer=None, offset=0):
+        """
+        Trigger a measurement and read the raw temperature and humidity ticks,
+        without creating response objects. The ticks can be converted later,
+        e.g. in bulk with :py:mod:`~sensirion_i2c_sht.sht4x.conversion`.
+
+        :param `~sensirion_i2c_sht.sht4x.data_types.Sht4xRepeatability` repeatability:
+            Configure the repeatability setting.
+        :param buffer:
+            Optional writable sequence, e.g. an :py:class:`array.array` of
+            type ``'H'``, to store the temperature and humidity ticks into
+            instead of returning them. Not supported on multi-channel
+            connections.
+        :param int offset:
+            Index of ``buffer`` where to store the temperature ticks, followed
+            by the humidity ticks.
+        :return:
+            The temperature and humidity ticks, or the index of ``buffer``
+            following the stored ticks if a buffer is passed.
+        :rtype:
+            tuple(int, int) / int
+        :raises ValueError:
+            If the passed parameters are not valid.
+        """  # noqa: E501
+        return self._execute_raw(self._single_shot_command(repeatability),
+                                 buffer, offset)
+
+    def single_shot_measurement_multi_channel(
+            self, repeatability=Sht4xRepeatability.HIGH):
+        """
+        Trigger a measurement on all channels of a multi-channel connection
+        and read the results as columns, i.e. as arrays with one item per
+        channel instead of a list of response objects and exceptions. Errors
+        do not raise an exception but are reported per channel. Works on
+        single-channel connections too, returning one channel.
+
+        :param `~sensirion_i2c_sht.sht4x.data_types.Sht4xRepeatability` repeatability:
+            Configure the repeatability setting.
+        :return: The ticks, converted values and errors of all channels.
+        :rtype: :py:class:`~sensirion_i2c_sht.multi_channel.MultiChannelResult`
+        :raises ValueError:
+            If the passed parameters are not valid.
+        """  # noqa: E501
+        return self._execute_multi_channel(
+            self._single_shot_command(repeatability), conversion)
+
+    def start_measurement(self, repeatability=Sht4xRepeatability.HIGH):
+        """
+        Trigger a measurement without waiting for its result. The result can
+        be read afterwards with
+        :py:meth:`~sensirion_i2c_sht.device.ShtI2cDeviceBase.read_measurement`
+        (or the :py:meth:`~sensirion_i2c_sht.device.MeasurementHandle.result`
+        method of the returned handle), which allows doing other things while
+        the device is measuring.
+
+        .. note:: Any other command sent to the device before the result is
+                  read discards the measurement result.
+
+        :param `~sensirion_i2c_sht.sht4x.data_types.Sht4xRepeatability` repeatability:
+            Configure the repeatability setting.
+        :raises ValueError:
+            If the passed repeatability is not valid.
+        :return: The handle of the started measurement.
+        :rtype: :py:class:`~sensirion_i2c_sht.device.MeasurementHandle`
+        """  # noqa: E501
+        return self._start_measurement(
+            self._single_shot_command(repeatability))
+
+    def _single_shot_command(self, repeatability):
+        """
+        Get the single shot measurement command for the given repeatability.
+        """
         if repeatability == Sht4xRepeatability.HIGH:
-            result = self.execute(Sht4xI2cCmdMeasHighRes())
+            command = shared_command(Sht4xI2cCmdMeasHighRes)
         elif repeatability == Sht4xRepeatability.MEDIUM:
-            result = self.execute(Sht4xI2cCmdMeasMediumRes())
+            command = shared_command(Sht4xI2cCmdMeasMediumRes)
         elif repeatability == Sht4xRepeatability.LOW:
-            result = self.execute(Sht4xI2cCmdMeasLowRes())
+            command = shared_command(Sht4xI2cCmdMeasLowRes)
         else:
             raise ValueError('Unknown argument for repeatability.')
-        return result
+        return command
 
     def activate_heater(self, power=Sht4xHeaterPower.HIGH,
                         duration=Sht4xHeaterActivationDuration.LONG):
@@ -94,37 +173,70 @@ class Sht4xI2cDevice(I2cDevice):
         :rtype:
             tuple
         """  # noqa: E501
+        return self.execute(self._heater_command(power, duration))
+
+    def start_heater(self, power=Sht4xHeaterPower.HIGH,
+                     duration=Sht4xHeaterActivationDuration.LONG):
+        """
+        Activate the heater without waiting for the high precision
+        measurement which follows it. The result can be read afterwards with
+        :py:meth:`~sensirion_i2c_sht.device.ShtI2cDeviceBase.read_measurement`
+        (or the :py:meth:`~sensirion_i2c_sht.device.MeasurementHandle.result`
+        method of the returned handle), which allows using other devices on
+        the same bus while the sensor is heating.
+
+        See :py:meth:`activate_heater` for important notes about operating
+        the heater.
+
+        .. note:: Any other command sent to the device before the result is
+                  read discards the measurement result.
+
+        :param `~sensirion_i2c_sht.sht4x.data_types.Sht4xHeaterPower` power:
+            Configure the heater power setting.
+        :param `~sensirion_i2c_sht.sht4x.data_types.Sht4xHeaterActivationDuration` duration:
+            Configure the heater activation duration.
+        :raises ValueError:
+            If the passed parameters are not valid.
+        :return: The handle of the started heater activation.
+        :rtype: :py:class:`~sensirion_i2c_sht.device.MeasurementHandle`
+        """  # noqa: E501
+        return self._start_measurement(self._heater_command(power, duration))
+
+    def _heater_command(self, power, duration):
+        """
+        Get the heater command for the given settings.
+        """
         if power == Sht4xHeaterPower.HIGH:
             if duration == Sht4xHeaterActivationDuration.LONG:
-                result = self.execute(Sht4xI2cCmdHeaterHighPowerLong())
+                command = shared_command(Sht4xI2cCmdHeaterHighPowerLong)
             elif duration == Sht4xHeaterActivationDuration.SHORT:
-                result = self.execute(Sht4xI2cCmdHeaterHighPowerShort())
+                command = shared_command(Sht4xI2cCmdHeaterHighPowerShort)
             else:
                 raise ValueError('Unknown argument for duration.')
         elif power == Sht4xHeaterPower.MEDIUM:
             if duration == Sht4xHeaterActivationDuration.LONG:
-                result = self.execute(Sht4xI2cCmdHeaterMediumPowerLong())
+                command = shared_command(Sht4xI2cCmdHeaterMediumPowerLong)
             elif duration == Sht4xHeaterActivationDuration.SHORT:
-                result = self.execute(Sht4xI2cCmdHeaterMediumPowerShort())
+                command = shared_command(Sht4xI2cCmdHeaterMediumPowerShort)
             else:
                 raise ValueError('Unknown argument for duration.')
         elif power == Sht4xHeaterPower.LOW:
             if duration == Sht4xHeaterActivationDuration.LONG:
-                result = self.execute(Sht4xI2cCmdHeaterLowPowerLong())
+                command = shared_command(Sht4xI2cCmdHeaterLowPowerLong)
             elif duration == Sht4xHeaterActivationDuration.SHORT:
-                result = self.execute(Sht4xI2cCmdHeaterLowPowerShort())
+                command = shared_command(Sht4xI2cCmdHeaterLowPowerShort)
             else:
                 raise ValueError('Unknown argument for duration.')
         else:
             raise ValueError('Unknown argument for power.')
-        return result
+        return command
 
     def soft_reset(self):
         """
         Perform a soft reset for the device. This can be used to force the
         system into a well-defined state without removing the power supply.
         """
-        return self.execute(Sht4xI2cCmdSoftReset())
+        return self.execute(shared_command(Sht4xI2cCmdSoftReset))
 
     def read_serial_number(self):
         """
@@ -133,4 +245,4 @@ class Sht4xI2cDevice(I2cDevice):
         :return: The serial number.
         :rtype: int
         """
-        return self.execute(Sht4xI2cCmdReadSerial())
+        return self.execute(shared_command(Sht4xI2cCmdReadSerial))
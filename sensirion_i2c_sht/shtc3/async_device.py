@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from ..async_device import AsyncShtI2cDeviceBase
+from ..commands import shared_command
+from .commands import Shtc3I2cCmdProductId, Shtc3I2cCmdWakeUp, \
+    Shtc3I2cCmdSleep, Shtc3I2cCmdSoftReset
+from .data_types import Shtc3PowerMode
+from .device import Shtc3I2cDevice
+
+
+class AsyncShtc3I2cDevice(AsyncShtI2cDeviceBase):
+    """
+    SHTC3 I²C device class to allow executing I²C commands with asyncio.
+
+    See :py:class:`~sensirion_i2c_sht.async_device.AsyncShtI2cDeviceBase` for
+    details.
+    """
+
+    def __init__(self, connection, slave_address=0x70, executor=None):
+        """
+        Constructs a new asynchronous SHTC3 I²C device.
+
+        :param ~sensirion_i2c_driver.connection.I2cConnection connection:
+            The I²C connection to use for communication.
+        :param byte slave_address:
+            The I²C slave address, defaults to 0x70.
+        :param ~concurrent.futures.Executor executor:
+            The executor to run the bus transfers in. If None, the default
+            executor of the event loop is used.
+        """
+        super(AsyncShtc3I2cDevice, self).__init__(
+            Shtc3I2cDevice(connection, slave_address), executor)
+
+    async def measure(self, power_mode=Shtc3PowerMode.NORMAL):
+        """
+        Trigger a measurement with clock stretching disabled and read the temperature and humidity.
+
+        See :py:meth:`~sensirion_i2c_sht.shtc3.device.Shtc3I2cDevice.measure`.
+        """  # noqa: E501
+        command = self.device._measure_command(power_mode)
+        await self.wake_up()
+        result = await self.execute(command)
+        await self.enter_sleep()
+        return result
+
+    async def measure_raw(self, power_mode=Shtc3PowerMode.NORMAL, buffer=None,
+                          offset=0):
+        """
+        Trigger a measurement with clock stretching disabled and read the raw
+        temperature and humidity ticks.
+
+        See :py:meth:`~sensirion_i2c_sht.shtc3.device.Shtc3I2cDevice.measure_raw`.
+        """  # noqa: E501
+        command = self.device._measure_command(power_mode)
+        self.device._check_buffer(buffer)
+        await self.wake_up()
+        result = await self._execute_raw(command, buffer, offset)
+        await self.enter_sleep()
+        return result
+
+    async def measure_clock_stretching(self, power_mode=Shtc3PowerMode.NORMAL):
+        """
+        Trigger a measurement with clock stretching enabled and read the temperature and humidity.
+
+        See :py:meth:`~sensirion_i2c_sht.shtc3.device.Shtc3I2cDevice.measure_clock_stretching`.
+
+        .. note:: The measurement duration is spent in the bus transfer, i.e.
+                  in the executor.
+        """  # noqa: E501
+        command = self.device._measure_command(power_mode,
+                                               clock_stretching=True)
+        await self.wake_up()
+        result = await self.execute(command)
+        await self.enter_sleep()
+        return result
+
+    async def read_product_id(self):
+        """
+        Read the product id from the device.
+
+        :return: The product id.
+        :rtype: int
+        """
+        return await self.execute(shared_command(Shtc3I2cCmdProductId))
+
+    async def wake_up(self):
+        """
+        wake up SHTC3.
+
+        See :py:meth:`~sensirion_i2c_sht.shtc3.device.Shtc3I2cDevice.wake_up`.
+        """
+        await self.execute(shared_command(Shtc3I2cCmdWakeUp))
+
+    async def enter_sleep(self):
+        """
+        Sleep command of the sensor.
+
+        See :py:meth:`~sensirion_i2c_sht.shtc3.device.Shtc3I2cDevice.enter_sleep`.
+        """  # noqa: E501
+        await self.execute(shared_command(Shtc3I2cCmdSleep))
+
+    async def soft_reset(self):
+        """
+        Perform a soft reset for the device.
+
+        See :py:meth:`~sensirion_i2c_sht.shtc3.device.Shtc3I2cDevice.soft_reset`.
+        """  # noqa: E501
+        return await self.execute(shared_command(Shtc3I2cCmdSoftReset))
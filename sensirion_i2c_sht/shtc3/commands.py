@@ -6,7 +6,8 @@ from __future__ import absolute_import, division, print_function
 import logging
 from struct import unpack
 
-from sensirion_i2c_driver import SensirionI2cCommand, CrcCalculator
+from sensirion_i2c_driver import SensirionI2cCommand
+from ..crc import CRC8_INIT_FF
 from .response_types import Shtc3Temperature, Shtc3Humidity
 
 log = logging.getLogger(__name__)
@@ -18,7 +19,7 @@ class Shtc3I2cCmdBase(SensirionI2cCommand):
     """
 
     def __init__(self, command, tx_data, rx_length, read_delay, timeout,
-                 post_processing_time=0.0):
+                 post_processing_time=0.0, typical_read_delay=None):
         """
         Constructs a new shtc3 I²C command.
 
@@ -54,6 +55,10 @@ class Shtc3I2cCmdBase(SensirionI2cCommand):
             example after a device reset command, the device might need some
             time until it is ready again. Usually this is 0.0s, i.e. no post
             processing is needed.
+        :param float typical_read_delay:
+            Typical duration (in Seconds) the device needs to prepare the RX
+            data. Used as first read attempt if ready polling is enabled. None
+            means that the command does not support ready polling.
         """
         super(Shtc3I2cCmdBase, self).__init__(
             command=command,
@@ -61,32 +66,36 @@ class Shtc3I2cCmdBase(SensirionI2cCommand):
             rx_length=rx_length,
             read_delay=read_delay,
             timeout=timeout,
-            crc=CrcCalculator(8, 0x31, 0xFF, 0x00),
+            crc=CRC8_INIT_FF,
             command_bytes=2,
             post_processing_time=post_processing_time,
         )
 
+        #: Typical delay in Seconds between write and read operation
+        #: (float/None).
+        self.typical_read_delay = typical_read_delay
 
-class Shtc3I2cCmdMeasureNormalModeTicksClockStretching(Shtc3I2cCmdBase):
-    """
-    Measure Normal Mode Ticks Clock Stretching I²C Command
-
-    Measure in normal mode with clock stretching enabled.
-    """
-
-    def __init__(self):
+    def interpret_response(self, data):
         """
-        Constructor.
+        Validates the CRCs of the received data from the device and returns
+        the data with all CRCs removed.
+
+        :param bytes data:
+            Received raw bytes from the read operation.
+        :return:
+            The received bytes, or None if there is no data received.
+        :rtype:
+            bytes or None
+        :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
+            If a received CRC was wrong.
         """
-        super(Shtc3I2cCmdMeasureNormalModeTicksClockStretching, self).__init__(
-            command=0x7CA2,
-            tx_data=None,
-            rx_length=6,
-            read_delay=0.013,
-            timeout=0,
-            post_processing_time=0.0,
-        )
+        return self._crc.verify_words(data)
 
+
+class Shtc3I2cCmdMeasBase(Shtc3I2cCmdBase):
+    """
+    Base SHTC3 command for a measurement.
+    """
     def interpret_response(self, data):
         """
         Validates the CRCs of the received data from the device and returns
@@ -103,16 +112,50 @@ class Shtc3I2cCmdMeasureNormalModeTicksClockStretching(Shtc3I2cCmdBase):
         :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
             If a received CRC was wrong.
         """
+        temperature_ticks, humidity_ticks = self.interpret_ticks(data)
+        return Shtc3Temperature(temperature_ticks), Shtc3Humidity(humidity_ticks)
+
+    def interpret_ticks(self, data):
+        """
+        Validates the CRCs of the received data from the device and returns
+        the raw ticks, without creating response objects.
+
+        :param bytes data:
+            Received raw bytes from the read operation.
+        :return: The temperature ticks and the humidity ticks.
+        :rtype: tuple(int, int)
+        :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
+            If a received CRC was wrong.
+        """
         # check and remove CRCs
         checked_data = Shtc3I2cCmdBase.interpret_response(self, data)
 
-        # convert raw received data into proper data types
-        temperature_ticks = int(unpack(">H", checked_data[0:2])[0])  # uint16
-        humidity_ticks = int(unpack(">H", checked_data[2:4])[0])  # uint16
-        return Shtc3Temperature(temperature_ticks), Shtc3Humidity(humidity_ticks)
+        # convert raw received data into ticks (uint16)
+        return unpack(">2H", checked_data)
+
 
+class Shtc3I2cCmdMeasureNormalModeTicksClockStretching(Shtc3I2cCmdMeasBase):
+    """
+    Measure Normal Mode Ticks Clock Stretching I²C Command
 
-class Shtc3I2cCmdMeasureLowestPowerModeTicksClockStretching(Shtc3I2cCmdBase):
+    Measure in normal mode with clock stretching enabled.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+        super(Shtc3I2cCmdMeasureNormalModeTicksClockStretching, self).__init__(
+            command=0x7CA2,
+            tx_data=None,
+            rx_length=6,
+            read_delay=0.013,
+            timeout=0,
+            post_processing_time=0.0,
+        )
+
+
+class Shtc3I2cCmdMeasureLowestPowerModeTicksClockStretching(Shtc3I2cCmdMeasBase):
     """
     Measure Lowest Power Mode Ticks Clock Stretching I²C Command
 
@@ -132,32 +175,8 @@ class Shtc3I2cCmdMeasureLowestPowerModeTicksClockStretching(Shtc3I2cCmdBase):
             post_processing_time=0.0,
         )
 
-    def interpret_response(self, data):
-        """
-        Validates the CRCs of the received data from the device and returns
-        the interpreted data.
 
-        :param bytes data:
-            Received raw bytes from the read operation.
-        :return:
-            - temperature (:py:class:`~sensirion_i2c_sht.shtc3.response_types.Shtc3xTemperature`) -
-              Temperature response object.
-            - humidity (:py:class:`~sensirion_i2c_sht.shtc3.response_types.Shtc3Humidity`) -
-              Humidity response object.
-        :rtype: tuple
-        :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
-            If a received CRC was wrong.
-        """
-        # check and remove CRCs
-        checked_data = Shtc3I2cCmdBase.interpret_response(self, data)
-
-        # convert raw received data into proper data types
-        temperature_ticks = int(unpack(">H", checked_data[0:2])[0])  # uint16
-        humidity_ticks = int(unpack(">H", checked_data[2:4])[0])  # uint16
-        return Shtc3Temperature(temperature_ticks), Shtc3Humidity(humidity_ticks)
-
-
-class Shtc3I2cCmdMeasureNormalModeTicks(Shtc3I2cCmdBase):
+class Shtc3I2cCmdMeasureNormalModeTicks(Shtc3I2cCmdMeasBase):
     """
     Measure Normal Mode Ticks I²C Command
 
@@ -175,34 +194,11 @@ class Shtc3I2cCmdMeasureNormalModeTicks(Shtc3I2cCmdBase):
             read_delay=0.013,
             timeout=0,
             post_processing_time=0.0,
+            typical_read_delay=0.0108,
         )
 
-    def interpret_response(self, data):
-        """
-        Validates the CRCs of the received data from the device and returns
-        the interpreted data.
-
-        :param bytes data:
-            Received raw bytes from the read operation.
-        :return:
-            - temperature (:py:class:`~sensirion_i2c_sht.shtc3.response_types.Shtc3xTemperature`) -
-              Temperature response object.
-            - humidity (:py:class:`~sensirion_i2c_sht.shtc3.response_types.Shtc3Humidity`) -
-              Humidity response object.
-        :rtype: tuple
-        :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
-            If a received CRC was wrong.
-        """
-        # check and remove CRCs
-        checked_data = Shtc3I2cCmdBase.interpret_response(self, data)
-
-        # convert raw received data into proper data types
-        temperature_ticks = int(unpack(">H", checked_data[0:2])[0])  # uint16
-        humidity_ticks = int(unpack(">H", checked_data[2:4])[0])  # uint16
-        return Shtc3Temperature(temperature_ticks), Shtc3Humidity(humidity_ticks)
-
 
-class Shtc3I2cCmdMeasureLowestPowerModeTicks(Shtc3I2cCmdBase):
+class Shtc3I2cCmdMeasureLowestPowerModeTicks(Shtc3I2cCmdMeasBase):
     """
     Measure Lowest Power Mode Ticks I²C Command
 
@@ -220,32 +216,9 @@ class Shtc3I2cCmdMeasureLowestPowerModeTicks(Shtc3I2cCmdBase):
             read_delay=0.001,
             timeout=0,
             post_processing_time=0.0,
+            typical_read_delay=0.0007,
         )
 
-    def interpret_response(self, data):
-        """
-        Validates the CRCs of the received data from the device and returns
-        the interpreted data.
-
-        :param bytes data:
-            Received raw bytes from the read operation.
-        :return:
-            - temperature (:py:class:`~sensirion_i2c_sht.shtc3.response_types.Shtc3xTemperature`) -
-              Temperature response object.
-            - humidity (:py:class:`~sensirion_i2c_sht.shtc3.response_types.Shtc3Humidity`) -
-              Humidity response object.
-        :rtype: tuple
-        :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
-            If a received CRC was wrong.
-        """
-        # check and remove CRCs
-        checked_data = Shtc3I2cCmdBase.interpret_response(self, data)
-
-        # convert raw received data into proper data types
-        temperature_ticks = int(unpack(">H", checked_data[0:2])[0])  # uint16
-        humidity_ticks = int(unpack(">H", checked_data[2:4])[0])  # uint16
-        return Shtc3Temperature(temperature_ticks), Shtc3Humidity(humidity_ticks)
-
 
 class Shtc3I2cCmdProductId(Shtc3I2cCmdBase):
     """
@@ -3,15 +3,16 @@
 
 from __future__ import absolute_import, division, print_function
 
-from sensirion_i2c_driver import I2cDevice
-
+from ..commands import shared_command
+from ..device import ShtI2cDeviceBase
+from . import conversion
 from .commands import Shtc3I2cCmdMeasureNormalModeTicks, Shtc3I2cCmdMeasureLowestPowerModeTicks, \
     Shtc3I2cCmdMeasureNormalModeTicksClockStretching, Shtc3I2cCmdMeasureLowestPowerModeTicksClockStretching, \
     Shtc3I2cCmdProductId, Shtc3I2cCmdWakeUp, Shtc3I2cCmdSleep, Shtc3I2cCmdSoftReset
 from .data_types import Shtc3PowerMode
 
 
-class Shtc3I2cDevice(I2cDevice):
+class Shtc3I2cDevice(ShtI2cDeviceBase):
     """
     SHTC3 I²C device class to allow executing I²C commands.
     """
@@ -45,13 +46,95 @@ class Shtc3I2cDevice(I2cDevice):
         :rtype:
             tuple
         """  # noqa: E501
+        command = self._measure_command(power_mode)
         self.wake_up()
-        if power_mode == Shtc3PowerMode.NORMAL:
-            result = self.execute(Shtc3I2cCmdMeasureNormalModeTicks())
-        elif power_mode == Shtc3PowerMode.LOW:
-            result = self.execute(Shtc3I2cCmdMeasureLowestPowerModeTicks())
-        else:
-            raise ValueError('Unknown argument for power_mode.')
+        result = self.execute(command)
+        self.enter_sleep()
+        return result
+
+    def measure_raw(self, power_mode=Shtc3PowerMode.NORMAL, buffer=None,
+                    offset=0):
+        """
+        Trigger a measurement with clock stretching disabled and read the raw
+        temperature and humidity ticks, without creating response objects.
+        The ticks can be converted later, e.g. in bulk with
+        :py:mod:`~sensirion_i2c_sht.shtc3.conversion`.
+
+        :param `~sensirion_i2c_sht.shtc3.data_types.Shtc3PowerMode` power_mode:
+            Configure the power mode setting.
+        :param buffer:
+            Optional writable sequence, e.g. an :py:class:`array.array` of
+            type ``'H'``, to store the temperature and humidity ticks into
+            instead of returning them. Not supported on multi-channel
+            connections.
+        :param int offset:
+            Index of ``buffer`` where to store the temperature ticks, followed
+            by the humidity ticks.
+        :return:
+            The temperature and humidity ticks, or the index of ``buffer``
+            following the stored ticks if a buffer is passed.
+        :rtype:
+            tuple(int, int) / int
+        :raises ValueError:
+            If the passed parameters are not valid.
+        """  # noqa: E501
+        command = self._measure_command(power_mode)
+        self._check_buffer(buffer)
+        self.wake_up()
+        result = self._execute_raw(command, buffer, offset)
+        self.enter_sleep()
+        return result
+
+    def measure_multi_channel(self, power_mode=Shtc3PowerMode.NORMAL):
+        """
+        Trigger a measurement with clock stretching disabled on all channels
+        of a multi-channel connection and read the results as columns, i.e. as
+        arrays with one item per channel instead of a list of response objects
+        and exceptions. Errors do not raise an exception but are reported per
+        channel. Works on single-channel connections too, returning one
+        channel.
+
+        :param `~sensirion_i2c_sht.shtc3.data_types.Shtc3PowerMode` power_mode:
+            Configure the power mode setting.
+        :return: The ticks, converted values and errors of all channels.
+        :rtype: :py:class:`~sensirion_i2c_sht.multi_channel.MultiChannelResult`
+        :raises ValueError:
+            If the passed parameters are not valid.
+        """  # noqa: E501
+        command = self._measure_command(power_mode)
+        self.wake_up()
+        result = self._execute_multi_channel(command, conversion)
+        self.enter_sleep()
+        return result
+
+    def start_measurement(self, power_mode=Shtc3PowerMode.NORMAL):
+        """
+        Wake up the device and trigger a measurement with clock stretching
+        disabled without waiting for its result. The result can be read
+        afterwards with
+        :py:meth:`~sensirion_i2c_sht.device.ShtI2cDeviceBase.read_measurement`
+        (or the :py:meth:`~sensirion_i2c_sht.device.MeasurementHandle.result`
+        method of the returned handle), which sends the device to sleep again.
+
+        .. note:: Any other command sent to the device before the result is
+                  read discards the measurement result.
+
+        :param `~sensirion_i2c_sht.shtc3.data_types.Shtc3PowerMode` power_mode:
+            Configure the power mode setting.
+        :raises ValueError:
+            If the passed power mode is not valid.
+        :return: The handle of the started measurement.
+        :rtype: :py:class:`~sensirion_i2c_sht.device.MeasurementHandle`
+        """  # noqa: E501
+        command = self._measure_command(power_mode)
+        self.wake_up()
+        return self._start_measurement(command,
+                                       finish=self._finish_measurement)
+
+    def _finish_measurement(self, result):
+        """
+        Send the device to sleep after the measurement result was read.
+        """
         self.enter_sleep()
         return result
 
@@ -73,16 +156,32 @@ class Shtc3I2cDevice(I2cDevice):
         :rtype:
             tuple
         """  # noqa: E501
+        command = self._measure_command(power_mode, clock_stretching=True)
         self.wake_up()
-        if power_mode == Shtc3PowerMode.NORMAL:
-            result = self.execute(Shtc3I2cCmdMeasureNormalModeTicksClockStretching())
-        elif power_mode == Shtc3PowerMode.LOW:
-            result = self.execute(Shtc3I2cCmdMeasureLowestPowerModeTicksClockStretching())
-        else:
-            raise ValueError('Unknown argument for power_mode.')
+        result = self.execute(command)
         self.enter_sleep()
         return result
 
+    def _measure_command(self, power_mode, clock_stretching=False):
+        """
+        Get the measurement command for the given settings.
+        """
+        if clock_stretching:
+            if power_mode == Shtc3PowerMode.NORMAL:
+                command = shared_command(Shtc3I2cCmdMeasureNormalModeTicksClockStretching)
+            elif power_mode == Shtc3PowerMode.LOW:
+                command = shared_command(Shtc3I2cCmdMeasureLowestPowerModeTicksClockStretching)
+            else:
+                raise ValueError('Unknown argument for power_mode.')
+        else:
+            if power_mode == Shtc3PowerMode.NORMAL:
+                command = shared_command(Shtc3I2cCmdMeasureNormalModeTicks)
+            elif power_mode == Shtc3PowerMode.LOW:
+                command = shared_command(Shtc3I2cCmdMeasureLowestPowerModeTicks)
+            else:
+                raise ValueError('Unknown argument for power_mode.')
+        return command
+
     def read_product_id(self):
         """
         Read the product id from the device.
@@ -90,7 +189,7 @@ class Shtc3I2cDevice(I2cDevice):
         :return: The product id.
         :rtype: int
         """
-        return self.execute(Shtc3I2cCmdProductId())
+        return self.execute(shared_command(Shtc3I2cCmdProductId))
 
     def wake_up(self):
         """
@@ -99,7 +198,7 @@ class Shtc3I2cDevice(I2cDevice):
         .. note:: When the sensor is in sleep mode, it requires the
                   wake-up command before any further communication
         """
-        self.execute(Shtc3I2cCmdWakeUp())
+        self.execute(shared_command(Shtc3I2cCmdWakeUp))
 
     def enter_sleep(self):
         """
@@ -109,11 +208,11 @@ class Shtc3I2cDevice(I2cDevice):
                   enters the idle state after a duration of 240us. After that,
                   the sensor should be set to sleep.
         """
-        self.execute(Shtc3I2cCmdSleep())
+        self.execute(shared_command(Shtc3I2cCmdSleep))
 
     def soft_reset(self):
         """
         Perform a soft reset for the device. This can be used to force the
         system into a well-defined state without removing the power supply.
         """
-        return self.execute(Shtc3I2cCmdSoftReset())
+        return self.execute(shared_command(Shtc3I2cCmdSoftReset))
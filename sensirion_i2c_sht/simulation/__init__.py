@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from .transceiver import SimulatedI2cTransceiver  # noqa: F401
+from .faults import FaultInjectingI2cTransceiver  # noqa: F401
+from .replay import RecordingI2cTransceiver, \
+    ReplayI2cTransceiver  # noqa: F401
+from .device import SimulatedShtDeviceBase  # noqa: F401
+from .sht2x import SimulatedSht2x  # noqa: F401
+from .sht3x import SimulatedSht3x  # noqa: F401
+from .sht4x import SimulatedSht4x  # noqa: F401
+from .sts4x import SimulatedSts4x  # noqa: F401
+from .shtc3 import SimulatedShtc3  # noqa: F401
+
+
+__copyright__ = '(c) Copyright 2021 Sensirion AG, Switzerland'
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from ..crc import CRC8_INIT_FF
+import math
+
+
+class SimulatedShtDeviceBase(object):
+    """
+    Base class for the simulated devices which can be attached to a
+    :py:class:`~sensirion_i2c_sht.simulation.transceiver.SimulatedI2cTransceiver`.
+
+    A simulated device processes the command codes of the corresponding
+    sensor family and responds with CRC protected data, just like the real
+    device. While the device is busy (e.g. measuring or resetting), it does
+    not acknowledge any transfer, so reading a measurement result too early
+    fails with a NACK error. Commands using clock stretching hold the read
+    transfer until the result is available instead.
+
+    The physical environment is given by the attributes
+    :py:attr:`temperature` and :py:attr:`humidity`, which can be changed at
+    any time.
+    """  # noqa: E501
+
+    #: Number of bytes of the command codes.
+    COMMAND_BYTES = 2
+
+    #: The CRC used by the device.
+    CRC = CRC8_INIT_FF
+
+    #: Duration in Seconds after a power-on reset until the device is ready.
+    POWER_UP_DURATION = 0.001
+
+    def __init__(self, slave_address, temperature, humidity, serial_number):
+        """
+        Constructs a new simulated device.
+
+        :param byte slave_address:
+            The I²C slave address of the device.
+        :param float temperature:
+            The ambient temperature in °C.
+        :param float humidity:
+            The ambient relative humidity in %RH.
+        :param int serial_number:
+            The serial number reported by the device.
+        """
+        super(SimulatedShtDeviceBase, self).__init__()
+        self.slave_address = slave_address  #: The I²C slave address.
+        self.temperature = temperature  #: The ambient temperature in °C.
+        self.humidity = humidity  #: The ambient relative humidity in %RH.
+        self.serial_number = serial_number  #: The serial number.
+        self._commands = {}
+        self._busy_until = 0.
+        self._clock_stretching = False
+        self._response = None
+
+    def write(self, data, now):
+        """
+        Process a write transfer received by the device.
+
+        :param bytes data:
+            The received data, i.e. the command code followed by its
+            parameters.
+        :param float now:
+            The current time, see :py:func:`time.monotonic`.
+        :return: Whether the transfer was acknowledged by the device.
+        :rtype: bool
+        """
+        if now < self._busy_until:
+            return False
+        if len(data) == 0:
+            return True  # only the write header, e.g. to probe the device
+        data = bytearray(data)  # Python 2 compatibility
+        code = 0
+        for byte in data[:self.COMMAND_BYTES]:
+            code = (code << 8) | byte
+        handler = self._commands.get(code)
+        if (handler is None) or (not self._accepts(code)):
+            self._reject(code)
+            return False
+        self._response = None
+        self._clock_stretching = False
+        handler(now, data[self.COMMAND_BYTES:])
+        return True
+
+    def read(self, length, now):
+        """
+        Process a read transfer received by the device.
+
+        :param int length:
+            Number of bytes to read.
+        :param float now:
+            The current time, see :py:func:`time.monotonic`.
+        :return:
+            The read bytes, or None if the transfer was not acknowledged.
+        :rtype: bytes/None
+        """
+        if (now < self._busy_until) or (self._response is None):
+            return None
+        response, self._response = self._response, None
+        return response[:length] + b'\xff' * (length - len(response))
+
+    def reset(self, now):
+        """
+        Simulate a power-on reset, e.g. caused by a supply voltage drop. Any
+        pending measurement result is lost.
+
+        :param float now:
+            The current time, see :py:func:`time.monotonic`.
+        """
+        self._response = None
+        self._clock_stretching = False
+        self._busy(now, self.POWER_UP_DURATION)
+
+    def stretch_time(self, now):
+        """
+        Get how long the device stretches the clock of a read transfer.
+
+        :param float now:
+            The current time, see :py:func:`time.monotonic`.
+        :return:
+            Remaining time in Seconds until the result of a command with
+            clock stretching is available, or 0 if the clock is not
+            stretched.
+        :rtype: float
+        """
+        if self._clock_stretching and (now < self._busy_until):
+            return self._busy_until - now
+        return 0.
+
+    def _accepts(self, code):
+        """
+        Check whether the device accepts a known command in its current
+        state. Overridden by devices with states like sleep mode.
+        """
+        return True
+
+    def _reject(self, code):
+        """
+        Called when a command was not acknowledged because it is unknown or
+        not accepted in the current state.
+        """
+        pass
+
+    def _busy(self, now, duration):
+        """
+        Make the device busy, i.e. not acknowledging any transfer, for the
+        given duration.
+        """
+        self._busy_until = now + duration
+
+    def _respond(self, words, now, duration=0., clock_stretching=False):
+        """
+        Provide the response of the last command, available to be read after
+        the given duration.
+
+        :param list words: The 16-bit words to respond.
+        """
+        self._busy(now, duration)
+        self._clock_stretching = clock_stretching
+        self._response = self._encode_words(words)
+
+    def _encode_words(self, words):
+        """
+        Encode 16-bit words, each followed by its CRC.
+        """
+        data = bytearray()
+        for word in words:
+            data += bytearray([word >> 8, word & 0xFF])
+            data.append(self.CRC(data[-2:]))
+        return bytes(data)
+
+    @staticmethod
+    def _ticks(value, offset, scale):
+        """
+        Convert a physical value to ticks, i.e. invert the formula
+        ``value = offset + scale * ticks / 65535``.
+        """
+        ticks = int(round((value - offset) * 65535. / scale))
+        return min(max(ticks, 0), 0xFFFF)
+
+    def _heated(self, temperature_rise):
+        """
+        Get the temperature and relative humidity measured by a sensor heated
+        by the given temperature, assuming a constant absolute humidity.
+
+        :return: The temperature in °C and the relative humidity in %RH.
+        :rtype: tuple(float, float)
+        """
+        temperature = self.temperature + temperature_rise
+        return temperature, self.humidity * \
+            _saturation_vapor_pressure(self.temperature) / \
+            _saturation_vapor_pressure(temperature)
+
+
+def _saturation_vapor_pressure(temperature):
+    """
+    Saturation vapor pressure over water in hPa (Magnus formula).
+    """
+    return 6.112 * math.exp(17.62 * temperature / (243.12 + temperature))
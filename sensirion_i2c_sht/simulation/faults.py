@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver.transceiver_v1 import I2cTransceiverV1
+import random
+import threading
+
+try:
+    from time import monotonic
+except ImportError:  # Python 2
+    from time import time as monotonic
+
+
+class FaultInjectingI2cTransceiver(I2cTransceiverV1):
+    """
+    Wrapper around another I²C transceiver which injects communication
+    faults at configurable rates, to test how acquisition loops (e.g. retry
+    and timeout policies) behave with an unreliable bus. It can wrap any
+    transceiver, e.g. a
+    :py:class:`~sensirion_i2c_sht.simulation.transceiver.SimulatedI2cTransceiver`:
+
+    .. sourcecode:: python
+
+        transceiver = FaultInjectingI2cTransceiver(
+            SimulatedI2cTransceiver([SimulatedSht4x()]),
+            crc_error_rate=0.01, nack_rate=0.01, seed=42)
+        sht4x = Sht4xI2cDevice(I2cConnection(transceiver))
+
+    Every rate is the probability of the fault per transfer and channel:
+
+    - **CRC error**: A bit of the received data is flipped, i.e. the
+      command raises :py:class:`~sensirion_i2c_driver.errors.I2cChecksumError`.
+    - **NACK**: The transfer result is replaced by a NACK error. The wrapped
+      transceiver still executes the transfer, so the device may have
+      processed the command (like a disturbed acknowledge bit).
+    - **Delayed readiness**: After a write, the device stays busy for an
+      additional ``readiness_delay``, i.e. reads are not acknowledged.
+    - **Stuck value**: The data received by the previous read of the same
+      length is returned again instead of the new data.
+    - **Reset**: The device is reset, i.e. it loses its state and pending
+      results, and the transfer is not acknowledged. The reset is executed
+      by the wrapped transceiver if it provides a ``reset_device()`` method
+      (like the simulated transceiver), otherwise only the transfer fails.
+
+    The number of injected faults of every type is available in
+    :py:attr:`injected`.
+    """  # noqa: E501
+
+    def __init__(self, transceiver, crc_error_rate=0., nack_rate=0.,
+                 delay_rate=0., readiness_delay=0.01, stuck_rate=0.,
+                 reset_rate=0., seed=None):
+        """
+        Constructs a new fault injecting transceiver.
+
+        :param ~sensirion_i2c_driver.transceiver_v1.I2cTransceiverV1 transceiver:
+            The transceiver to wrap.
+        :param float crc_error_rate:
+            Probability of a CRC error per read transfer.
+        :param float nack_rate:
+            Probability of a NACK error per transfer.
+        :param float delay_rate:
+            Probability of a delayed readiness per write transfer.
+        :param float readiness_delay:
+            The additional busy time in Seconds of a delayed readiness.
+        :param float stuck_rate:
+            Probability of a stuck value per read transfer.
+        :param float reset_rate:
+            Probability of a device reset per transfer.
+        :param int seed:
+            Seed for the random number generator, to get reproducible
+            faults.
+        """  # noqa: E501
+        super(FaultInjectingI2cTransceiver, self).__init__()
+        self._transceiver = transceiver
+        self.crc_error_rate = crc_error_rate  #: Probability of CRC errors.
+        self.nack_rate = nack_rate  #: Probability of NACK errors.
+        self.delay_rate = delay_rate  #: Probability of delayed readiness.
+        self.readiness_delay = readiness_delay  #: Delay of the readiness.
+        self.stuck_rate = stuck_rate  #: Probability of stuck values.
+        self.reset_rate = reset_rate  #: Probability of device resets.
+        #: Number of injected faults, by fault type.
+        self.injected = dict(crc=0, nack=0, delay=0, stuck=0, reset=0)
+        self._random = random.Random(seed)
+        self._not_ready_until = {}
+        self._last_data = {}
+        self._lock = threading.Lock()
+
+    @property
+    def transceiver(self):
+        """
+        The wrapped transceiver.
+
+        :type: ~sensirion_i2c_driver.transceiver_v1.I2cTransceiverV1
+        """
+        return self._transceiver
+
+    @property
+    def description(self):
+        """
+        Description of the transceiver.
+
+        :type: str
+        """
+        return "Fault injecting " + self._transceiver.description
+
+    @property
+    def channel_count(self):
+        """
+        Channel count of the wrapped transceiver.
+
+        :type: int/None
+        """
+        return self._transceiver.channel_count
+
+    def transceive(self, slave_address, tx_data, rx_length, read_delay,
+                   timeout):
+        """
+        Transceive an I²C frame with the wrapped transceiver and inject
+        faults. See
+        :py:meth:`~sensirion_i2c_driver.transceiver_v1.I2cTransceiverV1.transceive`.
+        """  # noqa: E501
+        result = self._transceiver.transceive(slave_address, tx_data,
+                                              rx_length, read_delay, timeout)
+        multi_channel = self.channel_count is not None
+        results = result if multi_channel else [result]
+        with self._lock:
+            results = [self._inject(channel, r, slave_address, tx_data,
+                                    rx_length)
+                       for channel, r in enumerate(results)]
+        return results if multi_channel else results[0]
+
+    def _inject(self, channel, result, slave_address, tx_data, rx_length):
+        """
+        Inject faults into the result of a transfer on one channel.
+        """
+        key = (channel, slave_address)
+        now = monotonic()
+        if self._chance(self.reset_rate, 'reset'):
+            if hasattr(self._transceiver, 'reset_device'):
+                if self.channel_count is None:
+                    self._transceiver.reset_device(slave_address)
+                else:
+                    self._transceiver.reset_device(slave_address, channel)
+            return self._nack(slave_address)
+        if self._chance(self.nack_rate, 'nack'):
+            return self._nack(slave_address)
+        status, error, data = result
+        if status != self.STATUS_OK:
+            return result
+        if tx_data is not None:
+            self._not_ready_until.pop(key, None)
+            if self._chance(self.delay_rate, 'delay'):
+                self._not_ready_until[key] = now + self.readiness_delay
+        if not rx_length:
+            return result
+        if now < self._not_ready_until.get(key, now):
+            return self._nack(slave_address)
+        last_data = self._last_data.get(key + (rx_length,))
+        self._last_data[key + (rx_length,)] = data
+        if (last_data is not None) and self._chance(self.stuck_rate,
+                                                    'stuck'):
+            data = last_data
+        if self._chance(self.crc_error_rate, 'crc'):
+            data = bytearray(data)
+            data[-1] ^= 0x01  # the last byte is always a CRC
+            data = bytes(data)
+        return status, error, data
+
+    def _chance(self, rate, fault):
+        """
+        Decide randomly whether a fault is injected, and count it.
+        """
+        if (rate > 0.) and (self._random.random() < rate):
+            self.injected[fault] += 1
+            return True
+        return False
+
+    def _nack(self, slave_address):
+        return (self.STATUS_NACK, IOError(
+            'Injected NACK of device 0x{:02X}.'.format(slave_address)), b'')
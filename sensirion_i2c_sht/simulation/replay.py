@@ -0,0 +1,380 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+"""
+Recording of the transfers of a transceiver into a compact binary file, and
+replaying them without hardware, e.g. to benchmark the processing of real
+production traffic:
+
+.. sourcecode:: python
+
+    with RecordingI2cTransceiver(transceiver, 'traffic.i2c') as recorder:
+        sht4x = Sht4xI2cDevice(I2cConnection(recorder))
+        for _ in range(1000):
+            sht4x.single_shot_measurement()
+
+    replay = ReplayI2cTransceiver('traffic.i2c')
+    sht4x = Sht4xI2cDevice(I2cConnection(replay))
+    while not replay.finished:
+        sht4x.single_shot_measurement()
+
+The file starts with the header ``b'SHTI2C'``, the format version (1 byte)
+and the channel count (1 byte, 0 for single-channel transceivers). Every
+transfer is stored as its start time (float64, Seconds since the first
+transfer), its duration (float64, Seconds), the slave address (uint8), the
+TX data length (uint16, 0xFFFF for no write) followed by the TX data, and the
+RX length (uint16, 0xFFFF for no read). Then for every channel the status
+(uint8), the length of the received data (uint16) followed by the data, and
+the length of the error message (uint16) followed by the UTF-8 encoded
+message. All numbers are little endian.
+"""
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver.transceiver_v1 import I2cTransceiverV1
+from struct import Struct
+import threading
+import time
+
+try:
+    from time import monotonic
+except ImportError:  # Python 2
+    from time import time as monotonic
+
+MAGIC = b'SHTI2C'  #: Header of recording files.
+VERSION = 1  #: Format version of recording files.
+
+_HEADER = Struct('<6sBB')
+_TRANSFER = Struct('<ddBH')
+_LENGTH = Struct('<H')
+_CHANNEL = Struct('<BH')
+_NONE = 0xFFFF
+
+
+class RecordedTransfer(object):
+    """
+    A transfer read from a recording file, see :py:func:`read_transfers`.
+    """
+
+    def __init__(self, time, duration, slave_address, tx_data, rx_length,
+                 results):
+        """
+        Creates a recorded transfer.
+
+        :param float time:
+            Start time in Seconds since the first transfer of the recording.
+        :param float duration:
+            Duration of the transfer in Seconds.
+        :param byte slave_address:
+            The slave address of the transfer.
+        :param bytes tx_data:
+            The sent data, or None if nothing was written.
+        :param int rx_length:
+            The number of bytes to read, or None if nothing was read.
+        :param list results:
+            The result of every channel as tuple of status, error message
+            (str/None) and received data (bytes).
+        """
+        super(RecordedTransfer, self).__init__()
+        self.time = time  #: Start time in Seconds.
+        self.duration = duration  #: Duration in Seconds.
+        self.slave_address = slave_address  #: Slave address.
+        self.tx_data = tx_data  #: Sent data (bytes/None).
+        self.rx_length = rx_length  #: Number of bytes to read (int/None).
+        #: Status, error message and received data of every channel.
+        self.results = results
+
+
+def _read_exactly(f, length):
+    data = f.read(length)
+    if len(data) != length:
+        raise ValueError('The recording file is truncated.')
+    return data
+
+
+def read_transfers(f):
+    """
+    Read a recording file.
+
+    :param file f: The recording file, opened in binary mode.
+    :return:
+        The channel count (None for single-channel recordings) and the list
+        of transfers.
+    :rtype: tuple(int/None, list(RecordedTransfer))
+    :raises ValueError: If the file is no valid recording.
+    """
+    header = f.read(_HEADER.size)
+    if len(header) != _HEADER.size:
+        raise ValueError('The file is no I2C recording.')
+    magic, version, channel_count = _HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError('The file is no I2C recording.')
+    if version != VERSION:
+        raise ValueError('Unsupported recording version {}.'.format(version))
+    transfers = []
+    while True:
+        data = f.read(_TRANSFER.size)
+        if not data:
+            break
+        if len(data) != _TRANSFER.size:
+            raise ValueError('The recording file is truncated.')
+        start, duration, slave_address, tx_length = _TRANSFER.unpack(data)
+        tx_data = None if tx_length == _NONE \
+            else _read_exactly(f, tx_length)
+        rx_length, = _LENGTH.unpack(_read_exactly(f, _LENGTH.size))
+        results = []
+        for _ in range(channel_count or 1):
+            status, length = _CHANNEL.unpack(_read_exactly(f, _CHANNEL.size))
+            rx_data = _read_exactly(f, length)
+            length, = _LENGTH.unpack(_read_exactly(f, _LENGTH.size))
+            error = _read_exactly(f, length).decode('utf-8') if length \
+                else None
+            results.append((status, error, rx_data))
+        transfers.append(RecordedTransfer(
+            start, duration, slave_address, tx_data,
+            None if rx_length == _NONE else rx_length, results))
+    return channel_count or None, transfers
+
+
+class RecordingI2cTransceiver(I2cTransceiverV1):
+    """
+    Wrapper around another I²C transceiver which records all transfers
+    (sent and received data, timing and errors) into a file, which can be
+    replayed with :py:class:`ReplayI2cTransceiver`. The file format is
+    described in :py:mod:`sensirion_i2c_sht.simulation.replay`.
+
+    The file is written while the transfers are executed and must be closed
+    with :py:meth:`close` (or by using the transceiver as context manager).
+    """
+
+    def __init__(self, transceiver, file):
+        """
+        Constructs a new recording transceiver.
+
+        :param ~sensirion_i2c_driver.transceiver_v1.I2cTransceiverV1 transceiver:
+            The transceiver to wrap.
+        :param str/file file:
+            Path of the file to create, or a file opened in binary mode.
+        """  # noqa: E501
+        super(RecordingI2cTransceiver, self).__init__()
+        self._transceiver = transceiver
+        if hasattr(file, 'write'):
+            self._file, self._close_file = file, False
+        else:
+            self._file, self._close_file = open(file, 'wb'), True
+        self._file.write(_HEADER.pack(MAGIC, VERSION,
+                                      transceiver.channel_count or 0))
+        self._origin = None
+        self._lock = threading.Lock()
+        self.count = 0  #: Number of recorded transfers.
+
+    @property
+    def transceiver(self):
+        """
+        The wrapped transceiver.
+
+        :type: ~sensirion_i2c_driver.transceiver_v1.I2cTransceiverV1
+        """
+        return self._transceiver
+
+    @property
+    def description(self):
+        """
+        Description of the transceiver.
+
+        :type: str
+        """
+        return "Recording " + self._transceiver.description
+
+    @property
+    def channel_count(self):
+        """
+        Channel count of the wrapped transceiver.
+
+        :type: int/None
+        """
+        return self._transceiver.channel_count
+
+    def transceive(self, slave_address, tx_data, rx_length, read_delay,
+                   timeout):
+        """
+        Transceive an I²C frame with the wrapped transceiver and record it.
+        See
+        :py:meth:`~sensirion_i2c_driver.transceiver_v1.I2cTransceiverV1.transceive`.
+        """  # noqa: E501
+        start = monotonic()
+        result = self._transceiver.transceive(slave_address, tx_data,
+                                              rx_length, read_delay, timeout)
+        end = monotonic()
+        results = result if self.channel_count is not None else [result]
+        tx_data = None if tx_data is None else bytes(bytearray(tx_data))
+        record = [_TRANSFER.pack(0., 0., 0, 0)]  # placeholder
+        if tx_data is not None:
+            record.append(tx_data)
+        record.append(_LENGTH.pack(_NONE if rx_length is None
+                                   else rx_length))
+        for status, error, rx_data in results:
+            rx_data = bytes(bytearray(rx_data or b''))
+            message = b'' if error is None else str(error).encode('utf-8')
+            record.append(_CHANNEL.pack(status, len(rx_data)))
+            record.append(rx_data)
+            record.append(_LENGTH.pack(len(message)))
+            record.append(message)
+        with self._lock:
+            if self._origin is None:
+                self._origin = start
+            record[0] = _TRANSFER.pack(
+                start - self._origin, end - start, slave_address,
+                _NONE if tx_data is None else len(tx_data))
+            self._file.write(b''.join(record))
+            self.count += 1
+        return result
+
+    def close(self):
+        """
+        Finish the recording, i.e. flush and close the file (if it was
+        opened by this transceiver).
+        """
+        with self._lock:
+            if self._close_file:
+                self._file.close()
+            else:
+                self._file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class ReplayI2cTransceiver(I2cTransceiverV1):
+    """
+    I²C transceiver which returns the transfers of a recording made with
+    :py:class:`RecordingI2cTransceiver`, one after the other, e.g. to run
+    recorded production traffic through the drivers without hardware.
+
+    By default, the transfers are replayed at full speed, i.e. without any
+    delay. In real-time mode, every transfer is returned at the same time
+    (relative to the first transfer) and with the same duration as it was
+    recorded.
+
+    Every transfer must match the recorded one (slave address, sent data and
+    read length), otherwise a ValueError is raised, i.e. the drivers must
+    execute the same commands in the same order as when recording.
+    """
+
+    def __init__(self, file, real_time=False, loop=False):
+        """
+        Constructs a new replay transceiver.
+
+        :param str/file file:
+            Path of the recording file, or a file opened in binary mode.
+        :param bool real_time:
+            Whether to reproduce the recorded timing instead of replaying at
+            full speed.
+        :param bool loop:
+            Whether to restart at the first transfer after the last one,
+            otherwise an EOFError is raised.
+        """
+        super(ReplayI2cTransceiver, self).__init__()
+        if hasattr(file, 'read'):
+            self._channel_count, self._transfers = read_transfers(file)
+        else:
+            with open(file, 'rb') as f:
+                self._channel_count, self._transfers = read_transfers(f)
+        self.real_time = real_time  #: Whether to reproduce the timing.
+        self.loop = loop  #: Whether to restart after the last transfer.
+        self._position = 0
+        self._origin = None
+        self._lock = threading.Lock()
+
+    @property
+    def description(self):
+        """
+        Description of the transceiver.
+
+        :type: str
+        """
+        return "Replay I2C transceiver"
+
+    @property
+    def channel_count(self):
+        """
+        Channel count of the recorded transceiver.
+
+        :type: int/None
+        """
+        return self._channel_count
+
+    @property
+    def transfers(self):
+        """
+        All recorded transfers.
+
+        :type: list(RecordedTransfer)
+        """
+        return self._transfers
+
+    @property
+    def position(self):
+        """
+        Index of the next transfer to replay.
+
+        :type: int
+        """
+        return self._position
+
+    @property
+    def finished(self):
+        """
+        Whether all transfers have been replayed (never True in loop mode).
+
+        :type: bool
+        """
+        return (not self.loop) and self._position >= len(self._transfers)
+
+    def rewind(self):
+        """
+        Restart at the first transfer.
+        """
+        with self._lock:
+            self._position = 0
+            self._origin = None
+
+    def transceive(self, slave_address, tx_data, rx_length, read_delay,
+                   timeout):
+        """
+        Return the next recorded transfer. See
+        :py:meth:`~sensirion_i2c_driver.transceiver_v1.I2cTransceiverV1.transceive`.
+
+        :raises ValueError:
+            If the transfer does not match the recorded transfer.
+        :raises EOFError:
+            If all transfers have been replayed (and loop mode is disabled).
+        """  # noqa: E501
+        with self._lock:
+            if self._position >= len(self._transfers):
+                if not (self.loop and self._transfers):
+                    raise EOFError('All recorded transfers were replayed.')
+                self._position = 0
+                self._origin = None
+            transfer = self._transfers[self._position]
+            tx_data = None if tx_data is None else bytes(bytearray(tx_data))
+            if (slave_address != transfer.slave_address) or \
+                    (tx_data != transfer.tx_data) or \
+                    (rx_length != transfer.rx_length):
+                raise ValueError(
+                    'Transfer {} does not match the recording.'.format(
+                        self._position))
+            self._position += 1
+            if self.real_time:
+                now = monotonic()
+                if self._origin is None:
+                    self._origin = now - transfer.time
+                remaining = self._origin + transfer.time + \
+                    transfer.duration - now
+                if remaining > 0.:
+                    time.sleep(remaining)
+        results = [(status, None if error is None else IOError(error), data)
+                   for status, error, data in transfer.results]
+        return results if self._channel_count is not None else results[0]
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from ..crc import CRC8_INIT_00
+from .device import SimulatedShtDeviceBase
+
+
+class SimulatedSht2x(SimulatedShtDeviceBase):
+    """
+    Simulated SHT2x device, supporting temperature and humidity measurements
+    (no hold master mode), soft reset and the electronic identification code
+    (serial number).
+
+    Measurements take the typical measurement duration of the default
+    resolution (14 bit temperature, 12 bit humidity).
+    """
+
+    COMMAND_BYTES = 1
+    CRC = CRC8_INIT_00
+
+    #: Typical temperature measurement duration in Seconds.
+    TEMPERATURE_DURATION = 0.066
+
+    #: Typical humidity measurement duration in Seconds.
+    HUMIDITY_DURATION = 0.022
+
+    #: Soft reset duration in Seconds.
+    SOFT_RESET_DURATION = 0.015
+
+    def __init__(self, slave_address=0x40, temperature=25., humidity=50.,
+                 serial_number=0x0123456789ABCDEF):
+        """
+        Constructs a new simulated SHT2x device.
+
+        :param byte slave_address:
+            The I²C slave address, defaults to 0x40.
+        :param float temperature:
+            The ambient temperature in °C.
+        :param float humidity:
+            The ambient relative humidity in %RH.
+        :param int serial_number:
+            The 64-bit electronic identification code.
+        """
+        super(SimulatedSht2x, self).__init__(slave_address, temperature,
+                                             humidity, serial_number)
+        self._commands = {
+            0xF3: self._measure_temperature,
+            0xF5: self._measure_humidity,
+            0xFE: self._soft_reset,
+            0xFA: self._read_otp,
+            0xFC: self._read_metal_rom,
+        }
+
+    def _measure_temperature(self, now, data):
+        # the two status bits are 0b00 for temperature
+        ticks = self._ticks(self.temperature, -46.85, 175.72) & 0xFFFC
+        self._respond([ticks], now, self.TEMPERATURE_DURATION)
+
+    def _measure_humidity(self, now, data):
+        # the two status bits are 0b10 for humidity
+        ticks = self._ticks(self.humidity, -6., 125.) & 0xFFFC | 0x2
+        self._respond([ticks], now, self.HUMIDITY_DURATION)
+
+    def _soft_reset(self, now, data):
+        self._busy(now, self.SOFT_RESET_DURATION)
+
+    def _read_otp(self, now, data):
+        # 4 bytes of the serial number, each followed by its CRC
+        response = bytearray()
+        for shift in (40, 32, 24, 16):
+            byte = (self.serial_number >> shift) & 0xFF
+            response += bytearray([byte, self.CRC([byte])])
+        self._response = bytes(response)
+
+    def _read_metal_rom(self, now, data):
+        self._respond([self.serial_number & 0xFFFF,
+                       self.serial_number >> 48], now)
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from .device import SimulatedShtDeviceBase
+import math
+
+# Status register bits
+_ALERT_PENDING = 1 << 15
+_HEATER = 1 << 13
+_HUMIDITY_ALERT = 1 << 11
+_TEMPERATURE_ALERT = 1 << 10
+_RESET_DETECTED = 1 << 4
+_COMMAND_STATUS = 1 << 1
+_CLEARABLE = _ALERT_PENDING | _HUMIDITY_ALERT | _TEMPERATURE_ALERT | \
+    _RESET_DETECTED
+
+# Commands accepted in the periodic data acquisition mode
+_PERIODIC_MODE_COMMANDS = (0xE000, 0x3093, 0x2B32, 0x306D, 0x3066, 0xF32D,
+                           0x3041, 0x30A2)
+
+
+class SimulatedSht3x(SimulatedShtDeviceBase):
+    """
+    Simulated SHT3x device, supporting single shot measurements (with and
+    without clock stretching), the periodic data acquisition mode including
+    ART, the heater, the status register, soft reset and the serial number.
+
+    Measurements take the typical measurement duration of the repeatability.
+    While the heater is on, the measured temperature is increased by
+    :py:attr:`heater_temperature_rise`.
+    """
+
+    #: Typical measurement duration in Seconds for high, medium and low
+    #: repeatability.
+    MEASUREMENT_DURATIONS = (0.0125, 0.0045, 0.0025)
+
+    #: Soft reset duration in Seconds.
+    SOFT_RESET_DURATION = 0.0015
+
+    #: Duration of the break command in Seconds.
+    BREAK_DURATION = 0.001
+
+    def __init__(self, slave_address=0x44, temperature=25., humidity=50.,
+                 serial_number=0x12345678):
+        """
+        Constructs a new simulated SHT3x device.
+
+        :param byte slave_address:
+            The I²C slave address, defaults to 0x44.
+        :param float temperature:
+            The ambient temperature in °C.
+        :param float humidity:
+            The ambient relative humidity in %RH.
+        :param int serial_number:
+            The 32-bit serial number.
+        """
+        super(SimulatedSht3x, self).__init__(slave_address, temperature,
+                                             humidity, serial_number)
+        #: Temperature increase in °C while the heater is on.
+        self.heater_temperature_rise = 5.
+        self._status = _ALERT_PENDING | _RESET_DETECTED
+        self._periodic = None
+        self._fetched = 0
+        self._commands = {
+            0x3780: self._read_serial,
+            0xF32D: self._read_status,
+            0x3041: self._clear_status,
+            0x30A2: self._soft_reset,
+            0x306D: self._heater_on,
+            0x3066: self._heater_off,
+            0x3093: self._break,
+            0x2B32: self._art,
+            0xE000: self._fetch_data,
+        }
+        single_shot = {0x2400: 0, 0x240B: 1, 0x2416: 2}
+        clock_stretching = {0x2C06: 0, 0x2C0D: 1, 0x2C10: 2}
+        for code, repeatability in single_shot.items():
+            self._commands[code] = self._single_shot(repeatability, False)
+        for code, repeatability in clock_stretching.items():
+            self._commands[code] = self._single_shot(repeatability, True)
+        periodic = {
+            0x2032: (0.5, 0), 0x2024: (0.5, 1), 0x202F: (0.5, 2),
+            0x2130: (1., 0), 0x2126: (1., 1), 0x212D: (1., 2),
+            0x2236: (2., 0), 0x2220: (2., 1), 0x222B: (2., 2),
+            0x2334: (4., 0), 0x2322: (4., 1), 0x2329: (4., 2),
+            0x2737: (10., 0), 0x2721: (10., 1), 0x272A: (10., 2),
+        }
+        for code, (frequency, repeatability) in periodic.items():
+            self._commands[code] = self._start_periodic(frequency,
+                                                        repeatability)
+
+    @property
+    def status_register(self):
+        """
+        The current value of the status register.
+
+        :type: int
+        """
+        return self._status
+
+    @property
+    def periodic_mode(self):
+        """
+        Whether the periodic data acquisition mode is running.
+
+        :type: bool
+        """
+        return self._periodic is not None
+
+    def reset(self, now):
+        super(SimulatedSht3x, self).reset(now)
+        self._status = _ALERT_PENDING | _RESET_DETECTED
+        self._periodic = None
+
+    def write(self, data, now):
+        acknowledged = super(SimulatedSht3x, self).write(data, now)
+        if acknowledged and len(data) and \
+                bytearray(data)[0:2] != bytearray([0xF3, 0x2D]):
+            self._status &= ~_COMMAND_STATUS
+        return acknowledged
+
+    def _accepts(self, code):
+        return (self._periodic is None) or (code in _PERIODIC_MODE_COMMANDS)
+
+    def _reject(self, code):
+        self._status |= _COMMAND_STATUS
+
+    def _measurement(self):
+        if self._status & _HEATER:
+            temperature, humidity = self._heated(self.heater_temperature_rise)
+        else:
+            temperature, humidity = self.temperature, self.humidity
+        return [self._ticks(temperature, -45., 175.),
+                self._ticks(humidity, 0., 100.)]
+
+    def _single_shot(self, repeatability, clock_stretching):
+        def handler(now, data):
+            self._respond(self._measurement(), now,
+                          self.MEASUREMENT_DURATIONS[repeatability],
+                          clock_stretching)
+        return handler
+
+    def _start_periodic(self, frequency, repeatability):
+        def handler(now, data):
+            self._periodic = (now + self.MEASUREMENT_DURATIONS[repeatability],
+                              1. / frequency)
+            self._fetched = 0
+        return handler
+
+    def _art(self, now, data):
+        self._start_periodic(4., 0)(now, data)
+
+    def _fetch_data(self, now, data):
+        if self._periodic is None:
+            return
+        first_result, period = self._periodic
+        count = int(math.floor((now - first_result) / period)) + 1
+        if count > self._fetched:
+            self._fetched = count
+            self._respond(self._measurement(), now)
+
+    def _break(self, now, data):
+        self._periodic = None
+        self._busy(now, self.BREAK_DURATION)
+
+    def _read_serial(self, now, data):
+        self._respond([self.serial_number >> 16,
+                       self.serial_number & 0xFFFF], now)
+
+    def _read_status(self, now, data):
+        self._respond([self._status], now)
+
+    def _clear_status(self, now, data):
+        self._status &= ~_CLEARABLE
+
+    def _heater_on(self, now, data):
+        self._status |= _HEATER
+
+    def _heater_off(self, now, data):
+        self._status &= ~_HEATER
+
+    def _soft_reset(self, now, data):
+        self._status = _ALERT_PENDING | _RESET_DETECTED
+        self._periodic = None
+        self._busy(now, self.SOFT_RESET_DURATION)
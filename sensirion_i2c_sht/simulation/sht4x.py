@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from .device import SimulatedShtDeviceBase
+
+
+class SimulatedSht4x(SimulatedShtDeviceBase):
+    """
+    Simulated SHT4x device, supporting measurements, the heater, soft reset
+    and the serial number.
+
+    Measurements take the typical measurement duration of the repeatability.
+    A heater command takes the heating time followed by a high repeatability
+    measurement, and the measured temperature is increased depending on the
+    heater power and duration (see :py:attr:`HEATER_TEMPERATURE_RISE`).
+    """
+
+    COMMAND_BYTES = 1
+
+    #: Typical measurement duration in Seconds for high, medium and low
+    #: repeatability.
+    MEASUREMENT_DURATIONS = (0.0069, 0.0037, 0.0013)
+
+    #: Approximate temperature increase in °C at the end of the heating for
+    #: every heater command code.
+    HEATER_TEMPERATURE_RISE = {
+        0x39: 20., 0x32: 8.,  # 200 mW
+        0x2F: 11., 0x24: 4.4,  # 110 mW
+        0x1E: 2., 0x15: 0.8,  # 20 mW
+    }
+
+    #: Soft reset duration in Seconds.
+    SOFT_RESET_DURATION = 0.001
+
+    def __init__(self, slave_address=0x44, temperature=25., humidity=50.,
+                 serial_number=0x12345678):
+        """
+        Constructs a new simulated SHT4x device.
+
+        :param byte slave_address:
+            The I²C slave address, defaults to 0x44.
+        :param float temperature:
+            The ambient temperature in °C.
+        :param float humidity:
+            The ambient relative humidity in %RH.
+        :param int serial_number:
+            The 32-bit serial number.
+        """
+        super(SimulatedSht4x, self).__init__(slave_address, temperature,
+                                             humidity, serial_number)
+        #: Number of executed heater commands.
+        self.heater_activations = 0
+        self._commands = {
+            0x89: self._read_serial,
+            0x94: self._soft_reset,
+        }
+        for code, repeatability in {0xFD: 0, 0xF6: 1, 0xE0: 2}.items():
+            self._commands[code] = self._measure(repeatability)
+        heating_times = {0x39: 1., 0x32: .1, 0x2F: 1., 0x24: .1, 0x1E: 1.,
+                         0x15: .1}
+        for code, heating_time in heating_times.items():
+            self._commands[code] = self._heater(code, heating_time)
+
+    def _words(self, temperature, humidity):
+        return [self._ticks(temperature, -45., 175.),
+                self._ticks(humidity, -6., 125.)]
+
+    def _measure(self, repeatability):
+        def handler(now, data):
+            self._respond(self._words(self.temperature, self.humidity), now,
+                          self.MEASUREMENT_DURATIONS[repeatability])
+        return handler
+
+    def _heater(self, code, heating_time):
+        def handler(now, data):
+            self.heater_activations += 1
+            temperature, humidity = self._heated(
+                self.HEATER_TEMPERATURE_RISE[code])
+            self._respond(self._words(temperature, humidity), now,
+                          heating_time + self.MEASUREMENT_DURATIONS[0])
+        return handler
+
+    def _read_serial(self, now, data):
+        self._respond([self.serial_number >> 16,
+                       self.serial_number & 0xFFFF], now)
+
+    def _soft_reset(self, now, data):
+        self._busy(now, self.SOFT_RESET_DURATION)
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from .device import SimulatedShtDeviceBase
+
+_WAKE_UP = 0x3517
+
+
+class SimulatedShtc3(SimulatedShtDeviceBase):
+    """
+    Simulated SHTC3 device, supporting measurements in normal and low power
+    mode (with and without clock stretching), sleep and wake-up, soft reset
+    and the product ID.
+
+    While the device is sleeping, it only acknowledges the wake-up command.
+    Measurements take the typical measurement duration of the power mode.
+    """
+
+    #: Typical measurement duration in Seconds in normal and low power mode.
+    MEASUREMENT_DURATIONS = (0.0108, 0.0007)
+
+    #: Wake-up and soft reset duration in Seconds.
+    WAKE_UP_DURATION = 0.00024
+
+    #: The product ID register value.
+    PRODUCT_ID = 0x0887
+
+    def __init__(self, slave_address=0x70, temperature=25., humidity=50.):
+        """
+        Constructs a new simulated SHTC3 device, which is idle (i.e. not
+        sleeping) like after power-up.
+
+        :param byte slave_address:
+            The I²C slave address, defaults to 0x70.
+        :param float temperature:
+            The ambient temperature in °C.
+        :param float humidity:
+            The ambient relative humidity in %RH.
+        """
+        super(SimulatedShtc3, self).__init__(slave_address, temperature,
+                                             humidity, None)
+        self._sleeping = False
+        self._commands = {
+            _WAKE_UP: self._wake_up,
+            0xB098: self._sleep,
+            0x805D: self._soft_reset,
+            0xEFC8: self._read_product_id,
+            0x7866: self._measure(0, False),
+            0x609C: self._measure(1, False),
+            0x7CA2: self._measure(0, True),
+            0x6458: self._measure(1, True),
+        }
+
+    @property
+    def sleeping(self):
+        """
+        Whether the device is in sleep mode.
+
+        :type: bool
+        """
+        return self._sleeping
+
+    def reset(self, now):
+        super(SimulatedShtc3, self).reset(now)
+        self._sleeping = False
+
+    def _accepts(self, code):
+        return (not self._sleeping) or (code == _WAKE_UP)
+
+    def _measure(self, power_mode, clock_stretching):
+        def handler(now, data):
+            self._respond([self._ticks(self.temperature, -45., 175.),
+                           self._ticks(self.humidity, 0., 100.)], now,
+                          self.MEASUREMENT_DURATIONS[power_mode],
+                          clock_stretching)
+        return handler
+
+    def _wake_up(self, now, data):
+        if self._sleeping:
+            self._sleeping = False
+            self._busy(now, self.WAKE_UP_DURATION)
+
+    def _sleep(self, now, data):
+        self._sleeping = True
+
+    def _soft_reset(self, now, data):
+        self._busy(now, self.WAKE_UP_DURATION)
+
+    def _read_product_id(self, now, data):
+        self._respond([self.PRODUCT_ID], now)
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+"""
+Stress test harness to measure how acquisition loops degrade with
+communication faults. It can be run from the command line to stress all
+families with simulated devices, e.g.:
+
+.. sourcecode:: bash
+
+    python -m sensirion_i2c_sht.simulation.stress --iterations 200 \\
+        --crc-error-rate 0.01 --nack-rate 0.01 --reset-rate 0.001
+"""
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver import I2cConnection
+from ..sht2x import Sht2xI2cDevice
+from ..sht3x import Sht3xI2cDevice
+from ..sht4x import Sht4xI2cDevice
+from ..sts4x import Sts4xI2cDevice
+from ..shtc3 import Shtc3I2cDevice
+from .faults import FaultInjectingI2cTransceiver
+from .transceiver import SimulatedI2cTransceiver
+from .sht2x import SimulatedSht2x
+from .sht3x import SimulatedSht3x
+from .sht4x import SimulatedSht4x
+from .sts4x import SimulatedSts4x
+from .shtc3 import SimulatedShtc3
+import argparse
+import json
+import math
+
+try:
+    from time import monotonic
+except ImportError:  # Python 2
+    from time import time as monotonic
+
+#: Device class, simulated device class and measurement method of every
+#: family.
+FAMILIES = {
+    'sht2x': (Sht2xI2cDevice, SimulatedSht2x, 'single_shot_measurement'),
+    'sht3x': (Sht3xI2cDevice, SimulatedSht3x, 'single_shot_measurement'),
+    'sht4x': (Sht4xI2cDevice, SimulatedSht4x, 'single_shot_measurement'),
+    'sts4x': (Sts4xI2cDevice, SimulatedSts4x, 'single_shot_measurement'),
+    'shtc3': (Shtc3I2cDevice, SimulatedShtc3, 'measure'),
+}
+
+
+class StressReport(object):
+    """
+    Result of a stress test, see :py:func:`run_stress`.
+    """
+
+    def __init__(self, latencies, errors, recovery_times, duration):
+        """
+        Creates a report.
+
+        :param list latencies:
+            The duration in Seconds of every call.
+        :param dict errors:
+            The number of raised exceptions by exception class name.
+        :param list recovery_times:
+            The time in Seconds from every first failed call to the end of
+            the next successful call.
+        :param float duration:
+            The total duration of the stress test in Seconds.
+        """
+        super(StressReport, self).__init__()
+        self.iterations = len(latencies)  #: Number of calls.
+        self.errors = errors  #: Number of exceptions by class name.
+        self.successes = self.iterations - sum(errors.values())
+        self.duration = duration  #: Total duration in Seconds.
+        self.recovery_times = recovery_times  #: Recovery times in Seconds.
+        self._latencies = sorted(latencies)
+
+    @property
+    def throughput(self):
+        """
+        Successful calls per Second.
+
+        :type: float
+        """
+        return self.successes / self.duration if self.duration else 0.
+
+    def latency(self, percentile):
+        """
+        Get a percentile of the call latency (nearest-rank method).
+
+        :param float percentile: The percentile, e.g. 99.
+        :return: The latency in Seconds, or None if there were no calls.
+        :rtype: float/None
+        """
+        if not self._latencies:
+            return None
+        rank = int(math.ceil(percentile / 100. * len(self._latencies)))
+        return self._latencies[max(rank, 1) - 1]
+
+    @property
+    def max_recovery_time(self):
+        """
+        The longest time from a failure until the next success in Seconds, or
+        None if no call failed.
+
+        :type: float/None
+        """
+        return max(self.recovery_times) if self.recovery_times else None
+
+    def as_dict(self):
+        """
+        Get the report as a dict, e.g. to store it as JSON.
+
+        :rtype: dict
+        """
+        recovery = self.recovery_times
+        return dict(
+            iterations=self.iterations,
+            successes=self.successes,
+            errors=self.errors,
+            duration=self.duration,
+            throughput=self.throughput,
+            latency_p50=self.latency(50),
+            latency_p99=self.latency(99),
+            recovery_count=len(recovery),
+            recovery_mean=sum(recovery) / len(recovery) if recovery else None,
+            recovery_max=self.max_recovery_time,
+        )
+
+    def __str__(self):
+        def ms(value):
+            return '-' if value is None else '{:.2f} ms'.format(value * 1e3)
+        return '{:.1f}/s, p50 {}, p99 {}, {} of {} failed, max recovery ' \
+               '{}'.format(self.throughput, ms(self.latency(50)),
+                           ms(self.latency(99)),
+                           self.iterations - self.successes, self.iterations,
+                           ms(self.max_recovery_time))
+
+
+def run_stress(measure, iterations=1000):
+    """
+    Call a measurement function repeatedly and measure its latency, errors
+    and recovery time, e.g. to compare retry policies.
+
+    :param callable measure:
+        The function to call without arguments. Any exception it raises is
+        counted as failure.
+    :param int iterations:
+        Number of calls.
+    :return: The measured numbers.
+    :rtype: StressReport
+    """
+    latencies = []
+    errors = {}
+    recovery_times = []
+    failure_start = None
+    start = monotonic()
+    for _ in range(iterations):
+        call_start = monotonic()
+        try:
+            measure()
+            failed = False
+        except Exception as e:
+            name = type(e).__name__
+            errors[name] = errors.get(name, 0) + 1
+            failed = True
+        call_end = monotonic()
+        latencies.append(call_end - call_start)
+        if failed and (failure_start is None):
+            failure_start = call_start
+        elif (not failed) and (failure_start is not None):
+            recovery_times.append(call_end - failure_start)
+            failure_start = None
+    return StressReport(latencies, errors, recovery_times,
+                        monotonic() - start)
+
+
+def stress_family(family, iterations=100, ready_polling=True, **faults):
+    """
+    Stress the measurement of a simulated device with injected faults.
+
+    :param str family:
+        The sensor family, i.e. a key of :py:data:`FAMILIES`.
+    :param int iterations:
+        Number of measurements.
+    :param bool ready_polling:
+        Whether ready polling of the device is enabled.
+    :param faults:
+        Fault rates, see
+        :py:class:`~sensirion_i2c_sht.simulation.faults.FaultInjectingI2cTransceiver`.
+    :return: The measured numbers.
+    :rtype: StressReport
+    """  # noqa: E501
+    device_class, simulated_class, method = FAMILIES[family]
+    transceiver = FaultInjectingI2cTransceiver(
+        SimulatedI2cTransceiver([simulated_class()]), **faults)
+    device = device_class(I2cConnection(transceiver))
+    device.ready_polling = ready_polling
+    return run_stress(getattr(device, method), iterations)
+
+
+def main(args=None):
+    """
+    Run :py:func:`stress_family` for all families and print the reports.
+    """
+    parser = argparse.ArgumentParser(
+        description='Stress simulated devices with injected faults.')
+    parser.add_argument('--iterations', type=int, default=100)
+    parser.add_argument('--family', action='append', choices=sorted(FAMILIES),
+                        help='Family to stress (default: all)')
+    parser.add_argument('--no-ready-polling', action='store_true')
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--json', action='store_true',
+                        help='Print the reports as JSON')
+    for fault in ('crc-error', 'nack', 'delay', 'stuck', 'reset'):
+        parser.add_argument('--{}-rate'.format(fault), type=float, default=0.)
+    parser.add_argument('--readiness-delay', type=float, default=0.01)
+    args = parser.parse_args(args)
+    reports = {}
+    for family in args.family or sorted(FAMILIES):
+        reports[family] = stress_family(
+            family, args.iterations, not args.no_ready_polling,
+            crc_error_rate=args.crc_error_rate, nack_rate=args.nack_rate,
+            delay_rate=args.delay_rate, stuck_rate=args.stuck_rate,
+            reset_rate=args.reset_rate,
+            readiness_delay=args.readiness_delay, seed=args.seed)
+        if not args.json:
+            print('{}: {}'.format(family, reports[family]))
+    if args.json:
+        print(json.dumps(dict((family, report.as_dict())
+                              for family, report in reports.items()),
+                         indent=2, sort_keys=True))
+    return reports
+
+
+if __name__ == '__main__':
+    main()
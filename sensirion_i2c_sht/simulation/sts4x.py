@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from .device import SimulatedShtDeviceBase
+
+
+class SimulatedSts4x(SimulatedShtDeviceBase):
+    """
+    Simulated STS4x device, supporting temperature measurements, soft reset
+    and the serial number.
+
+    Measurements take the typical measurement duration of the repeatability.
+    """
+
+    COMMAND_BYTES = 1
+
+    #: Typical measurement duration in Seconds for high, medium and low
+    #: repeatability.
+    MEASUREMENT_DURATIONS = (0.0069, 0.0037, 0.0013)
+
+    #: Soft reset duration in Seconds.
+    SOFT_RESET_DURATION = 0.001
+
+    def __init__(self, slave_address=0x44, temperature=25.,
+                 serial_number=0x12345678):
+        """
+        Constructs a new simulated STS4x device.
+
+        :param byte slave_address:
+            The I²C slave address, defaults to 0x44.
+        :param float temperature:
+            The ambient temperature in °C.
+        :param int serial_number:
+            The 32-bit serial number.
+        """
+        super(SimulatedSts4x, self).__init__(slave_address, temperature,
+                                             None, serial_number)
+        self._commands = {
+            0x89: self._read_serial,
+            0x94: self._soft_reset,
+        }
+        for code, repeatability in {0xFD: 0, 0xF6: 1, 0xE0: 2}.items():
+            self._commands[code] = self._measure(repeatability)
+
+    def _measure(self, repeatability):
+        def handler(now, data):
+            self._respond([self._ticks(self.temperature, -45., 175.)], now,
+                          self.MEASUREMENT_DURATIONS[repeatability])
+        return handler
+
+    def _read_serial(self, now, data):
+        self._respond([self.serial_number >> 16,
+                       self.serial_number & 0xFFFF], now)
+
+    def _soft_reset(self, now, data):
+        self._busy(now, self.SOFT_RESET_DURATION)
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver.transceiver_v1 import I2cTransceiverV1
+import threading
+import time
+
+try:
+    from time import monotonic
+except ImportError:  # Python 2
+    from time import time as monotonic
+
+
+class SimulatedI2cTransceiver(I2cTransceiverV1):
+    """
+    I²C transceiver with simulated devices attached, to be used instead of a
+    real transceiver (e.g. a SensorBridge) by
+    :py:class:`~sensirion_i2c_driver.connection.I2cConnection`. This allows
+    running applications, tests and benchmarks without any hardware.
+
+    .. sourcecode:: python
+
+        from sensirion_i2c_driver import I2cConnection
+        from sensirion_i2c_sht.sht3x import Sht3xI2cDevice
+        from sensirion_i2c_sht.simulation import SimulatedI2cTransceiver, \\
+            SimulatedSht3x
+
+        transceiver = SimulatedI2cTransceiver([SimulatedSht3x()])
+        sht3x = Sht3xI2cDevice(I2cConnection(transceiver))
+
+    Like on a real bus, the read operation of a transfer happens after the
+    read delay of the command (the transceiver sleeps), and transfers are
+    executed one after the other (the transceiver is thread-safe). Transfers
+    to slave addresses without an attached device are not acknowledged.
+
+    With the ``channels`` argument, a multi-channel transceiver is simulated
+    which executes every transfer on all channels at the same time.
+    """
+
+    def __init__(self, devices=(), channels=None):
+        """
+        Constructs a new simulated transceiver.
+
+        :param list devices:
+            The simulated devices attached to the bus, e.g.
+            :py:class:`~sensirion_i2c_sht.simulation.sht3x.SimulatedSht3x`.
+        :param list channels:
+            To simulate a multi-channel transceiver, a list containing the
+            list of attached devices for every channel. Must not be used
+            together with ``devices``.
+        :raises ValueError:
+            If both ``devices`` and ``channels`` are passed.
+        """
+        super(SimulatedI2cTransceiver, self).__init__()
+        if channels is None:
+            self._channels = [self._address_map(devices)]
+        elif len(devices) == 0:
+            self._channels = [self._address_map(d) for d in channels]
+        else:
+            raise ValueError('Either devices or channels can be passed, '
+                             'but not both.')
+        self._multi_channel = channels is not None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _address_map(devices):
+        return dict((device.slave_address, device) for device in devices)
+
+    @property
+    def description(self):
+        """
+        Description of the transceiver.
+
+        :type: str
+        """
+        return "Simulated I2C transceiver"
+
+    @property
+    def channel_count(self):
+        """
+        Channel count of this transceiver, or None if it's a single-channel
+        transceiver.
+
+        :type: int/None
+        """
+        return len(self._channels) if self._multi_channel else None
+
+    def transceive(self, slave_address, tx_data, rx_length, read_delay,
+                   timeout):
+        """
+        Transceive an I²C frame with the simulated devices. See
+        :py:meth:`~sensirion_i2c_driver.transceiver_v1.I2cTransceiverV1.transceive`.
+        """  # noqa: E501
+        with self._lock:
+            devices = [c.get(slave_address) for c in self._channels]
+            results = [None] * len(devices)
+            now = monotonic()
+            for i, device in enumerate(devices):
+                if (device is None) or ((tx_data is not None) and
+                                        not device.write(tx_data, now)):
+                    results[i] = self._nack(slave_address)
+            if rx_length is not None:
+                self._read(devices, results, slave_address, rx_length,
+                           read_delay, timeout)
+            results = [r or (self.STATUS_OK, None, b'') for r in results]
+        return results if self._multi_channel else results[0]
+
+    def reset_device(self, slave_address, channel=0):
+        """
+        Simulate a power-on reset of an attached device, see
+        :py:meth:`~sensirion_i2c_sht.simulation.device.SimulatedShtDeviceBase.reset`.
+
+        :param byte slave_address:
+            The I²C address of the device to reset.
+        :param int channel:
+            The channel of the device (multi-channel transceivers only).
+        """  # noqa: E501
+        with self._lock:
+            device = self._channels[channel].get(slave_address)
+            if device is not None:
+                device.reset(monotonic())
+
+    def _read(self, devices, results, slave_address, rx_length, read_delay,
+              timeout):
+        """
+        Perform the read operation on all devices without a failed write
+        operation.
+        """
+        if read_delay > 0.:
+            time.sleep(read_delay)
+        now = monotonic()
+        stretch = max([d.stretch_time(now) for d, r in zip(devices, results)
+                       if r is None] + [0.])
+        if stretch > 0.:
+            time.sleep(min(stretch, timeout))
+            now = monotonic()
+        for i, device in enumerate(devices):
+            if results[i] is not None:
+                continue
+            if device.stretch_time(now) > 0.:
+                results[i] = (self.STATUS_TIMEOUT, IOError(
+                    'Clock stretching of device 0x{:02X} timed out.'.format(
+                        slave_address)), b'')
+                continue
+            data = device.read(rx_length, now)
+            if data is None:
+                results[i] = self._nack(slave_address)
+            else:
+                results[i] = (self.STATUS_OK, None, data)
+
+    def _nack(self, slave_address):
+        return (self.STATUS_NACK, IOError(
+            'Device 0x{:02X} did not acknowledge.'.format(slave_address)),
+            b'')
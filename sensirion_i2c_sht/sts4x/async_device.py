@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from ..async_device import AsyncShtI2cDeviceBase
+from ..commands import shared_command
+from .commands import Sts4xI2cCmdSoftReset, Sts4xI2cCmdReadSerial
+from .data_types import Sts4xRepeatability
+from .device import Sts4xI2cDevice
+
+
+class AsyncSts4xI2cDevice(AsyncShtI2cDeviceBase):
+    """
+    STS4x I²C device class to allow executing I²C commands with asyncio.
+
+    See :py:class:`~sensirion_i2c_sht.async_device.AsyncShtI2cDeviceBase` for
+    details.
+    """
+
+    def __init__(self, connection, slave_address=0x44, executor=None):
+        """
+        Constructs a new asynchronous STS4x I²C device.
+
+        :param ~sensirion_i2c_driver.connection.I2cConnection connection:
+            The I²C connection to use for communication.
+        :param byte slave_address:
+            The I²C slave address, defaults to 0x44.
+        :param ~concurrent.futures.Executor executor:
+            The executor to run the bus transfers in. If None, the default
+            executor of the event loop is used.
+        """
+        super(AsyncSts4xI2cDevice, self).__init__(
+            Sts4xI2cDevice(connection, slave_address), executor)
+
+    async def single_shot_measurement(
+            self, repeatability=Sts4xRepeatability.HIGH):
+        """
+        Trigger a measurement and read the temperature.
+
+        See :py:meth:`~sensirion_i2c_sht.sts4x.device.Sts4xI2cDevice.single_shot_measurement`.
+        """  # noqa: E501
+        return await self.execute(
+            self.device._single_shot_command(repeatability))
+
+    async def single_shot_measurement_raw(
+            self, repeatability=Sts4xRepeatability.HIGH, buffer=None,
+            offset=0):
+        """
+        Trigger a measurement and read the raw temperature ticks.
+
+        See :py:meth:`~sensirion_i2c_sht.sts4x.device.Sts4xI2cDevice.single_shot_measurement_raw`.
+        """  # noqa: E501
+        return await self._execute_raw(
+            self.device._single_shot_command(repeatability), buffer, offset)
+
+    async def soft_reset(self):
+        """
+        Perform a soft reset for the device.
+
+        See :py:meth:`~sensirion_i2c_sht.sts4x.device.Sts4xI2cDevice.soft_reset`.
+        """  # noqa: E501
+        return await self.execute(shared_command(Sts4xI2cCmdSoftReset))
+
+    async def read_serial_number(self):
+        """
+        Read the serial number from the device.
+
+        :return: The serial number.
+        :rtype: int
+        """
+        return await self.execute(shared_command(Sts4xI2cCmdReadSerial))
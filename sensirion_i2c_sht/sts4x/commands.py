@@ -2,7 +2,8 @@
 # (c) Copyright 2021 Sensirion AG, Switzerland
 
 from __future__ import absolute_import, division, print_function
-from sensirion_i2c_driver import SensirionI2cCommand, CrcCalculator
+from sensirion_i2c_driver import SensirionI2cCommand
+from ..crc import CRC8_INIT_FF
 from .response_types import Sts4xTemperature
 from struct import unpack
 
@@ -12,7 +13,7 @@ class Sts4xI2cCmdBase(SensirionI2cCommand):
     STS4x I²C base command.
     """
     def __init__(self, command, tx_data, rx_length, read_delay,
-                 post_processing_time=0.0):
+                 post_processing_time=0.0, typical_read_delay=None):
         """
         Constructs a new STS4x I²C command.
 
@@ -42,6 +43,10 @@ class Sts4xI2cCmdBase(SensirionI2cCommand):
             example after a device reset command, the device might need some
             time until it is ready again. Usually this is 0.0s, i.e. no post
             processing is needed.
+        :param float typical_read_delay:
+            Typical duration (in Seconds) the device needs to prepare the RX
+            data. Used as first read attempt if ready polling is enabled. None
+            means that the command does not support ready polling.
         """
         super(Sts4xI2cCmdBase, self).__init__(
             command=command,
@@ -49,17 +54,37 @@ class Sts4xI2cCmdBase(SensirionI2cCommand):
             rx_length=rx_length,
             read_delay=read_delay,
             timeout=0.0,  # STS4x does not support clock stretching
-            crc=CrcCalculator(8, 0x31, 0xFF),
+            crc=CRC8_INIT_FF,
             command_bytes=1,
             post_processing_time=post_processing_time,
         )
 
+        #: Typical delay in Seconds between write and read operation
+        #: (float/None).
+        self.typical_read_delay = typical_read_delay
+
+    def interpret_response(self, data):
+        """
+        Validates the CRCs of the received data from the device and returns
+        the data with all CRCs removed.
+
+        :param bytes data:
+            Received raw bytes from the read operation.
+        :return:
+            The received bytes, or None if there is no data received.
+        :rtype:
+            bytes or None
+        :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
+            If a received CRC was wrong.
+        """
+        return self._crc.verify_words(data)
+
 
 class Sts4xI2cCmdMeasBase(Sts4xI2cCmdBase):
     """
     Base STS4x command for a single shot measurement.
     """
-    def __init__(self, command, read_delay):
+    def __init__(self, command, read_delay, typical_read_delay=None):
         """
         Constructs a new command.
 
@@ -73,12 +98,16 @@ class Sts4xI2cCmdMeasBase(Sts4xI2cCmdBase):
             if the device needs some time to prepare the RX data, e.g. if it
             has to perform a measurement. Set to 0.0 to indicate that no delay
             is needed, i.e. the device does not need any processing time.
+        :param float typical_read_delay:
+            Typical duration (in Seconds) of the measurement, or None if ready
+            polling is not supported.
         """
         super(Sts4xI2cCmdMeasBase, self).__init__(
             command=command,
             tx_data=b'',
             rx_length=3,
             read_delay=read_delay,
+            typical_read_delay=typical_read_delay,
         )
 
     def interpret_response(self, data):
@@ -95,10 +124,21 @@ class Sts4xI2cCmdMeasBase(Sts4xI2cCmdBase):
         :rtype:
             :py:class:`~sensirion_i2c_sht.sts4x.response_types.Sts4xTemperature`
         """  # noqa: E501
+        return Sts4xTemperature(self.interpret_ticks(data))
+
+    def interpret_ticks(self, data):
+        """
+        Converts the raw response from the device to the raw ticks, without
+        creating a response object.
 
-        checked_data = SensirionI2cCommand.interpret_response(self, data)
+        :param bytes data:
+            Received raw bytes from the read operation.
+        :return: The temperature ticks.
+        :rtype: int
+        """
+        checked_data = Sts4xI2cCmdBase.interpret_response(self, data)
         temperature_ticks, = unpack(">H", checked_data)
-        return Sts4xTemperature(temperature_ticks)
+        return temperature_ticks
 
 
 class Sts4xI2cCmdMeasHighRes(Sts4xI2cCmdMeasBase):
@@ -112,6 +152,7 @@ class Sts4xI2cCmdMeasHighRes(Sts4xI2cCmdMeasBase):
         super(Sts4xI2cCmdMeasHighRes, self).__init__(
             command=0xFD,
             read_delay=0.009,
+            typical_read_delay=0.0069,
         )
 
 
@@ -126,6 +167,7 @@ class Sts4xI2cCmdMeasMediumRes(Sts4xI2cCmdMeasBase):
         super(Sts4xI2cCmdMeasMediumRes, self).__init__(
             command=0xF6,
             read_delay=0.005,
+            typical_read_delay=0.0037,
         )
 
 
@@ -140,6 +182,7 @@ class Sts4xI2cCmdMeasLowRes(Sts4xI2cCmdMeasBase):
         super(Sts4xI2cCmdMeasLowRes, self).__init__(
             command=0xE0,
             read_delay=0.002,
+            typical_read_delay=0.0013,
         )
 
 
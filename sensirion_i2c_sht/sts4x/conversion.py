@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from ..conversion import convert_ticks
+
+
+def _degrees_celsius(ticks):
+    return -45. + 175. * ticks / 65535.
+
+
+def _degrees_fahrenheit(ticks):
+    return -49. + 315. * ticks / 65535.
+
+
+def ticks_to_degrees_celsius(ticks):
+    """
+    Convert many temperature ticks to °C at once, with the same formula as
+    :py:attr:`~sensirion_i2c_sht.sts4x.response_types.Sts4xTemperature.degrees_celsius`.
+
+    :param iterable ticks:
+        The raw ticks, e.g. a :py:class:`numpy.ndarray` or an
+        :py:class:`array.array` of type ``'H'``.
+    :return: The converted temperatures, see
+        :py:func:`~sensirion_i2c_sht.conversion.convert_ticks`.
+    :rtype: numpy.ndarray / array.array
+    """  # noqa: E501
+    return convert_ticks(ticks, _degrees_celsius)
+
+
+def ticks_to_degrees_fahrenheit(ticks):
+    """
+    Convert many temperature ticks to °F at once, with the same formula as
+    :py:attr:`~sensirion_i2c_sht.sts4x.response_types.Sts4xTemperature.degrees_fahrenheit`.
+
+    :param iterable ticks:
+        The raw ticks, e.g. a :py:class:`numpy.ndarray` or an
+        :py:class:`array.array` of type ``'H'``.
+    :return: The converted temperatures, see
+        :py:func:`~sensirion_i2c_sht.conversion.convert_ticks`.
+    :rtype: numpy.ndarray / array.array
+    """  # noqa: E501
+    return convert_ticks(ticks, _degrees_fahrenheit)
@@ -2,17 +2,21 @@
 # (c) Copyright 2021 Sensirion AG, Switzerland
 
 from __future__ import absolute_import, division, print_function
-from sensirion_i2c_driver import I2cDevice
+from ..commands import shared_command
+from ..device import ShtI2cDeviceBase
+from . import conversion
 from .commands import Sts4xI2cCmdMeasHighRes, Sts4xI2cCmdMeasMediumRes, \
     Sts4xI2cCmdMeasLowRes, Sts4xI2cCmdSoftReset, Sts4xI2cCmdReadSerial
 from .data_types import Sts4xRepeatability
 
 
-class Sts4xI2cDevice(I2cDevice):
+class Sts4xI2cDevice(ShtI2cDeviceBase):
     """
     STS4x I²C device class to allow executing I²C commands.
     """
 
+    _pre_trigger_supported = True
+
     def __init__(self, connection, slave_address=0x44):
         """
         Constructs a new STS4x I²C device.
@@ -40,22 +44,95 @@ class Sts4xI2cDevice(I2cDevice):
         :rtype:
             tuple
         """  # noqa: E501
+        return self._measure(self._single_shot_command(repeatability))
+
+    def single_shot_measurement_raw(self, repeatability=Sts4xRepeatability.HIGH,
+                                    buffer=None, offset=0):
+        """
+        Trigger a measurement and read the raw temperature ticks, without
+        creating a response object. The ticks can be converted later, e.g. in
+        bulk with :py:mod:`~sensirion_i2c_sht.sts4x.conversion`.
+
+        :param `~sensirion_i2c_sht.sts4x.data_types.Sts4xRepeatability` repeatability:
+            Configure the repeatability setting.
+        :param buffer:
+            Optional writable sequence, e.g. an :py:class:`array.array` of
+            type ``'H'``, to store the temperature ticks into instead of
+            returning them. Not supported on multi-channel connections.
+        :param int offset:
+            Index of ``buffer`` where to store the temperature ticks.
+        :return:
+            The temperature ticks, or the index of ``buffer`` following the
+            stored ticks if a buffer is passed.
+        :rtype:
+            int
+        :raises ValueError:
+            If the passed parameters are not valid.
+        """  # noqa: E501
+        return self._execute_raw(self._single_shot_command(repeatability),
+                                 buffer, offset)
+
+    def single_shot_measurement_multi_channel(
+            self, repeatability=Sts4xRepeatability.HIGH):
+        """
+        Trigger a measurement on all channels of a multi-channel connection
+        and read the results as columns, i.e. as arrays with one item per
+        channel instead of a list of response objects and exceptions. Errors
+        do not raise an exception but are reported per channel. Works on
+        single-channel connections too, returning one channel.
+
+        :param `~sensirion_i2c_sht.sts4x.data_types.Sts4xRepeatability` repeatability:
+            Configure the repeatability setting.
+        :return: The ticks, converted values and errors of all channels.
+        :rtype: :py:class:`~sensirion_i2c_sht.multi_channel.MultiChannelResult`
+        :raises ValueError:
+            If the passed parameters are not valid.
+        """  # noqa: E501
+        return self._execute_multi_channel(
+            self._single_shot_command(repeatability), conversion)
+
+    def start_measurement(self, repeatability=Sts4xRepeatability.HIGH):
+        """
+        Trigger a measurement without waiting for its result. The result can
+        be read afterwards with
+        :py:meth:`~sensirion_i2c_sht.device.ShtI2cDeviceBase.read_measurement`
+        (or the :py:meth:`~sensirion_i2c_sht.device.MeasurementHandle.result`
+        method of the returned handle), which allows doing other things while
+        the device is measuring.
+
+        .. note:: Any other command sent to the device before the result is
+                  read discards the measurement result.
+
+        :param `~sensirion_i2c_sht.sts4x.data_types.Sts4xRepeatability` repeatability:
+            Configure the repeatability setting.
+        :raises ValueError:
+            If the passed repeatability is not valid.
+        :return: The handle of the started measurement.
+        :rtype: :py:class:`~sensirion_i2c_sht.device.MeasurementHandle`
+        """  # noqa: E501
+        return self._start_measurement(
+            self._single_shot_command(repeatability))
+
+    def _single_shot_command(self, repeatability):
+        """
+        Get the single shot measurement command for the given repeatability.
+        """
         if repeatability == Sts4xRepeatability.HIGH:
-            result = self.execute(Sts4xI2cCmdMeasHighRes())
+            command = shared_command(Sts4xI2cCmdMeasHighRes)
         elif repeatability == Sts4xRepeatability.MEDIUM:
-            result = self.execute(Sts4xI2cCmdMeasMediumRes())
+            command = shared_command(Sts4xI2cCmdMeasMediumRes)
         elif repeatability == Sts4xRepeatability.LOW:
-            result = self.execute(Sts4xI2cCmdMeasLowRes())
+            command = shared_command(Sts4xI2cCmdMeasLowRes)
         else:
             raise ValueError('Unknown argument for repeatability.')
-        return result
+        return command
 
     def soft_reset(self):
         """
         Perform a soft reset for the device. This can be used to force the
         system into a well-defined state without removing the power supply.
         """
-        return self.execute(Sts4xI2cCmdSoftReset())
+        return self.execute(shared_command(Sts4xI2cCmdSoftReset))
 
     def read_serial_number(self):
         """
@@ -64,4 +141,4 @@ class Sts4xI2cDevice(I2cDevice):
         :return: The serial number.
         :rtype: int
         """
-        return self.execute(Sts4xI2cCmdReadSerial())
+        return self.execute(shared_command(Sts4xI2cCmdReadSerial))
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from .instrumentation import chain_callbacks
+from collections import deque
+from functools import partial
+import json
+import threading
+
+
+class TraceRecorder(object):
+    """
+    Records the commands executed by devices as trace events, which can be
+    exported in the Chrome trace event format and opened in
+    ``chrome://tracing`` or https://ui.perfetto.dev, e.g. to see how the
+    commands of several devices on a bus interleave:
+
+    .. sourcecode:: python
+
+        recorder = TraceRecorder()
+        for device in (sht3x, sht4x):
+            recorder.attach(device)
+        MeasurementScheduler([sht3x, sht4x]).sweep()
+        recorder.save('trace.json')
+
+    Every bus (transceiver) is shown as a process and every device as a
+    thread. Each command is an event named by its command class, containing
+    an event for every phase (``write``, ``read_delay``, ``read``,
+    ``post_processing``, ..., see
+    :py:class:`~sensirion_i2c_sht.instrumentation.Transaction`).
+
+    The events are stored in a buffer of limited size, i.e. the oldest events
+    are discarded once it is full.
+    """
+
+    def __init__(self, max_events=100000):
+        """
+        Creates a recorder.
+
+        :param int max_events:
+            Maximum number of buffered events (every command and every phase
+            is an event).
+        """
+        super(TraceRecorder, self).__init__()
+        self._events = deque(maxlen=max_events)
+        self._buses = []
+        self._devices = {}
+        self._lock = threading.Lock()
+        self.dropped = 0  #: Number of events discarded from the buffer.
+
+    def attach(self, device, name=None, bus=None):
+        """
+        Record the commands of a device, by adding the recorder to its
+        instrumentation callbacks.
+
+        :param ~sensirion_i2c_sht.device.ShtI2cDeviceBase device:
+            The device to record.
+        :param str name:
+            Name of the device in the trace. Defaults to its slave address,
+            e.g. ``'0x44'``.
+        :param bus:
+            Any object identifying the bus of the device, e.g. the I²C
+            transceiver. Defaults to the transceiver of the device's
+            connection, i.e. devices with separate connections over the same
+            transceiver are shown on the same bus.
+        :return: The instrumentation callback added to the device.
+        :rtype: callable
+        """
+        if bus is None:
+            bus = getattr(device.connection, '_transceiver', device.connection)
+        with self._lock:
+            # compared by identity, the buses are kept referenced so their
+            # identity is not reused
+            pid = next((pid for key, pid in self._buses if key is bus), None)
+            if pid is None:
+                pid = len(self._buses) + 1
+                self._buses.append((bus, pid))
+            thread = len(self._devices) + 1
+            self._devices[thread] = (pid, name or '0x{:02X}'.format(
+                device.slave_address))
+        callback = partial(self.record, bus=pid, thread=thread)
+        device.instrumentation = chain_callbacks(device.instrumentation,
+                                                 callback)
+        return callback
+
+    def record(self, transaction, bus=1, thread=None):
+        """
+        Add the events of a transaction.
+
+        :param ~sensirion_i2c_sht.instrumentation.Transaction transaction:
+            The transaction to add.
+        :param int bus:
+            Process ID of the bus in the trace.
+        :param int thread:
+            Thread ID of the device in the trace. Defaults to the slave
+            address.
+        """
+        if not transaction.phases:
+            return
+        if thread is None:
+            thread = transaction.slave_address
+        command = transaction.command_class.__name__
+        args = dict(address='0x{:02X}'.format(transaction.slave_address))
+        if transaction.error is not None:
+            args['error'] = '{}: {}'.format(type(transaction.error).__name__,
+                                            transaction.error)
+        events = [(command, 'command', transaction.start, transaction.end,
+                   bus, thread, args)]
+        for phase, start, end in transaction.phases:
+            events.append((phase, 'phase', start, end, bus, thread,
+                           dict(address=args['address'], command=command)))
+        with self._lock:
+            free = self._events.maxlen - len(self._events) \
+                if self._events.maxlen is not None else len(events)
+            self.dropped += max(len(events) - free, 0)
+            self._events.extend(events)
+
+    def clear(self):
+        """
+        Discard all recorded events.
+        """
+        with self._lock:
+            self._events.clear()
+            self.dropped = 0
+
+    def as_dict(self):
+        """
+        Get the recorded events in the Chrome trace event format.
+
+        :rtype: dict
+        """
+        with self._lock:
+            events = list(self._events)
+            devices = dict(self._devices)
+        trace_events = []
+        for bus in sorted(set(bus for bus, _ in devices.values())):
+            trace_events.append(dict(name='process_name', ph='M', pid=bus,
+                                     tid=0, args=dict(name='I2C bus {}'
+                                                      .format(bus))))
+        for thread, (bus, name) in sorted(devices.items()):
+            trace_events.append(dict(name='thread_name', ph='M', pid=bus,
+                                     tid=thread, args=dict(name=name)))
+        for name, category, start, end, bus, thread, args in events:
+            trace_events.append(dict(name=name, cat=category, ph='X',
+                                     ts=start * 1e6, dur=(end - start) * 1e6,
+                                     pid=bus, tid=thread, args=args))
+        return dict(traceEvents=trace_events, displayTimeUnit='ms',
+                    otherData=dict(dropped_events=self.dropped))
+
+    def save(self, path):
+        """
+        Save the recorded events as a Chrome trace JSON file.
+
+        :param str path: The path of the file to write.
+        """
+        with open(path, 'w') as f:
+            json.dump(self.as_dict(), f)
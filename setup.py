@@ -40,6 +40,9 @@ setup(
         'enum34;python_version<"3.4"',
     ],
     extras_require={
+        'numpy': [
+            'numpy',
+        ],
         'test': [
             'flake8~=3.6.0;python_version<="3.6"',
             'flake8~=6.0;python_version>"3.6"',
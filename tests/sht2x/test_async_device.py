@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_sht.sht2x import Sht2xTemperature, Sht2xHumidity
+from sensirion_i2c_sht.sht2x.async_device import AsyncSht2xI2cDevice
+import pytest
+
+
+@pytest.mark.needs_device
+@pytest.mark.needs_sht2x
+@pytest.mark.parametrize("ready_polling", [False, True])
+def test_single_shot_measurement(sht2x, ready_polling, run_coroutine):
+    """
+    Test if the measurement of the asynchronous device returns the proper
+    result.
+    """
+    device = AsyncSht2xI2cDevice(sht2x.connection, sht2x.slave_address)
+    device.device.ready_polling = ready_polling
+    temperature, humidity = run_coroutine(device.single_shot_measurement())
+    assert type(temperature) is Sht2xTemperature
+    assert type(temperature.ticks) is int
+    assert type(humidity) is Sht2xHumidity
+    assert type(humidity.ticks) is int
@@ -3,16 +3,19 @@
 
 from __future__ import absolute_import, division, print_function
 from sensirion_i2c_sht.sht2x import Sht2xTemperature, Sht2xHumidity
+from array import array
 import pytest
 
 
 @pytest.mark.needs_device
 @pytest.mark.needs_sht2x
-def test_single_shot_measurement(sht2x):
+@pytest.mark.parametrize("ready_polling", [False, True])
+def test_single_shot_measurement(sht2x, ready_polling):
     """
     Test if the command is accepted by the device and returns the proper
     result.
     """
+    sht2x.ready_polling = ready_polling
     temperature, humidity = sht2x.single_shot_measurement()
     assert type(temperature) is Sht2xTemperature
     assert type(temperature.ticks) is int
@@ -20,6 +23,20 @@ def test_single_shot_measurement(sht2x):
     assert type(humidity.ticks) is int
 
 
+@pytest.mark.needs_device
+@pytest.mark.needs_sht2x
+def test_start_measurement(sht2x):
+    """
+    Test if a measurement can be started and read in separate steps.
+    """
+    handle = sht2x.start_measurement()
+    assert handle.step() is False  # temperature read, humidity started
+    temperature, humidity = sht2x.read_measurement()
+    assert type(temperature) is Sht2xTemperature
+    assert type(humidity) is Sht2xHumidity
+    assert handle.done is True
+
+
 @pytest.mark.needs_device
 @pytest.mark.needs_sht2x
 def test_soft_reset(sht2x):
@@ -40,3 +57,32 @@ def test_read_serial_number(sht2x):
     """
     result = sht2x.read_serial_number()
     assert type(result) is int
+
+
+@pytest.mark.needs_device
+@pytest.mark.needs_sht2x
+def test_single_shot_measurement_raw(sht2x):
+    """
+    Test if the raw ticks are returned or stored into a buffer.
+    """
+    temperature_ticks, humidity_ticks = sht2x.single_shot_measurement_raw()
+    assert type(temperature_ticks) is int
+    assert type(humidity_ticks) is int
+    buffer = array('H', [0, 0, 0])
+    assert sht2x.single_shot_measurement_raw(buffer=buffer, offset=1) == 3
+    assert buffer[0] == 0
+
+
+@pytest.mark.needs_device
+@pytest.mark.needs_sht2x
+def test_single_shot_measurement_multi_channel(sht2x):
+    """
+    Test if the columnar result contains one valid channel on a
+    single-channel connection.
+    """
+    result = sht2x.single_shot_measurement_multi_channel()
+    assert result.channel_count == 1
+    assert result.valid[0]
+    assert result.errors == [None]
+    assert -45. < result.degrees_celsius[0] < 130.
+    assert 0. <= result.percent_rh[0] <= 100.
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_sht.sht3x import Sht3xTemperature, Sht3xHumidity
+from sensirion_i2c_sht.sht3x.async_device import AsyncSht3xI2cDevice
+import asyncio
+import pytest
+
+
+@pytest.mark.needs_device
+@pytest.mark.needs_sht3x
+@pytest.mark.parametrize("ready_polling", [False, True])
+def test_single_shot_measurement(sht3x, ready_polling, run_coroutine):
+    """
+    Test if the measurement of the asynchronous device returns the proper
+    result.
+    """
+    device = AsyncSht3xI2cDevice(sht3x.connection, sht3x.slave_address)
+    device.device.ready_polling = ready_polling
+    temperature, humidity = run_coroutine(device.single_shot_measurement())
+    assert type(temperature) is Sht3xTemperature
+    assert type(temperature.ticks) is int
+    assert type(humidity) is Sht3xHumidity
+    assert type(humidity.ticks) is int
+
+
+@pytest.mark.needs_device
+@pytest.mark.needs_sht3x
+def test_periodic_measurement(sht3x, run_coroutine):
+    """
+    Test if the periodic data acquisition mode works with the asynchronous
+    device.
+    """
+    device = AsyncSht3xI2cDevice(sht3x.connection, sht3x.slave_address)
+
+    async def run():
+        await device.start_periodic_measurement()
+        await asyncio.sleep(1.5)
+        result = await device.fetch_data()
+        await device.stop_periodic_measurement()
+        return result
+
+    temperature, humidity = run_coroutine(run())
+    assert type(temperature) is Sht3xTemperature
+    assert type(humidity) is Sht3xHumidity
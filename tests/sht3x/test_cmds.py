@@ -4,6 +4,7 @@
 from __future__ import absolute_import, division, print_function
 from sensirion_i2c_sht.sht3x import Sht3xTemperature, Sht3xHumidity, \
     Sht3xStatusRegister, Sht3xRepeatability
+from array import array
 import pytest
 
 
@@ -33,19 +34,43 @@ def sht3x_with_cmd_status_check(sht3x):
     Sht3xRepeatability.MEDIUM,
     Sht3xRepeatability.LOW,
 ])
-def test_single_shot_measurement(sht3x_with_cmd_status_check, repeatability):
+@pytest.mark.parametrize("clock_stretching", [False, True])
+@pytest.mark.parametrize("ready_polling", [False, True])
+def test_single_shot_measurement(sht3x_with_cmd_status_check, repeatability,
+                                 clock_stretching, ready_polling):
     """
     Test if the command is accepted by the device and returns the proper
     result.
     """
+    sht3x_with_cmd_status_check.ready_polling = ready_polling
     temperature, humidity = \
-        sht3x_with_cmd_status_check.single_shot_measurement(repeatability)
+        sht3x_with_cmd_status_check.single_shot_measurement(
+            repeatability, clock_stretching)
     assert type(temperature) is Sht3xTemperature
     assert type(temperature.ticks) is int
     assert type(humidity) is Sht3xHumidity
     assert type(humidity.ticks) is int
 
 
+@pytest.mark.needs_device
+@pytest.mark.needs_sht3x
+@pytest.mark.parametrize("repeatability", [
+    Sht3xRepeatability.HIGH,
+    Sht3xRepeatability.MEDIUM,
+    Sht3xRepeatability.LOW,
+])
+def test_start_measurement(sht3x_with_cmd_status_check, repeatability):
+    """
+    Test if a measurement can be started and read in separate steps.
+    """
+    handle = sht3x_with_cmd_status_check.start_measurement(repeatability)
+    assert handle.ready_time > handle.start_time
+    temperature, humidity = sht3x_with_cmd_status_check.read_measurement()
+    assert type(temperature) is Sht3xTemperature
+    assert type(humidity) is Sht3xHumidity
+    assert handle.result() == (temperature, humidity)
+
+
 @pytest.mark.needs_device
 @pytest.mark.needs_sht3x
 def test_heater_on(sht3x_with_cmd_status_check):
@@ -111,3 +136,32 @@ def test_read_serial_number(sht3x_with_cmd_status_check):
     """
     result = sht3x_with_cmd_status_check.read_serial_number()
     assert type(result) is int
+
+
+@pytest.mark.needs_device
+@pytest.mark.needs_sht3x
+def test_single_shot_measurement_raw(sht3x):
+    """
+    Test if the raw ticks are returned or stored into a buffer.
+    """
+    temperature_ticks, humidity_ticks = sht3x.single_shot_measurement_raw()
+    assert type(temperature_ticks) is int
+    assert type(humidity_ticks) is int
+    buffer = array('H', [0, 0, 0])
+    assert sht3x.single_shot_measurement_raw(buffer=buffer, offset=1) == 3
+    assert buffer[0] == 0
+
+
+@pytest.mark.needs_device
+@pytest.mark.needs_sht3x
+def test_single_shot_measurement_multi_channel(sht3x):
+    """
+    Test if the columnar result contains one valid channel on a
+    single-channel connection.
+    """
+    result = sht3x.single_shot_measurement_multi_channel()
+    assert result.channel_count == 1
+    assert result.valid[0]
+    assert result.errors == [None]
+    assert -45. < result.degrees_celsius[0] < 130.
+    assert 0. <= result.percent_rh[0] <= 100.
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_sht.sht3x import Sht3xTemperature, Sht3xHumidity
+from sensirion_i2c_sht.sht3x import conversion
+from array import array
+import pytest
+
+TICKS = [0, 1, 12345, 32768, 65534, 65535]
+
+
+def test_temperature():
+    """
+    Test if the vectorized temperature conversion returns exactly the same
+    values as the response type.
+    """
+    ticks = array('H', TICKS)
+    assert list(conversion.ticks_to_degrees_celsius(ticks)) == \
+        [Sht3xTemperature(t).degrees_celsius for t in TICKS]
+    assert list(conversion.ticks_to_degrees_fahrenheit(ticks)) == \
+        [Sht3xTemperature(t).degrees_fahrenheit for t in TICKS]
+
+
+def test_humidity():
+    """
+    Test if the vectorized humidity conversion returns exactly the same
+    values as the response type.
+    """
+    ticks = array('H', TICKS)
+    assert list(conversion.ticks_to_percent_rh(ticks)) == \
+        [Sht3xHumidity(t).percent_rh for t in TICKS]
+
+
+def test_numpy():
+    """
+    Test if NumPy arrays are converted to NumPy arrays with the same values.
+    """
+    numpy = pytest.importorskip("numpy")
+    result = conversion.ticks_to_degrees_celsius(
+        numpy.array(TICKS, dtype=numpy.uint16))
+    assert type(result) is numpy.ndarray
+    assert list(result) == [Sht3xTemperature(t).degrees_celsius for t in TICKS]
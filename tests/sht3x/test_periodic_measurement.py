@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2020 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_sht.sht3x import Sht3xTemperature, Sht3xHumidity, \
+    Sht3xRepeatability, Sht3xMeasurementFrequency
+import pytest
+import time
+
+
+@pytest.mark.needs_device
+@pytest.mark.needs_sht3x
+@pytest.mark.parametrize("frequency", [
+    Sht3xMeasurementFrequency.MPS_0_5,
+    Sht3xMeasurementFrequency.MPS_1,
+    Sht3xMeasurementFrequency.MPS_2,
+    Sht3xMeasurementFrequency.MPS_4,
+    Sht3xMeasurementFrequency.MPS_10,
+])
+@pytest.mark.parametrize("repeatability", [
+    Sht3xRepeatability.HIGH,
+    Sht3xRepeatability.MEDIUM,
+    Sht3xRepeatability.LOW,
+])
+def test_periodic_measurement(sht3x, frequency, repeatability):
+    """
+    Test if the periodic measurement can be started, fetched and stopped.
+    """
+    sht3x.start_periodic_measurement(frequency, repeatability)
+    time.sleep(2.1)  # wait until at least one measurement is available
+    temperature, humidity = sht3x.fetch_data()
+    sht3x.stop_periodic_measurement()
+    assert type(temperature) is Sht3xTemperature
+    assert type(temperature.ticks) is int
+    assert type(humidity) is Sht3xHumidity
+    assert type(humidity.ticks) is int
+
+
+@pytest.mark.needs_device
+@pytest.mark.needs_sht3x
+def test_invalid_config(sht3x):
+    """
+    Test if the start_periodic_measurement() raises an exception for invalid
+    inputs.
+    """
+    with pytest.raises(ValueError):
+        sht3x.start_periodic_measurement(frequency='not_valid')
+    with pytest.raises(ValueError):
+        sht3x.start_periodic_measurement(repeatability='not_valid')
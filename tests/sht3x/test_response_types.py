@@ -126,3 +126,14 @@ def test_status_register(value):
         if k != 'input':
             assert type(eval('result.{}'.format(k))) is bool
             assert eval('result.{}'.format(k)) == value.get(k)
+
+
+def test_temperature_is_compact():
+    """
+    Test if the Temperature() type has no instance dictionary and computes
+    its conversions only once.
+    """
+    result = Sht3xTemperature(1234)
+    assert not hasattr(result, '__dict__')
+    assert result.degrees_celsius is result.degrees_celsius
+    assert result.degrees_fahrenheit is result.degrees_fahrenheit
@@ -14,3 +14,6 @@ def test_invalid_config(sht3x):
     """
     with pytest.raises(ValueError):
         sht3x.single_shot_measurement(repeatability='not_valid')
+    with pytest.raises(ValueError):
+        sht3x.single_shot_measurement(repeatability='not_valid',
+                                      clock_stretching=True)
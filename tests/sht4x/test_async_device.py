@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_sht.sht4x import Sht4xTemperature, Sht4xHumidity
+from sensirion_i2c_sht.sht4x.async_device import AsyncSht4xI2cDevice
+import pytest
+
+
+@pytest.mark.needs_device
+@pytest.mark.needs_sht4x
+@pytest.mark.parametrize("ready_polling", [False, True])
+def test_single_shot_measurement(sht4x, ready_polling, run_coroutine):
+    """
+    Test if the measurement of the asynchronous device returns the proper
+    result.
+    """
+    device = AsyncSht4xI2cDevice(sht4x.connection, sht4x.slave_address)
+    device.device.ready_polling = ready_polling
+    temperature, humidity = run_coroutine(device.single_shot_measurement())
+    assert type(temperature) is Sht4xTemperature
+    assert type(temperature.ticks) is int
+    assert type(humidity) is Sht4xHumidity
+    assert type(humidity.ticks) is int
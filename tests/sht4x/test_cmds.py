@@ -4,6 +4,7 @@
 from __future__ import absolute_import, division, print_function
 from sensirion_i2c_sht.sht4x import Sht4xTemperature, Sht4xHumidity, \
     Sht4xRepeatability, Sht4xHeaterActivationDuration, Sht4xHeaterPower
+from array import array
 import pytest
 
 
@@ -14,11 +15,13 @@ import pytest
     Sht4xRepeatability.MEDIUM,
     Sht4xRepeatability.LOW,
 ])
-def test_single_shot_measurement(sht4x, repeatability):
+@pytest.mark.parametrize("ready_polling", [False, True])
+def test_single_shot_measurement(sht4x, repeatability, ready_polling):
     """
     Test if the command is accepted by the device and returns the proper
     result.
     """
+    sht4x.ready_polling = ready_polling
     temperature, humidity = sht4x.single_shot_measurement(repeatability)
     assert type(temperature) is Sht4xTemperature
     assert type(temperature.ticks) is int
@@ -49,6 +52,41 @@ def test_activate_heater(sht4x, power, duration):
     assert type(humidity.ticks) is int
 
 
+@pytest.mark.needs_device
+@pytest.mark.needs_sht4x
+def test_start_heater(sht4x):
+    """
+    Test if the heater can be activated and its measurement read in separate
+    steps.
+    """
+    handle = sht4x.start_heater(Sht4xHeaterPower.LOW,
+                                Sht4xHeaterActivationDuration.SHORT)
+    assert handle.is_ready() is False
+    temperature, humidity = handle.result()
+    assert type(temperature) is Sht4xTemperature
+    assert type(humidity) is Sht4xHumidity
+    assert handle.done is True
+
+
+@pytest.mark.needs_device
+@pytest.mark.needs_sht4x
+@pytest.mark.parametrize("repeatability", [
+    Sht4xRepeatability.HIGH,
+    Sht4xRepeatability.MEDIUM,
+    Sht4xRepeatability.LOW,
+])
+def test_start_measurement(sht4x, repeatability):
+    """
+    Test if a measurement can be started and read in separate steps.
+    """
+    handle = sht4x.start_measurement(repeatability)
+    assert handle.ready_time > handle.start_time
+    temperature, humidity = sht4x.read_measurement()
+    assert type(temperature) is Sht4xTemperature
+    assert type(humidity) is Sht4xHumidity
+    assert handle.result() == (temperature, humidity)
+
+
 @pytest.mark.needs_device
 @pytest.mark.needs_sht4x
 def test_soft_reset(sht4x):
@@ -69,3 +107,32 @@ def test_read_serial_number(sht4x):
     """
     result = sht4x.read_serial_number()
     assert type(result) is int
+
+
+@pytest.mark.needs_device
+@pytest.mark.needs_sht4x
+def test_single_shot_measurement_raw(sht4x):
+    """
+    Test if the raw ticks are returned or stored into a buffer.
+    """
+    temperature_ticks, humidity_ticks = sht4x.single_shot_measurement_raw()
+    assert type(temperature_ticks) is int
+    assert type(humidity_ticks) is int
+    buffer = array('H', [0, 0, 0])
+    assert sht4x.single_shot_measurement_raw(buffer=buffer, offset=1) == 3
+    assert buffer[0] == 0
+
+
+@pytest.mark.needs_device
+@pytest.mark.needs_sht4x
+def test_single_shot_measurement_multi_channel(sht4x):
+    """
+    Test if the columnar result contains one valid channel on a
+    single-channel connection.
+    """
+    result = sht4x.single_shot_measurement_multi_channel()
+    assert result.channel_count == 1
+    assert result.valid[0]
+    assert result.errors == [None]
+    assert -45. < result.degrees_celsius[0] < 130.
+    assert 0. <= result.percent_rh[0] <= 100.
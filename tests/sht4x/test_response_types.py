@@ -39,3 +39,14 @@ def test_humidity(value):
     assert result.ticks == value.get('ticks')
     assert type(result.percent_rh) is float
     assert result.percent_rh == value.get('percent_rh')
+
+
+def test_temperature_is_compact():
+    """
+    Test if the Temperature() type has no instance dictionary and computes
+    its conversions only once.
+    """
+    result = Sht4xTemperature(1234)
+    assert not hasattr(result, '__dict__')
+    assert result.degrees_celsius is result.degrees_celsius
+    assert result.degrees_fahrenheit is result.degrees_fahrenheit
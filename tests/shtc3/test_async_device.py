@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_sht.shtc3 import Shtc3Temperature, Shtc3Humidity
+from sensirion_i2c_sht.shtc3.async_device import AsyncShtc3I2cDevice
+import pytest
+
+
+@pytest.mark.needs_device
+@pytest.mark.needs_shtc3
+@pytest.mark.parametrize("ready_polling", [False, True])
+def test_single_shot_measurement(shtc3, ready_polling, run_coroutine):
+    """
+    Test if the measurement of the asynchronous device returns the proper
+    result.
+    """
+    device = AsyncShtc3I2cDevice(shtc3.connection, shtc3.slave_address)
+    device.device.ready_polling = ready_polling
+    temperature, humidity = run_coroutine(device.measure())
+    assert type(temperature) is Shtc3Temperature
+    assert type(temperature.ticks) is int
+    assert type(humidity) is Shtc3Humidity
+    assert type(humidity.ticks) is int
@@ -3,6 +3,7 @@
 
 from __future__ import absolute_import, division, print_function
 from sensirion_i2c_sht.shtc3 import Shtc3PowerMode, Shtc3Humidity, Shtc3Temperature
+from array import array
 import pytest
 
 
@@ -12,11 +13,13 @@ import pytest
     Shtc3PowerMode.NORMAL,
     Shtc3PowerMode.LOW,
 ])
-def test_measure(shtc3, power_mode):
+@pytest.mark.parametrize("ready_polling", [False, True])
+def test_measure(shtc3, power_mode, ready_polling):
     """
     Test if the command is accepted by the device and returns the proper
     result.
     """
+    shtc3.ready_polling = ready_polling
     temperature, humidity = shtc3.measure(power_mode)
     assert type(temperature) is Shtc3Temperature
     assert type(temperature.ticks) is int
@@ -24,6 +27,22 @@ def test_measure(shtc3, power_mode):
     assert type(humidity.ticks) is int
 
 
+@pytest.mark.needs_device
+@pytest.mark.needs_shtc3
+@pytest.mark.parametrize("power_mode", [
+    Shtc3PowerMode.NORMAL,
+    Shtc3PowerMode.LOW,
+])
+def test_start_measurement(shtc3, power_mode):
+    """
+    Test if a measurement can be started and read in separate steps.
+    """
+    shtc3.start_measurement(power_mode)
+    temperature, humidity = shtc3.read_measurement()
+    assert type(temperature) is Shtc3Temperature
+    assert type(humidity) is Shtc3Humidity
+
+
 @pytest.mark.needs_device
 @pytest.mark.needs_shtc3
 def test_soft_reset(shtc3):
@@ -48,3 +67,32 @@ def test_read_product_id(shtc3):
     result = shtc3.read_product_id()
     shtc3.enter_sleep()
     assert type(result) is int
+
+
+@pytest.mark.needs_device
+@pytest.mark.needs_shtc3
+def test_measure_raw(shtc3):
+    """
+    Test if the raw ticks are returned or stored into a buffer.
+    """
+    temperature_ticks, humidity_ticks = shtc3.measure_raw()
+    assert type(temperature_ticks) is int
+    assert type(humidity_ticks) is int
+    buffer = array('H', [0, 0, 0])
+    assert shtc3.measure_raw(buffer=buffer, offset=1) == 3
+    assert buffer[0] == 0
+
+
+@pytest.mark.needs_device
+@pytest.mark.needs_shtc3
+def test_measure_multi_channel(shtc3):
+    """
+    Test if the columnar result contains one valid channel on a
+    single-channel connection.
+    """
+    result = shtc3.measure_multi_channel()
+    assert result.channel_count == 1
+    assert result.valid[0]
+    assert result.errors == [None]
+    assert -45. < result.degrees_celsius[0] < 130.
+    assert 0. <= result.percent_rh[0] <= 100.
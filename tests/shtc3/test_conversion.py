@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_sht.shtc3 import Shtc3Temperature, Shtc3Humidity
+from sensirion_i2c_sht.shtc3 import conversion
+from array import array
+
+TICKS = [0, 1, 12345, 32768, 65534, 65535]
+
+
+def test_temperature():
+    """
+    Test if the vectorized temperature conversion returns exactly the same
+    values as the response type.
+    """
+    ticks = array('H', TICKS)
+    assert list(conversion.ticks_to_degrees_celsius(ticks)) == \
+        [Shtc3Temperature(t).degrees_celsius for t in TICKS]
+    assert list(conversion.ticks_to_degrees_fahrenheit(ticks)) == \
+        [Shtc3Temperature(t).degrees_fahrenheit for t in TICKS]
+
+
+def test_humidity():
+    """
+    Test if the vectorized humidity conversion returns exactly the same
+    values as the response type.
+    """
+    ticks = array('H', TICKS)
+    assert list(conversion.ticks_to_percent_rh(ticks)) == \
+        [Shtc3Humidity(t).percent_rh for t in TICKS]
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_sht.sts4x import Sts4xTemperature
+from sensirion_i2c_sht.sts4x.async_device import AsyncSts4xI2cDevice
+import pytest
+
+
+@pytest.mark.needs_device
+@pytest.mark.needs_sts4x
+@pytest.mark.parametrize("ready_polling", [False, True])
+def test_single_shot_measurement(sts4x, ready_polling, run_coroutine):
+    """
+    Test if the measurement of the asynchronous device returns the proper
+    result.
+    """
+    device = AsyncSts4xI2cDevice(sts4x.connection, sts4x.slave_address)
+    device.device.ready_polling = ready_polling
+    temperature = run_coroutine(device.single_shot_measurement())
+    assert type(temperature) is Sts4xTemperature
+    assert type(temperature.ticks) is int
@@ -2,6 +2,7 @@
 # (c) Copyright 2021 Sensirion AG, Switzerland
 
 from __future__ import absolute_import, division, print_function
+from array import array
 import pytest
 
 from sensirion_i2c_sht.sts4x import Sts4xRepeatability, Sts4xTemperature
@@ -14,16 +15,36 @@ from sensirion_i2c_sht.sts4x import Sts4xRepeatability, Sts4xTemperature
     Sts4xRepeatability.MEDIUM,
     Sts4xRepeatability.LOW,
 ])
-def test_single_shot_measurement(sts4x, repeatability):
+@pytest.mark.parametrize("ready_polling", [False, True])
+def test_single_shot_measurement(sts4x, repeatability, ready_polling):
     """
     Test if the command is accepted by the device and returns the proper
     result.
     """
+    sts4x.ready_polling = ready_polling
     temperature = sts4x.single_shot_measurement(repeatability)
     assert type(temperature) is Sts4xTemperature
     assert type(temperature.ticks) is int
 
 
+@pytest.mark.needs_device
+@pytest.mark.needs_sts4x
+@pytest.mark.parametrize("repeatability", [
+    Sts4xRepeatability.HIGH,
+    Sts4xRepeatability.MEDIUM,
+    Sts4xRepeatability.LOW,
+])
+def test_start_measurement(sts4x, repeatability):
+    """
+    Test if a measurement can be started and read in separate steps.
+    """
+    handle = sts4x.start_measurement(repeatability)
+    assert handle.ready_time > handle.start_time
+    temperature = sts4x.read_measurement()
+    assert type(temperature) is Sts4xTemperature
+    assert handle.result() is temperature
+
+
 @pytest.mark.needs_device
 @pytest.mark.needs_sts4x
 def test_soft_reset(sts4x):
@@ -44,3 +65,31 @@ def test_read_serial_number(sts4x):
     """
     result = sts4x.read_serial_number()
     assert type(result) is int
+
+
+@pytest.mark.needs_device
+@pytest.mark.needs_sts4x
+def test_single_shot_measurement_raw(sts4x):
+    """
+    Test if the raw ticks are returned or stored into a buffer.
+    """
+    ticks = sts4x.single_shot_measurement_raw()
+    assert type(ticks) is int
+    buffer = array('H', [0, 0])
+    assert sts4x.single_shot_measurement_raw(buffer=buffer, offset=1) == 2
+    assert buffer[0] == 0
+
+
+@pytest.mark.needs_device
+@pytest.mark.needs_sts4x
+def test_single_shot_measurement_multi_channel(sts4x):
+    """
+    Test if the columnar result contains one valid channel on a
+    single-channel connection.
+    """
+    result = sts4x.single_shot_measurement_multi_channel()
+    assert result.channel_count == 1
+    assert result.valid[0]
+    assert result.errors == [None]
+    assert -45. < result.degrees_celsius[0] < 130.
+    assert result.percent_rh is None
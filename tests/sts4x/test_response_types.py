@@ -23,3 +23,14 @@ def test_temperature(value):
     assert result.degrees_celsius == value.get('degrees_celsius')
     assert type(result.degrees_fahrenheit) is float
     assert result.degrees_fahrenheit == value.get('degrees_fahrenheit')
+
+
+def test_temperature_is_compact():
+    """
+    Test if the Temperature() type has no instance dictionary and computes
+    its conversions only once.
+    """
+    result = Sts4xTemperature(1234)
+    assert not hasattr(result, '__dict__')
+    assert result.degrees_celsius is result.degrees_celsius
+    assert result.degrees_fahrenheit is result.degrees_fahrenheit
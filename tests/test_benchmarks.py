@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver import I2cConnection
+from sensirion_i2c_sht.benchmarks import NullI2cTransceiver, run, main, \
+    FAMILIES, BENCHMARKS
+from sensirion_i2c_sht.sht3x import Sht3xI2cDevice
+import json
+import pytest
+
+
+def test_null_transceiver():
+    """
+    Test if the null transceiver responds with valid data.
+    """
+    sht3x = Sht3xI2cDevice(I2cConnection(NullI2cTransceiver()))
+    assert sht3x.single_shot_measurement_raw() == (0x6666, 0x6666)
+    sht3x = Sht3xI2cDevice(I2cConnection(NullI2cTransceiver(
+        channel_count=3)))
+    assert sht3x.single_shot_measurement_multi_channel().channel_count == 3
+
+
+@pytest.mark.parametrize("family", sorted(FAMILIES))
+def test_run(family):
+    """
+    Test if all benchmarks of a family can be executed.
+    """
+    results = run([family], min_time=0., channels=2, frames=3)
+    assert [r['benchmark'] for r in results['results']] == list(BENCHMARKS)
+    for result in results['results']:
+        assert result['family'] == family
+        assert result['calls'] >= 1
+        assert result['ns_per_sample'] > 0.
+
+
+def test_main(tmpdir):
+    """
+    Test if the results are written to a JSON file and can be compared.
+    """
+    output = str(tmpdir.join('results.json'))
+    main(['--family', 'sht4x', '--benchmark', 'crc', '--min-time', '0',
+          '--output', output])
+    with open(output) as f:
+        results = json.load(f)
+    assert len(results['results']) == 1
+    assert 'version' in results
+    main(['--family', 'sht4x', '--benchmark', 'crc', '--min-time', '0',
+          '--compare', output])
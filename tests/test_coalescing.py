@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver import I2cConnection
+from sensirion_i2c_sht.coalescing import MeasurementCoalescer
+from sensirion_i2c_sht.simulation import SimulatedI2cTransceiver, \
+    SimulatedSht3x
+from sensirion_i2c_sht.sht3x import Sht3xI2cDevice, Sht3xRepeatability
+import pytest
+import threading
+import time
+
+
+class _GatedDevice(object):
+    """
+    Fake device whose measurement blocks until the gate is opened.
+    """
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.calls = 0
+        self.error = None
+
+    def single_shot_measurement(self, repeatability=None):
+        self.calls += 1
+        self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return object()
+
+
+def _run_concurrently(coalescer, count):
+    results = [None] * count
+
+    def call(index):
+        try:
+            results[index] = coalescer.single_shot_measurement()
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=call, args=(i,))
+               for i in range(count)]
+    for thread in threads:
+        thread.start()
+    deadline = time.time() + 2.
+    while coalescer.coalesced < count - 1:
+        assert time.time() < deadline
+        time.sleep(0.001)
+    coalescer.device.gate.set()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_single_flight():
+    """
+    Test if concurrent callers share one measurement.
+    """
+    device = _GatedDevice()
+    coalescer = MeasurementCoalescer(device)
+    results = _run_concurrently(coalescer, 8)
+    assert device.calls == 1
+    assert coalescer.measurements == 1
+    assert all(result is results[0] for result in results)
+    # without TTL, the next call measures again
+    assert coalescer.single_shot_measurement() is not results[0]
+    assert device.calls == 2
+
+
+def test_errors_not_cached():
+    """
+    Test if an error is raised to all waiting callers but not cached.
+    """
+    device = _GatedDevice()
+    device.error = IOError('bus error')
+    coalescer = MeasurementCoalescer(device, ttl=10.)
+    results = _run_concurrently(coalescer, 4)
+    assert all(result is device.error for result in results)
+    device.error = None
+    coalescer.single_shot_measurement()
+    assert device.calls == 2
+
+
+def test_ttl():
+    """
+    Test if results are served from the cache within the TTL, separately for
+    every measurement setting.
+    """
+    sht3x = Sht3xI2cDevice(I2cConnection(SimulatedI2cTransceiver(
+        [SimulatedSht3x()])))
+    coalescer = MeasurementCoalescer(sht3x, ttl=0.05)
+    first = coalescer.single_shot_measurement()
+    assert coalescer.single_shot_measurement() is first
+    low = coalescer.single_shot_measurement(
+        repeatability=Sht3xRepeatability.LOW)
+    assert low is not first
+    assert coalescer.hits == 1
+    assert coalescer.measurements == 2
+    time.sleep(0.06)
+    assert coalescer.single_shot_measurement() is not first
+    coalescer.invalidate()
+    coalescer.single_shot_measurement()
+    assert coalescer.measurements == 4
+
+
+@pytest.mark.parametrize('count', [2, 16])
+def test_concurrent_device_access(count):
+    """
+    Test if concurrent callers with different settings do not access the
+    device at the same time.
+    """
+    sht3x = Sht3xI2cDevice(I2cConnection(SimulatedI2cTransceiver(
+        [SimulatedSht3x()])))
+    coalescer = MeasurementCoalescer(sht3x)
+    errors = []
+
+    def call(repeatability):
+        try:
+            coalescer.single_shot_measurement(repeatability=repeatability)
+        except Exception as e:
+            errors.append(e)
+
+    repeatabilities = [Sht3xRepeatability.HIGH, Sht3xRepeatability.LOW]
+    threads = [threading.Thread(target=call, args=(repeatabilities[i % 2],))
+               for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
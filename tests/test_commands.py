@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_sht.commands import shared_command, get_write_phase, \
+    get_read_phase, get_raw_command, ShtI2cCmdWritePhase, \
+    ShtI2cCmdReadPhase, ShtI2cCmdRaw
+from sensirion_i2c_sht.sht3x.commands import Sht3xI2cCmdMeasHighRes, \
+    Sht3xI2cCmdMeasLowRes
+
+
+def test_shared_command():
+    """
+    Test if the same command instance is returned for the same class.
+    """
+    command = shared_command(Sht3xI2cCmdMeasHighRes)
+    assert type(command) is Sht3xI2cCmdMeasHighRes
+    assert shared_command(Sht3xI2cCmdMeasHighRes) is command
+    assert shared_command(Sht3xI2cCmdMeasLowRes) is not command
+
+
+def test_phases():
+    """
+    Test if the write and read phases of a command are created only once and
+    contain the data of the command.
+    """
+    command = Sht3xI2cCmdMeasHighRes()
+    write_phase = get_write_phase(command)
+    read_phase = get_read_phase(command)
+    assert type(write_phase) is ShtI2cCmdWritePhase
+    assert type(read_phase) is ShtI2cCmdReadPhase
+    assert get_write_phase(command) is write_phase
+    assert get_read_phase(command) is read_phase
+    assert write_phase.tx_data == command.tx_data
+    assert write_phase.rx_length is None
+    assert read_phase.tx_data is None
+    assert read_phase.rx_length == command.rx_length
+
+
+def test_raw_command():
+    """
+    Test if the raw command returns the ticks of the wrapped command.
+    """
+    command = Sht3xI2cCmdMeasHighRes()
+    raw = get_raw_command(command)
+    assert type(raw) is ShtI2cCmdRaw
+    assert get_raw_command(command) is raw
+    assert raw.tx_data == command.tx_data
+    assert raw.read_delay == command.read_delay
+    assert raw.typical_read_delay == command.typical_read_delay
+    assert raw.interpret_response(b"\xBE\xEF\x92\x00\x00\x81") == \
+        (0xBEEF, 0x0000)
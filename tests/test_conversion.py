@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_sht import conversion
+from sensirion_i2c_sht.sht2x import conversion as sht2x_conversion
+from sensirion_i2c_sht.sht3x import conversion as sht3x_conversion
+from sensirion_i2c_sht.sht4x import conversion as sht4x_conversion
+from sensirion_i2c_sht.shtc3 import conversion as shtc3_conversion
+from sensirion_i2c_sht.sts4x import conversion as sts4x_conversion
+from array import array
+import pytest
+
+TICKS = [0, 1, 0x1234, 0x6666, 0x8000, 0xFFFE, 0xFFFF]
+
+FUNCTIONS = [
+    (module, name)
+    for module in (sht2x_conversion, sht3x_conversion, sht4x_conversion,
+                   shtc3_conversion, sts4x_conversion)
+    for name in ('ticks_to_degrees_celsius', 'ticks_to_degrees_fahrenheit',
+                 'ticks_to_percent_rh')
+    if hasattr(module, name)
+]
+
+
+@pytest.mark.parametrize("module,name", FUNCTIONS)
+def test_without_numpy(monkeypatch, module, name):
+    """
+    Test if the conversion without NumPy returns an array of doubles with
+    the same values as the conversion with NumPy.
+    """
+    numpy = pytest.importorskip("numpy")
+    function = getattr(module, name)
+    expected = function(numpy.array(TICKS, dtype=numpy.uint16))
+    monkeypatch.setattr(conversion, 'numpy', None)
+    result = function(array('H', TICKS))
+    assert type(result) is array
+    assert result.typecode == 'd'
+    assert list(result) == list(expected)
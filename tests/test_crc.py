@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver import CrcCalculator
+from sensirion_i2c_driver.errors import I2cChecksumError
+from sensirion_i2c_sht.crc import CRC8_INIT_FF, CRC8_INIT_00
+import pytest
+
+
+@pytest.mark.parametrize("crc,init_value", [
+    (CRC8_INIT_FF, 0xFF),
+    (CRC8_INIT_00, 0x00),
+])
+def test_crc(crc, init_value):
+    """
+    Test if the CRC matches the generic CRC calculator of the driver.
+    """
+    reference = CrcCalculator(8, 0x31, init_value)
+    for data in [b"", b"\x00", b"\xBE\xEF", b"\x12\x34\x56\x78\x9A"]:
+        assert crc(data) == reference(bytearray(data))
+
+
+def test_crc_datasheet_example():
+    """
+    Test the CRC example from the SHT3x datasheet: CRC(0xBEEF) = 0x92.
+    """
+    assert CRC8_INIT_FF(b"\xBE\xEF") == 0x92
+
+
+@pytest.mark.parametrize("data,expected", [
+    (b"", None),
+    (b"\xBE\xEF\x92", b"\xBE\xEF"),
+    (b"\xBE\xEF\x92\x00\x00\x81", b"\xBE\xEF\x00\x00"),
+    (b"\xBE\xEF\x92\x12", b"\xBE\xEF\x12"),
+])
+def test_verify_words(data, expected):
+    """
+    Test if the CRCs are removed from valid data.
+    """
+    assert CRC8_INIT_FF.verify_words(data) == expected
+
+
+def test_verify_words_wrong_crc():
+    """
+    Test if a wrong CRC in any word raises an exception.
+    """
+    with pytest.raises(I2cChecksumError):
+        CRC8_INIT_FF.verify_words(b"\xBE\xEF\x92\x00\x00\x80")
+
+
+def test_verify_bytes():
+    """
+    Test if the CRCs are removed from valid data consisting of single bytes,
+    and a wrong CRC raises an exception.
+    """
+    data = bytearray()
+    for value in [0x12, 0x34, 0x56]:
+        data += bytearray([value, CRC8_INIT_00([value])])
+    assert CRC8_INIT_00.verify_bytes(data) == [0x12, 0x34, 0x56]
+    data[-1] ^= 0x01
+    with pytest.raises(I2cChecksumError):
+        CRC8_INIT_00.verify_bytes(data)
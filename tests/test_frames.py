@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver.errors import I2cChecksumError
+from sensirion_i2c_sht import frames
+from sensirion_i2c_sht.crc import CRC8_INIT_FF, CRC8_INIT_00
+from sensirion_i2c_sht.frames import decode_frames, decode_frames_masked
+from array import array
+import pytest
+
+WORDS = [0x0000, 0xFFFF, 0xBEEF, 0x1234, 0x6666, 0x8000]
+
+
+def _encode(words, crc=CRC8_INIT_FF):
+    data = bytearray()
+    for word in words:
+        data += bytearray([word >> 8, word & 0xFF])
+        data.append(crc(data[-2:]))
+    return bytes(data)
+
+
+def test_decode_frames():
+    """
+    Test if concatenated frames are split into tick columns.
+    """
+    temperature_ticks, humidity_ticks = decode_frames(
+        memoryview(_encode(WORDS)))
+    assert list(temperature_ticks) == WORDS[0::2]
+    assert list(humidity_ticks) == WORDS[1::2]
+
+
+def test_decode_frames_single_word():
+    """
+    Test if frames with a single word and another CRC are decoded.
+    """
+    ticks, = decode_frames(_encode(WORDS, CRC8_INIT_00), 1, CRC8_INIT_00)
+    assert list(ticks) == WORDS
+
+
+def test_decode_frames_empty():
+    """
+    Test if empty data results in empty columns.
+    """
+    temperature_ticks, humidity_ticks = decode_frames(b"")
+    assert len(temperature_ticks) == 0
+    assert len(humidity_ticks) == 0
+
+
+def test_decode_frames_invalid_length():
+    """
+    Test if data with an incomplete frame is rejected.
+    """
+    with pytest.raises(ValueError):
+        decode_frames(_encode(WORDS)[:-3])
+
+
+def test_decode_frames_wrong_crc():
+    """
+    Test if a wrong CRC raises an exception, or marks only the affected frame
+    as invalid in masked mode.
+    """
+    data = bytearray(_encode(WORDS))
+    data[8] ^= 0x01  # CRC of the 2nd word of the 2nd frame
+    with pytest.raises(I2cChecksumError):
+        decode_frames(bytes(data))
+    (temperature_ticks, humidity_ticks), valid = \
+        decode_frames_masked(bytes(data))
+    assert list(temperature_ticks) == WORDS[0::2]
+    assert [bool(v) for v in valid] == [True, False, True]
+
+
+@pytest.mark.parametrize("words,words_per_frame,crc", [
+    (WORDS, 2, CRC8_INIT_FF),
+    (WORDS, 1, CRC8_INIT_00),
+    ([], 2, CRC8_INIT_FF),
+])
+def test_decode_frames_without_numpy(monkeypatch, words, words_per_frame,
+                                     crc):
+    """
+    Test if decoding without NumPy returns arrays with the same ticks as
+    decoding with NumPy.
+    """
+    numpy = pytest.importorskip("numpy")
+    data = _encode(words, crc)
+    expected = decode_frames(data, words_per_frame, crc)
+    assert type(expected[0]) is numpy.ndarray
+    monkeypatch.setattr(frames, 'numpy', None)
+    columns = decode_frames(data, words_per_frame, crc)
+    assert len(columns) == words_per_frame
+    for column, expected_column in zip(columns, expected):
+        assert type(column) is array
+        assert column.typecode == 'H'
+        assert list(column) == list(expected_column)
+
+
+def test_decode_frames_masked_without_numpy(monkeypatch):
+    """
+    Test if the frame validity without NumPy is the same as with NumPy.
+    """
+    pytest.importorskip("numpy")
+    data = bytearray(_encode(WORDS))
+    data[8] ^= 0x01  # CRC of the 2nd word of the 2nd frame
+    columns, valid = decode_frames_masked(bytes(data))
+    monkeypatch.setattr(frames, 'numpy', None)
+    with pytest.raises(I2cChecksumError):
+        decode_frames(bytes(data))
+    fallback_columns, fallback_valid = decode_frames_masked(bytes(data))
+    assert [list(c) for c in fallback_columns] == [list(c) for c in columns]
+    assert fallback_valid == [bool(v) for v in valid]
+    _, all_valid = decode_frames_masked(_encode(WORDS))
+    assert all_valid == [True, True, True]
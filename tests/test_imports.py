@@ -6,10 +6,13 @@ from setuptools import find_packages
 import importlib
 import pkgutil
 import re
+import sys
 from os import path
 from pytest import mark
 
 EXCLUDES = []  # Regex: remember to use \. !
+if sys.version_info < (3, 5):
+    EXCLUDES.append(r'\.async_device$')  # requires async/await syntax
 
 
 root_path = path.join(path.dirname(__file__), "..")
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver import I2cConnection
+from sensirion_i2c_driver.errors import I2cChecksumError
+from sensirion_i2c_sht.instrumentation import TimingCollector, Transaction
+from sensirion_i2c_sht.simulation import SimulatedI2cTransceiver, \
+    FaultInjectingI2cTransceiver, SimulatedSht2x, SimulatedSht3x, \
+    SimulatedSht4x
+from sensirion_i2c_sht.sht2x import Sht2xI2cDevice
+from sensirion_i2c_sht.sht2x.commands import Sht2xI2cMeasureTemperature
+from sensirion_i2c_sht.sht3x import Sht3xI2cDevice
+from sensirion_i2c_sht.sht3x.commands import Sht3xI2cCmdReadSerial, \
+    Sht3xI2cCmdSoftReset
+from sensirion_i2c_sht.sht4x import Sht4xI2cDevice
+from sensirion_i2c_sht.sht4x.commands import Sht4xI2cCmdMeasHighRes
+import pytest
+
+
+def _phases(transaction):
+    return [phase for phase, _, _ in transaction.phases]
+
+
+def test_disabled_by_default():
+    """
+    Test if the instrumentation is disabled by default.
+    """
+    sht4x = Sht4xI2cDevice(I2cConnection(SimulatedI2cTransceiver(
+        [SimulatedSht4x()])))
+    assert sht4x.instrumentation is None
+
+
+def test_measurement():
+    """
+    Test if all phases of a measurement are recorded, tagged with the command
+    class and the slave address.
+    """
+    sht4x = Sht4xI2cDevice(I2cConnection(SimulatedI2cTransceiver(
+        [SimulatedSht4x(temperature=30.)])))
+    collector = TimingCollector()
+    with collector.attach(sht4x):
+        temperature, _ = sht4x.single_shot_measurement()
+    assert sht4x.instrumentation is None
+    assert temperature.degrees_celsius == pytest.approx(30., abs=0.05)
+    transaction, = collector.transactions
+    assert transaction.command_class is Sht4xI2cCmdMeasHighRes
+    assert transaction.slave_address == 0x44
+    assert transaction.error is None
+    assert _phases(transaction) == ['write', 'read_delay', 'read',
+                                    'interpret']
+    times = [t for _, start, end in transaction.phases for t in (start, end)]
+    assert times == sorted(times)
+    assert transaction.durations()['read_delay'] >= 0.008
+
+
+def test_raw_measurement():
+    """
+    Test if raw measurements are tagged with the measurement command class.
+    """
+    sht4x = Sht4xI2cDevice(I2cConnection(SimulatedI2cTransceiver(
+        [SimulatedSht4x()])))
+    collector = TimingCollector()
+    with collector.attach(sht4x):
+        sht4x.single_shot_measurement_raw()
+    assert collector.transactions[0].command_class is Sht4xI2cCmdMeasHighRes
+
+
+def test_transfer_and_post_processing():
+    """
+    Test if commands without read delay are recorded as single transfer, and
+    the post processing time is recorded.
+    """
+    sht3x = Sht3xI2cDevice(I2cConnection(SimulatedI2cTransceiver(
+        [SimulatedSht3x()])))
+    collector = TimingCollector()
+    with collector.attach(sht3x):
+        sht3x.read_serial_number()
+        sht3x.soft_reset()
+    serial, reset = collector.transactions
+    assert serial.command_class is Sht3xI2cCmdReadSerial
+    assert _phases(serial) == ['transfer', 'interpret']
+    assert reset.command_class is Sht3xI2cCmdSoftReset
+    assert _phases(reset) == ['write', 'post_processing']
+
+
+def test_ready_polling():
+    """
+    Test if every read attempt of ready polling is recorded.
+    """
+    sht4x = Sht4xI2cDevice(I2cConnection(SimulatedI2cTransceiver(
+        [SimulatedSht4x()])))
+    sht4x.ready_polling = True
+    collector = TimingCollector()
+    with collector.attach(sht4x):
+        sht4x.single_shot_measurement()
+    phases = _phases(collector.transactions[0])
+    assert phases[:2] == ['write', 'read_delay']
+    assert phases[-2:] == ['read', 'interpret']
+    assert phases.count('read') >= 1
+
+
+def test_multiple_stages():
+    """
+    Test if a measurement with multiple stages is a single transaction.
+    """
+    sht2x = Sht2xI2cDevice(I2cConnection(SimulatedI2cTransceiver(
+        [SimulatedSht2x()])))
+    collector = TimingCollector()
+    with collector.attach(sht2x):
+        sht2x.start_measurement().result()
+    transaction, = collector.transactions
+    assert transaction.command_class is Sht2xI2cMeasureTemperature
+    assert _phases(transaction).count('write') == 2
+    assert _phases(transaction).count('interpret') == 2
+
+
+def test_error():
+    """
+    Test if failed commands are recorded with their error.
+    """
+    transceiver = FaultInjectingI2cTransceiver(
+        SimulatedI2cTransceiver([SimulatedSht4x()]), crc_error_rate=1.)
+    sht4x = Sht4xI2cDevice(I2cConnection(transceiver))
+    collector = TimingCollector()
+    sht4x.instrumentation = collector
+    with pytest.raises(I2cChecksumError):
+        sht4x.single_shot_measurement()
+    transaction, = collector.transactions
+    assert isinstance(transaction.error, I2cChecksumError)
+    assert _phases(transaction)[-1] == 'interpret'
+
+
+def test_multi_channel():
+    """
+    Test if multi-channel responses are interpreted per channel.
+    """
+    transceiver = FaultInjectingI2cTransceiver(SimulatedI2cTransceiver(
+        channels=[[SimulatedSht4x()], [SimulatedSht4x()]]))
+    sht4x = Sht4xI2cDevice(I2cConnection(transceiver))
+    sht4x.instrumentation = TimingCollector()
+    result = sht4x.single_shot_measurement_multi_channel()
+    assert list(result.valid) == [True, True]
+    transceiver.crc_error_rate = 1.
+    serials = sht4x.read_serial_number()
+    assert [type(s) for s in serials] == [I2cChecksumError] * 2
+
+
+def test_collector():
+    """
+    Test the durations and the maximum size of the collector.
+    """
+    collector = TimingCollector(max_transactions=2)
+    for i in range(3):
+        transaction = Transaction(Sht4xI2cCmdMeasHighRes(), 0x44)
+        transaction.add('write', float(i), i + 1.)
+        transaction.add('read', i + 1., i + 3.)
+        collector(transaction)
+    assert len(collector.transactions) == 2
+    assert collector.transactions[0].start == 1.
+    assert collector.transactions[0].duration == 3.
+    assert collector.durations() == {'write': 2., 'read': 4.}
+    collector.clear()
+    assert len(collector.transactions) == 0
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver import I2cConnection
+from sensirion_i2c_driver.errors import I2cChecksumError, I2cNackError
+from sensirion_i2c_sht.instrumentation import Transaction
+from sensirion_i2c_sht.metrics import LatencyHistogram, MetricsRegistry
+from sensirion_i2c_sht.simulation import SimulatedI2cTransceiver, \
+    FaultInjectingI2cTransceiver, SimulatedSht3x, SimulatedSht4x
+from sensirion_i2c_sht.sht3x import Sht3xI2cDevice
+from sensirion_i2c_sht.sht4x import Sht4xI2cDevice, Sht4xHeaterPower, \
+    Sht4xHeaterActivationDuration
+from sensirion_i2c_sht.sht4x.commands import Sht4xI2cCmdMeasHighRes
+import json
+import pytest
+
+
+def test_histogram_buckets():
+    """
+    Test if values are counted in logarithmic buckets.
+    """
+    histogram = LatencyHistogram()
+    histogram.observe(2. ** -10)  # upper bound is inclusive
+    histogram.observe(0.0015)
+    histogram.observe(1000.)
+    index = LatencyHistogram.BOUNDS.index(2. ** -10)
+    assert histogram.counts[index] == 1
+    assert histogram.counts[index + 1] == 1
+    assert histogram.counts[-1] == 1
+    assert histogram.count == 3
+    assert histogram.max == 1000.
+    assert histogram.sum == pytest.approx(1000.0025, abs=1e-4)
+
+
+def test_histogram_percentile():
+    """
+    Test if percentiles are estimated by the bucket bounds.
+    """
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) is None
+    assert histogram.mean is None
+    for _ in range(99):
+        histogram.observe(0.003)
+    histogram.observe(0.1)
+    assert histogram.percentile(50) == 2. ** -8  # bucket of 3 ms
+    assert histogram.percentile(100) == 0.1
+    assert histogram.mean == pytest.approx(0.00397)
+
+
+def test_record():
+    """
+    Test if transactions are aggregated per device and command.
+    """
+    registry = MetricsRegistry()
+    transaction = Transaction(Sht4xI2cCmdMeasHighRes(), 0x44)
+    transaction.add('write', 0., 0.001)
+    transaction.add('read_delay', 0.001, 0.003)
+    transaction.add('read', 0.003, 0.004)
+    transaction.add('read_delay', 0.004, 0.005)
+    transaction.add('read', 0.005, 0.006)
+    transaction.error = I2cNackError(None, b'')
+    registry.record(transaction)
+    registry.record(transaction, device='outdoor')
+    snapshot = registry.snapshot()
+    assert sorted(snapshot) == ['0x44', 'outdoor']
+    metrics = snapshot['0x44']['Sht4xI2cCmdMeasHighRes']
+    assert metrics.count == 1
+    assert metrics.errors == dict(checksum=0, nack=1, timeout=0, other=0)
+    assert metrics.retries == 1
+    assert metrics.latency.sum == pytest.approx(0.006)
+    assert metrics.phases['read_delay'].sum == pytest.approx(0.003)
+    assert metrics.phases['read_delay'].count == 1
+    registry.reset()
+    assert registry.snapshot() == {}
+
+
+def test_device_metrics():
+    """
+    Test if the metrics of a device are recorded, including errors and heater
+    activations.
+    """
+    transceiver = FaultInjectingI2cTransceiver(
+        SimulatedI2cTransceiver([SimulatedSht4x()]))
+    sht4x = Sht4xI2cDevice(I2cConnection(transceiver))
+    registry = MetricsRegistry()
+    registry.attach(sht4x, name='sht4x')
+    sht4x.single_shot_measurement()
+    snapshot = registry.snapshot()
+    transceiver.crc_error_rate = 1.
+    with pytest.raises(I2cChecksumError):
+        sht4x.single_shot_measurement()
+    transceiver.crc_error_rate = 0.
+    sht4x.activate_heater(Sht4xHeaterPower.LOW,
+                          Sht4xHeaterActivationDuration.SHORT)
+    metrics = registry.snapshot()['sht4x']
+    assert snapshot['sht4x']['Sht4xI2cCmdMeasHighRes'].count == 1
+    assert metrics['Sht4xI2cCmdMeasHighRes'].count == 2
+    assert metrics['Sht4xI2cCmdMeasHighRes'].errors['checksum'] == 1
+    heater = metrics['Sht4xI2cCmdHeaterLowPowerShort']
+    assert heater.heater_activations == 1
+    assert heater.heater_time == pytest.approx(0.1)
+    assert heater.latency.max >= 0.1
+    json.dumps(registry.as_dict())
+
+
+def test_sht3x_heater():
+    """
+    Test if SHT3x heater activations are counted.
+    """
+    sht3x = Sht3xI2cDevice(I2cConnection(SimulatedI2cTransceiver(
+        [SimulatedSht3x()])))
+    registry = MetricsRegistry()
+    registry.attach(sht3x)
+    sht3x.heater_on()
+    sht3x.heater_off()
+    metrics = registry.snapshot()['0x44']
+    assert metrics['Sht3xI2cCmdHeaterOn'].heater_activations == 1
+    assert metrics['Sht3xI2cCmdHeaterOff'].heater_activations == 0
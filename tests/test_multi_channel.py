@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver.errors import I2cNackError
+from sensirion_i2c_sht.multi_channel import MultiChannelResult
+from sensirion_i2c_sht.sht3x import conversion as sht3x_conversion
+from sensirion_i2c_sht.sts4x import conversion as sts4x_conversion
+import math
+import struct
+
+
+def test_columns():
+    """
+    Test if per-channel results are converted into columns, with failed
+    channels being masked.
+    """
+    error = I2cNackError(None, b"")
+    result = MultiChannelResult([(0x6666, 0x8000), error, (0, 0xFFFF)],
+                                sht3x_conversion)
+    assert result.channel_count == 3
+    assert list(result.valid) == [True, False, True]
+    assert result.errors == [None, error, None]
+    assert list(result.temperature_ticks) == [0x6666, 0, 0]
+    assert list(result.humidity_ticks) == [0x8000, 0, 0xFFFF]
+    celsius = result.degrees_celsius
+    assert celsius[0] == sht3x_conversion.ticks_to_degrees_celsius([0x6666])[0]
+    assert math.isnan(celsius[1])
+    assert celsius[2] == -45.
+    assert math.isnan(result.degrees_fahrenheit[1])
+    assert math.isnan(result.percent_rh[1])
+    assert result.percent_rh[2] == 100.
+    assert result.degrees_celsius is celsius  # converted only once
+
+
+def test_temperature_only():
+    """
+    Test if results of temperature-only sensors have no humidity columns.
+    """
+    result = MultiChannelResult([0x6666, 0x8000], sts4x_conversion)
+    assert list(result.temperature_ticks) == [0x6666, 0x8000]
+    assert result.humidity_ticks is None
+    assert result.percent_rh is None
+    assert list(result.valid) == [True, True]
+
+
+def test_empty():
+    """
+    Test if a result without channels can be created.
+    """
+    result = MultiChannelResult([], sht3x_conversion)
+    assert result.channel_count == 0
+    assert len(result.degrees_celsius) == 0
+
+
+def test_other_exception():
+    """
+    Test if channels holding an exception other than an I2cError (e.g. a
+    garbled response) are masked as invalid as well.
+    """
+    error = struct.error("unpack requires a buffer of 2 bytes")
+    result = MultiChannelResult([(0x6666, 0x8000), error], sht3x_conversion)
+    assert list(result.valid) == [True, False]
+    assert result.errors == [None, error]
+    assert list(result.temperature_ticks) == [0x6666, 0]
+    assert math.isnan(result.degrees_celsius[1])
+    assert math.isnan(result.percent_rh[1])
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver import I2cConnection
+from sensirion_i2c_sht.simulation import SimulatedI2cTransceiver, \
+    SimulatedSht2x, SimulatedSht3x
+from sensirion_i2c_sht.sht2x import Sht2xI2cDevice
+from sensirion_i2c_sht.sht3x import Sht3xI2cDevice, Sht3xRepeatability
+import pytest
+import time
+
+try:
+    from time import monotonic
+except ImportError:  # Python 2
+    from time import time as monotonic
+
+
+def test_pre_triggered_result(simulated_sht4x):
+    """
+    Test if the second measurement returns the result which was triggered by
+    the first one, without waiting for the measurement duration.
+    """
+    simulated, _, sht4x = simulated_sht4x
+    sht4x.pre_trigger = True
+    simulated.temperature = 10.
+    temperature, _ = sht4x.single_shot_measurement()
+    assert temperature.degrees_celsius == pytest.approx(10., abs=0.1)
+    trigger_time = monotonic()
+    simulated.temperature = 20.
+    time.sleep(0.02)  # let the pre-triggered measurement finish
+    temperature, _ = sht4x.single_shot_measurement()
+    # measured right after the first call returned, not by the second call
+    assert temperature.degrees_celsius == pytest.approx(10., abs=0.1)
+    assert sht4x.last_trigger_time <= trigger_time
+    temperature, _ = sht4x.single_shot_measurement()
+    assert temperature.degrees_celsius == pytest.approx(20., abs=0.1)
+
+
+def test_raw_measurement(simulated_sht4x):
+    """
+    Test if raw measurements use the pre-triggered result as well.
+    """
+    simulated, _, sht4x = simulated_sht4x
+    sht4x.pre_trigger = True
+    first = sht4x.single_shot_measurement_raw()
+    before = monotonic()
+    assert sht4x.single_shot_measurement_raw() == first
+    # triggered by the first call, not by the second one
+    assert sht4x.last_trigger_time < before
+
+
+def test_max_age(simulated_sht4x):
+    """
+    Test if a too old result is discarded and a new measurement is performed.
+    """
+    simulated, _, sht4x = simulated_sht4x
+    sht4x.pre_trigger = True
+    sht4x.max_age = 0.02
+    simulated.temperature = 10.
+    sht4x.single_shot_measurement()
+    simulated.temperature = 20.
+    time.sleep(0.03)
+    before = monotonic()
+    temperature, _ = sht4x.single_shot_measurement()
+    assert temperature.degrees_celsius == pytest.approx(20., abs=0.1)
+    assert sht4x.last_trigger_time >= before
+
+
+def test_other_command(simulated_sht4x):
+    """
+    Test if other commands wait until the pre-triggered measurement is
+    finished, and are not affected by it.
+    """
+    simulated, _, sht4x = simulated_sht4x
+    sht4x.pre_trigger = True
+    sht4x.single_shot_measurement()
+    assert sht4x.read_serial_number() == simulated.serial_number
+    before = monotonic()
+    sht4x.single_shot_measurement()
+    assert sht4x.last_trigger_time >= before
+
+
+def test_changed_settings():
+    """
+    Test if a different repeatability triggers a new measurement.
+    """
+    sht3x = Sht3xI2cDevice(I2cConnection(SimulatedI2cTransceiver(
+        [SimulatedSht3x()])))
+    sht3x.pre_trigger = True
+    sht3x.single_shot_measurement(repeatability=Sht3xRepeatability.HIGH)
+    before = monotonic()
+    sht3x.single_shot_measurement(repeatability=Sht3xRepeatability.LOW)
+    assert sht3x.last_trigger_time >= before
+    before = monotonic()
+    sht3x.single_shot_measurement(repeatability=Sht3xRepeatability.LOW)
+    assert sht3x.last_trigger_time < before
+
+
+def test_disabled(simulated_sht4x):
+    """
+    Test if every measurement is triggered by its call by default.
+    """
+    _, _, sht4x = simulated_sht4x
+    sht4x.single_shot_measurement()
+    assert sht4x.last_trigger_time is None
+    assert sht4x._pending_measurement is None
+
+
+def test_unsupported():
+    """
+    Test if enabling pre-triggering raises for unsupported devices.
+    """
+    sht2x = Sht2xI2cDevice(I2cConnection(SimulatedI2cTransceiver(
+        [SimulatedSht2x()])))
+    with pytest.raises(ValueError):
+        sht2x.pre_trigger = True
+    sht2x.pre_trigger = False
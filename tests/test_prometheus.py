@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver.errors import I2cChecksumError
+from sensirion_i2c_sht.instrumentation import Transaction
+from sensirion_i2c_sht.metrics import MetricsRegistry
+from sensirion_i2c_sht.prometheus import PrometheusExporter, render
+from sensirion_i2c_sht.sht4x.commands import Sht4xI2cCmdMeasHighRes, \
+    Sht4xI2cCmdHeaterHighPowerShort
+import os
+import socket
+import pytest
+
+try:
+    from urllib.request import urlopen
+except ImportError:  # Python 2
+    from urllib2 import urlopen
+
+
+@pytest.fixture
+def registry():
+    registry = MetricsRegistry()
+    for command, error in [(Sht4xI2cCmdMeasHighRes(), None),
+                           (Sht4xI2cCmdMeasHighRes(), I2cChecksumError(
+                               0, 1, b'')),
+                           (Sht4xI2cCmdHeaterHighPowerShort(), None)]:
+        transaction = Transaction(command, 0x44)
+        transaction.add('write', 0., 0.001)
+        transaction.add('read_delay', 0.001, 0.009)
+        transaction.add('read', 0.009, 0.010)
+        transaction.error = error
+        registry.record(transaction, device='out"door')
+    return registry
+
+
+def test_render(registry):
+    """
+    Test if the metrics are rendered in the Prometheus text format.
+    """
+    lines = render(registry).splitlines()
+    labels = 'command="Sht4xI2cCmdMeasHighRes",device="out\\"door"'
+    assert 'sht_commands_total{' + labels + '} 2' in lines
+    assert 'sht_errors_total{' + labels + ',type="checksum"} 1' in lines
+    assert 'sht_latency_seconds_bucket{' + labels + ',le="+Inf"} 2' in lines
+    assert 'sht_latency_seconds_count{' + labels + '} 2' in lines
+    assert 'sht_heater_seconds_total{command="Sht4xI2cCmdHeaterHighPower' \
+           'Short",device="out\\"door"} 0.1' in lines
+    bus = [line for line in lines
+           if line.startswith('sht_bus_seconds_total{' + labels)]
+    assert float(bus[0].split()[-1]) == pytest.approx(0.004)
+    assert '# TYPE sht_phase_seconds histogram' in lines
+
+
+def test_render_empty():
+    """
+    Test if an empty registry is rendered.
+    """
+    assert '# TYPE sht_commands_total counter' in render(MetricsRegistry())
+
+
+def test_http(registry):
+    """
+    Test if the metrics are served over HTTP.
+    """
+    with PrometheusExporter(registry, port=0) as exporter:
+        host, port = exporter.address
+        response = urlopen('http://{}:{}/metrics'.format(host, port))
+        assert response.headers['Content-Type'].startswith('text/plain')
+        assert b'sht_commands_total' in response.read()
+        response.close()
+    assert exporter.address is None
+
+
+@pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'),
+                    reason="Unix sockets not supported")
+def test_unix_socket(registry, tmpdir):
+    """
+    Test if the metrics are served over a Unix socket.
+    """
+    path = str(tmpdir.join('metrics.sock'))
+    with PrometheusExporter(registry, unix_socket=path):
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect(path)
+        client.sendall(b'GET /metrics HTTP/1.0\r\n\r\n')
+        response = b''
+        while True:
+            data = client.recv(65536)
+            if not data:
+                break
+            response += data
+        client.close()
+    assert response.startswith(b'HTTP/1.0 200')
+    assert b'sht_errors_total' in response
+    assert not os.path.exists(path)
+
+
+@pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'),
+                    reason="Unix sockets not supported")
+def test_unix_socket_regular_file(registry, tmpdir):
+    """
+    Test if an existing file which is not a socket is not removed.
+    """
+    path = tmpdir.join('metrics.txt')
+    path.write('data')
+    exporter = PrometheusExporter(registry, unix_socket=str(path))
+    with pytest.raises(RuntimeError):
+        exporter.start()
+    assert path.read() == 'data'
+    assert exporter.address is None
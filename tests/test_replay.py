@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver import I2cConnection
+from sensirion_i2c_driver.errors import I2cChecksumError, I2cNackError
+from sensirion_i2c_sht.simulation import SimulatedI2cTransceiver, \
+    FaultInjectingI2cTransceiver, RecordingI2cTransceiver, \
+    ReplayI2cTransceiver, SimulatedSht3x, SimulatedSht4x
+from sensirion_i2c_sht.simulation.replay import read_transfers
+from sensirion_i2c_sht.sht3x import Sht3xI2cDevice
+from sensirion_i2c_sht.sht4x import Sht4xI2cDevice
+import io
+import pytest
+
+try:
+    from time import monotonic
+except ImportError:  # Python 2
+    from time import time as monotonic
+
+
+def _record(path, measurements=3):
+    simulated = SimulatedSht4x(temperature=20.)
+    with RecordingI2cTransceiver(SimulatedI2cTransceiver([simulated]),
+                                 path) as recorder:
+        sht4x = Sht4xI2cDevice(I2cConnection(recorder))
+        serial_number = sht4x.read_serial_number()
+        results = []
+        for i in range(measurements):
+            simulated.temperature = 20. + i
+            results.append(sht4x.single_shot_measurement())
+    return recorder, serial_number, results
+
+
+def test_replay(tmpdir):
+    """
+    Test if recorded transfers are replayed at full speed.
+    """
+    path = str(tmpdir.join('traffic.i2c'))
+    recorder, serial_number, results = _record(path)
+    assert recorder.count == 4
+    replay = ReplayI2cTransceiver(path)
+    sht4x = Sht4xI2cDevice(I2cConnection(replay))
+    assert sht4x.read_serial_number() == serial_number
+    start = monotonic()
+    for temperature, humidity in results:
+        t, rh = sht4x.single_shot_measurement()
+        assert t.ticks == temperature.ticks
+        assert rh.ticks == humidity.ticks
+    assert monotonic() - start < 0.02  # without measurement durations
+    assert replay.finished
+    with pytest.raises(EOFError):
+        sht4x.single_shot_measurement()
+    replay.rewind()
+    assert sht4x.read_serial_number() == serial_number
+
+
+def test_real_time(tmpdir):
+    """
+    Test if the recorded timing is reproduced in real-time mode.
+    """
+    path = str(tmpdir.join('traffic.i2c'))
+    _record(path, measurements=2)
+    replay = ReplayI2cTransceiver(path, real_time=True)
+    sht4x = Sht4xI2cDevice(I2cConnection(replay))
+    sht4x.read_serial_number()
+    start = monotonic()
+    sht4x.single_shot_measurement()
+    sht4x.single_shot_measurement()
+    assert monotonic() - start >= 0.016  # two measurement durations
+
+
+def test_mismatch(tmpdir):
+    """
+    Test if transfers not matching the recording raise an error.
+    """
+    path = str(tmpdir.join('traffic.i2c'))
+    _record(path)
+    sht4x = Sht4xI2cDevice(I2cConnection(ReplayI2cTransceiver(path)))
+    with pytest.raises(ValueError):
+        sht4x.single_shot_measurement()
+
+
+def test_loop(tmpdir):
+    """
+    Test if the transfers are repeated in loop mode.
+    """
+    path = str(tmpdir.join('traffic.i2c'))
+    _record(path, measurements=0)
+    replay = ReplayI2cTransceiver(path, loop=True)
+    sht4x = Sht4xI2cDevice(I2cConnection(replay))
+    for _ in range(3):
+        sht4x.read_serial_number()
+    assert not replay.finished
+
+
+def test_errors():
+    """
+    Test if errors are recorded and replayed.
+    """
+    f = io.BytesIO()
+    transceiver = FaultInjectingI2cTransceiver(
+        SimulatedI2cTransceiver([SimulatedSht3x()]), crc_error_rate=1.)
+    recorder = RecordingI2cTransceiver(transceiver, f)
+    sht3x = Sht3xI2cDevice(I2cConnection(recorder))
+    with pytest.raises(I2cChecksumError):
+        sht3x.read_serial_number()
+    transceiver.crc_error_rate = 0.
+    transceiver.nack_rate = 1.
+    with pytest.raises(I2cNackError):
+        sht3x.read_serial_number()
+    recorder.close()
+    f.seek(0)
+    sht3x = Sht3xI2cDevice(I2cConnection(ReplayI2cTransceiver(f)))
+    with pytest.raises(I2cChecksumError):
+        sht3x.read_serial_number()
+    with pytest.raises(I2cNackError):
+        sht3x.read_serial_number()
+
+
+def test_multi_channel():
+    """
+    Test if multi-channel transfers are recorded and replayed.
+    """
+    f = io.BytesIO()
+    recorder = RecordingI2cTransceiver(SimulatedI2cTransceiver(
+        channels=[[SimulatedSht4x()], []]), f)
+    sht4x = Sht4xI2cDevice(I2cConnection(recorder))
+    recorded = sht4x.read_serial_number()
+    recorder.close()
+    f.seek(0)
+    channel_count, transfers = read_transfers(f)
+    assert channel_count == 2
+    assert transfers[0].tx_data == b'\x89'
+    f.seek(0)
+    sht4x = Sht4xI2cDevice(I2cConnection(ReplayI2cTransceiver(f)))
+    replayed = sht4x.read_serial_number()
+    assert replayed[0] == recorded[0]
+    assert isinstance(replayed[1], I2cNackError)
+
+
+def test_invalid_file():
+    """
+    Test if invalid files are rejected.
+    """
+    with pytest.raises(ValueError):
+        ReplayI2cTransceiver(io.BytesIO(b'no recording'))
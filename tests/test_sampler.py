@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver.errors import I2cNackError
+from sensirion_i2c_sht.sampler import Sampler
+from sensirion_i2c_sht.sht4x import Sht4xRepeatability
+import pytest
+import time
+
+try:
+    from time import monotonic
+except ImportError:  # Python 2
+    from time import time as monotonic
+
+
+def _wait_for(condition, timeout=2.):
+    deadline = monotonic() + timeout
+    while not condition():
+        assert monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_latest_value(simulated_sht4x):
+    """
+    Test if the sampler publishes the latest measurement result.
+    """
+    simulated, _, sht4x = simulated_sht4x
+    simulated.temperature = 10.
+    with Sampler(sht4x, interval=0.01,
+                 repeatability=Sht4xRepeatability.LOW) as sampler:
+        assert sampler.running
+        _wait_for(lambda: sampler.latest is not None)
+        temperature, _ = sampler.get()
+        assert temperature.degrees_celsius == pytest.approx(10., abs=0.1)
+        simulated.temperature = 20.
+        _wait_for(lambda: sampler.get()[0].degrees_celsius > 19.9)
+        assert sampler.latest.sequence > 1
+        assert sampler.latest.age < 1.
+    assert not sampler.running
+    sequence = sampler.latest.sequence
+    # the device can be used again after stopping
+    sht4x.single_shot_measurement()
+    assert sampler.latest.sequence == sequence
+
+
+def test_errors(simulated_sht4x):
+    """
+    Test if errors of the sampling thread are surfaced without stopping it.
+    """
+    _, transceiver, sht4x = simulated_sht4x
+    transceiver.nack_rate = 1.
+    with Sampler(sht4x, interval=0.001) as sampler:
+        with pytest.raises(RuntimeError):
+            sampler.get()  # nothing measured yet
+        _wait_for(lambda: sampler.errors >= 2)
+        assert sampler.running
+        assert type(sampler.last_error) is I2cNackError
+        with pytest.raises(I2cNackError):
+            sampler.get()
+        transceiver.nack_rate = 0.
+        _wait_for(lambda: sampler.latest is not None)
+        assert sampler.last_error is None
+        sampler.get()
+
+
+def test_max_age(simulated_sht4x):
+    """
+    Test if too old samples are rejected.
+    """
+    _, _, sht4x = simulated_sht4x
+    sampler = Sampler(sht4x)
+    sampler.sample()
+    time.sleep(0.02)
+    assert sampler.get(max_age=1.) is sampler.latest.value
+    with pytest.raises(RuntimeError):
+        sampler.get(max_age=0.01)
+
+
+def test_restart(simulated_sht4x):
+    """
+    Test if a stopped sampler can be started again, but not twice.
+    """
+    _, _, sht4x = simulated_sht4x
+    sampler = Sampler(sht4x, interval=0.01)
+    sampler.start()
+    with pytest.raises(RuntimeError):
+        sampler.start()
+    sampler.stop()
+    sampler.start()
+    _wait_for(lambda: sampler.latest is not None)
+    sampler.stop()
+    sampler.stop()
+    assert not sampler.running
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver import I2cConnection
+from sensirion_i2c_driver.errors import I2cNackError
+from sensirion_i2c_sht.instrumentation import TimingCollector
+from sensirion_i2c_sht.scheduler import MeasurementScheduler
+from sensirion_i2c_sht.simulation import SimulatedI2cTransceiver, \
+    SimulatedSht2x, SimulatedSht3x, SimulatedSht4x, SimulatedShtc3
+from sensirion_i2c_sht.sht2x import Sht2xI2cDevice
+from sensirion_i2c_sht.sht2x.commands import Sht2xI2cMeasureTemperature, \
+    Sht2xI2cMeasureHumidity
+from sensirion_i2c_sht.sht3x import Sht3xI2cDevice, Sht3xTemperature, \
+    Sht3xHumidity, Sht3xRepeatability
+from sensirion_i2c_sht.sht3x.commands import Sht3xI2cCmdMeasHighRes
+from sensirion_i2c_sht.sht4x import Sht4xI2cDevice
+from sensirion_i2c_sht.sht4x.commands import Sht4xI2cCmdMeasHighRes
+from sensirion_i2c_sht.shtc3 import Shtc3I2cDevice
+from sensirion_i2c_sht.shtc3.commands import Shtc3I2cCmdMeasureNormalModeTicks
+import pytest
+
+try:
+    from time import monotonic
+except ImportError:  # Python 2
+    from time import time as monotonic
+
+
+@pytest.mark.needs_device
+@pytest.mark.needs_sht3x
+def test_sweep(sht3x):
+    """
+    Test if a sweep returns the result of every added device.
+    """
+    scheduler = MeasurementScheduler([sht3x])
+    scheduler.add_device(sht3x, repeatability=Sht3xRepeatability.LOW)
+    assert scheduler.devices == [sht3x, sht3x]
+    results = scheduler.sweep()
+    assert len(results) == 2
+    # both entries use the same device, which does not acknowledge the
+    # second measurement command while the first measurement is running
+    assert type(results[1]) is I2cNackError
+    temperature, humidity = results[0]
+    assert type(temperature) is Sht3xTemperature
+    assert type(humidity) is Sht3xHumidity
+
+
+def test_sweep_overlapping():
+    """
+    Test if a sweep over devices of several families on one bus overlaps
+    their measurement durations, i.e. takes about the longest measurement
+    duration instead of the sum of all of them.
+    """
+    connection = I2cConnection(SimulatedI2cTransceiver([
+        SimulatedSht2x(temperature=10.), SimulatedSht3x(temperature=20.),
+        SimulatedSht4x(slave_address=0x46, temperature=30.),
+        SimulatedShtc3(temperature=40.)]))
+    devices = [Sht2xI2cDevice(connection), Sht3xI2cDevice(connection),
+               Sht4xI2cDevice(connection, slave_address=0x46),
+               Shtc3I2cDevice(connection)]
+    collector = TimingCollector()
+    with collector.attach(*devices):
+        start = monotonic()
+        results = MeasurementScheduler(devices).sweep()
+        duration = monotonic() - start
+    for result, expected in zip(results, (10., 20., 30., 40.)):
+        temperature, humidity = result
+        assert temperature.degrees_celsius == pytest.approx(expected,
+                                                            abs=0.05)
+        assert humidity.percent_rh == pytest.approx(50., abs=0.05)
+    measurements = [t for t in collector.transactions
+                    if t.durations().get('read_delay')]
+    assert len(measurements) == len(devices)
+    # all measurements were started before the first one was read
+    assert max(t.start for t in measurements) < \
+        min(t.end for t in measurements)
+    # measuring one device after the other takes at least the sum of all
+    # measurement durations
+    sequential = sum(command.read_delay for command in (
+        Sht2xI2cMeasureTemperature(), Sht2xI2cMeasureHumidity(),
+        Sht3xI2cCmdMeasHighRes(), Sht4xI2cCmdMeasHighRes(),
+        Shtc3I2cCmdMeasureNormalModeTicks()))
+    assert duration < sequential
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver import I2cConnection
+from sensirion_i2c_driver.errors import I2cNackError, I2cTimeoutError
+from sensirion_i2c_sht.commands import get_write_phase, get_read_phase
+from sensirion_i2c_sht.simulation import SimulatedI2cTransceiver, \
+    SimulatedSht2x, SimulatedSht3x, SimulatedSht4x, SimulatedSts4x, \
+    SimulatedShtc3
+from sensirion_i2c_sht.sht2x import Sht2xI2cDevice
+from sensirion_i2c_sht.sht3x import Sht3xI2cDevice, Sht3xRepeatability
+from sensirion_i2c_sht.sht3x.commands import Sht3xI2cCmdMeasHighRes, \
+    Sht3xI2cCmdMeasHighResClockStretching
+from sensirion_i2c_sht.sht4x import Sht4xI2cDevice, Sht4xHeaterPower, \
+    Sht4xHeaterActivationDuration
+from sensirion_i2c_sht.sts4x import Sts4xI2cDevice
+from sensirion_i2c_sht.shtc3 import Shtc3I2cDevice
+from sensirion_i2c_sht.shtc3.commands import Shtc3I2cCmdMeasureNormalModeTicks
+import pytest
+import time
+
+
+def _connect(*devices):
+    return I2cConnection(SimulatedI2cTransceiver(devices))
+
+
+@pytest.mark.parametrize("device_class,model", [
+    (Sht2xI2cDevice, SimulatedSht2x),
+    (Sht3xI2cDevice, SimulatedSht3x),
+    (Sht4xI2cDevice, SimulatedSht4x),
+    (Sts4xI2cDevice, SimulatedSts4x),
+])
+def test_serial_number(device_class, model):
+    """
+    Test if the serial number of the simulated device is read.
+    """
+    simulated = model()
+    device = device_class(_connect(simulated))
+    assert device.read_serial_number() == simulated.serial_number
+
+
+@pytest.mark.parametrize("device_class,model", [
+    (Sht2xI2cDevice, SimulatedSht2x),
+    (Sht3xI2cDevice, SimulatedSht3x),
+    (Sht4xI2cDevice, SimulatedSht4x),
+])
+def test_measurement(device_class, model):
+    """
+    Test if the simulated temperature and humidity are measured.
+    """
+    device = device_class(_connect(model(temperature=-10., humidity=80.)))
+    temperature, humidity = device.single_shot_measurement()
+    assert temperature.degrees_celsius == pytest.approx(-10., abs=0.05)
+    assert humidity.percent_rh == pytest.approx(80., abs=0.05)
+
+
+def test_measurement_temperature_only():
+    """
+    Test if the simulated temperature is measured by STS4x.
+    """
+    device = Sts4xI2cDevice(_connect(SimulatedSts4x(temperature=60.)))
+    assert device.single_shot_measurement().degrees_celsius == \
+        pytest.approx(60., abs=0.05)
+
+
+def test_measurement_shtc3():
+    """
+    Test if the simulated temperature and humidity are measured by SHTC3,
+    which is sent to sleep mode afterwards.
+    """
+    simulated = SimulatedShtc3(temperature=30., humidity=20.)
+    device = Shtc3I2cDevice(_connect(simulated))
+    temperature, humidity = device.measure()
+    assert temperature.degrees_celsius == pytest.approx(30., abs=0.05)
+    assert humidity.percent_rh == pytest.approx(20., abs=0.05)
+    assert simulated.sleeping is True
+
+
+def test_read_too_early():
+    """
+    Test if reading a measurement result before it is available is not
+    acknowledged, and succeeds afterwards.
+    """
+    connection = _connect(SimulatedSht3x())
+    command = Sht3xI2cCmdMeasHighRes()
+    connection.execute(0x44, get_write_phase(command))
+    with pytest.raises(I2cNackError):
+        connection.execute(0x44, get_read_phase(command))
+    time.sleep(SimulatedSht3x.MEASUREMENT_DURATIONS[0])
+    temperature, humidity = connection.execute(0x44, get_read_phase(command))
+    assert temperature.degrees_celsius == pytest.approx(25., abs=0.05)
+
+
+def test_clock_stretching():
+    """
+    Test if the read transfer is stretched until the result is available,
+    and fails if the stretching takes longer than the timeout.
+    """
+    connection = _connect(SimulatedSht3x())
+    command = Sht3xI2cCmdMeasHighResClockStretching()
+    temperature, humidity = connection.execute(0x44, command)
+    assert temperature.degrees_celsius == pytest.approx(25., abs=0.05)
+    command.timeout = 0.001
+    with pytest.raises(I2cTimeoutError):
+        connection.execute(0x44, command)
+
+
+def test_busy_device():
+    """
+    Test if commands are not acknowledged while measuring.
+    """
+    sht3x = Sht3xI2cDevice(_connect(SimulatedSht3x()))
+    sht3x.start_measurement()
+    with pytest.raises(I2cNackError):
+        sht3x.read_status_register()
+
+
+def test_unknown_slave_address():
+    """
+    Test if transfers to a slave address without device are not
+    acknowledged.
+    """
+    sht4x = Sht4xI2cDevice(_connect(SimulatedSht4x()), slave_address=0x45)
+    with pytest.raises(I2cNackError):
+        sht4x.read_serial_number()
+
+
+def test_shtc3_sleep():
+    """
+    Test if a sleeping SHTC3 only acknowledges the wake-up command.
+    """
+    shtc3 = Shtc3I2cDevice(_connect(SimulatedShtc3()))
+    shtc3.enter_sleep()
+    with pytest.raises(I2cNackError):
+        shtc3.execute(Shtc3I2cCmdMeasureNormalModeTicks())
+    shtc3.wake_up()
+    shtc3.execute(Shtc3I2cCmdMeasureNormalModeTicks())
+
+
+class _NoSleepShtc3(SimulatedShtc3):
+    """
+    Simulated SHTC3 which does not acknowledge the sleep command as long as
+    :py:attr:`nack_sleep` is set.
+    """
+    nack_sleep = True
+
+    def _accepts(self, code):
+        if self.nack_sleep and (code == 0xB098):
+            return False
+        return super(_NoSleepShtc3, self)._accepts(code)
+
+
+def test_shtc3_sleep_failure():
+    """
+    Test if the measurement result is kept if sending the SHTC3 to sleep
+    fails, and sending it to sleep is retried by the next call.
+    """
+    simulated = _NoSleepShtc3(temperature=30.)
+    shtc3 = Shtc3I2cDevice(_connect(simulated))
+    handle = shtc3.start_measurement()
+    with pytest.raises(I2cNackError):
+        handle.result()
+    assert handle.done is False
+    simulated.nack_sleep = False
+    temperature, _ = shtc3.read_measurement()
+    assert temperature.degrees_celsius == pytest.approx(30., abs=0.05)
+    assert handle.result()[0] is temperature
+    assert simulated.sleeping is True
+
+
+def test_sht3x_status_register():
+    """
+    Test the reset, heater and command status flags of the SHT3x status
+    register.
+    """
+    simulated = SimulatedSht3x()
+    sht3x = Sht3xI2cDevice(_connect(simulated))
+    assert sht3x.read_status_register().system_reset_detected is True
+    sht3x.clear_status_register()
+    assert simulated.status_register == 0
+    sht3x.heater_on()
+    assert sht3x.read_status_register().heater_status is True
+    sht3x.soft_reset()
+    status = sht3x.read_status_register()
+    assert status.heater_status is False
+    assert status.system_reset_detected is True
+
+
+def test_sht3x_periodic_mode():
+    """
+    Test if the SHT3x rejects single shot measurements in the periodic data
+    acquisition mode, and returns every result only once.
+    """
+    simulated = SimulatedSht3x()
+    sht3x = Sht3xI2cDevice(_connect(simulated))
+    sht3x.art_enable()
+    assert simulated.periodic_mode is True
+    with pytest.raises(I2cNackError):
+        sht3x.single_shot_measurement(Sht3xRepeatability.LOW)
+    assert sht3x.read_status_register().command_status is True
+    time.sleep(0.02)  # wait until the first result is available
+    temperature, humidity = sht3x.fetch_data()
+    assert temperature.degrees_celsius == pytest.approx(25., abs=0.05)
+    with pytest.raises(I2cNackError):
+        sht3x.fetch_data()  # next result not yet available
+    sht3x.stop_periodic_measurement()
+    assert simulated.periodic_mode is False
+
+
+def test_sht3x_heater():
+    """
+    Test if the SHT3x heater increases the temperature and decreases the
+    relative humidity.
+    """
+    simulated = SimulatedSht3x()
+    sht3x = Sht3xI2cDevice(_connect(simulated))
+    sht3x.heater_on()
+    temperature, humidity = sht3x.single_shot_measurement()
+    assert temperature.degrees_celsius == \
+        pytest.approx(25. + simulated.heater_temperature_rise, abs=0.05)
+    assert humidity.percent_rh < 50.
+
+
+def test_sht4x_heater():
+    """
+    Test if the SHT4x heater takes the heating time and increases the
+    temperature.
+    """
+    simulated = SimulatedSht4x()
+    sht4x = Sht4xI2cDevice(_connect(simulated))
+    handle = sht4x.start_heater(Sht4xHeaterPower.LOW,
+                                Sht4xHeaterActivationDuration.SHORT)
+    assert handle.is_ready() is False
+    temperature, humidity = handle.result()
+    assert temperature.degrees_celsius > 25.
+    assert humidity.percent_rh < 50.
+    assert simulated.heater_activations == 1
+
+
+def test_multi_channel():
+    """
+    Test if a simulated multi-channel transceiver executes transfers on all
+    channels.
+    """
+    transceiver = SimulatedI2cTransceiver(channels=[
+        [SimulatedSht4x(temperature=20.)],
+        [],
+        [SimulatedSht4x(temperature=30.)],
+    ])
+    assert transceiver.channel_count == 3
+    sht4x = Sht4xI2cDevice(I2cConnection(transceiver))
+    result = sht4x.single_shot_measurement_multi_channel()
+    assert list(result.valid) == [True, False, True]
+    assert result.degrees_celsius[0] == pytest.approx(20., abs=0.05)
+    assert result.degrees_celsius[2] == pytest.approx(30., abs=0.05)
+
+
+def test_devices_and_channels():
+    """
+    Test if passing both devices and channels raises an exception.
+    """
+    with pytest.raises(ValueError):
+        SimulatedI2cTransceiver([SimulatedSht4x()], [[SimulatedSht4x()]])
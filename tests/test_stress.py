@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver import I2cConnection
+from sensirion_i2c_driver.errors import I2cChecksumError, I2cNackError
+from sensirion_i2c_sht.simulation import SimulatedI2cTransceiver, \
+    FaultInjectingI2cTransceiver, SimulatedSht3x, SimulatedSht4x
+from sensirion_i2c_sht.simulation.stress import run_stress, stress_family, \
+    StressReport, FAMILIES
+from sensirion_i2c_sht.sht3x import Sht3xI2cDevice
+from sensirion_i2c_sht.sht4x import Sht4xI2cDevice
+import pytest
+import time
+
+
+def test_crc_error(simulated_sht4x):
+    """
+    Test if injected CRC errors raise a checksum error.
+    """
+    _, transceiver, sht4x = simulated_sht4x
+    transceiver.crc_error_rate = 1.
+    with pytest.raises(I2cChecksumError):
+        sht4x.read_serial_number()
+    assert transceiver.injected['crc'] == 1
+
+
+def test_nack(simulated_sht4x):
+    """
+    Test if injected NACKs raise a NACK error.
+    """
+    _, transceiver, sht4x = simulated_sht4x
+    transceiver.nack_rate = 1.
+    with pytest.raises(I2cNackError):
+        sht4x.read_serial_number()
+    assert transceiver.injected['nack'] == 1
+
+
+def test_delayed_readiness(simulated_sht4x):
+    """
+    Test if the device is not ready for the readiness delay after a write.
+    """
+    _, transceiver, sht4x = simulated_sht4x
+    transceiver.delay_rate = 1.
+    transceiver.readiness_delay = 0.05
+    with pytest.raises(I2cNackError):
+        sht4x.single_shot_measurement()
+    time.sleep(0.05)
+    transceiver.delay_rate = 0.
+    sht4x.single_shot_measurement()
+
+
+def test_stuck_value(simulated_sht4x):
+    """
+    Test if a stuck value returns the previous data.
+    """
+    simulated, transceiver, sht4x = simulated_sht4x
+    simulated.temperature = 20.
+    transceiver.stuck_rate = 1.
+    first, _ = sht4x.single_shot_measurement()
+    simulated.temperature = 30.
+    second, _ = sht4x.single_shot_measurement()
+    assert second.ticks == first.ticks
+    assert transceiver.injected['stuck'] == 1
+
+
+def test_reset():
+    """
+    Test if a reset of a simulated device is executed.
+    """
+    simulated = SimulatedSht3x()
+    transceiver = FaultInjectingI2cTransceiver(
+        SimulatedI2cTransceiver([simulated]))
+    sht3x = Sht3xI2cDevice(I2cConnection(transceiver))
+    sht3x.clear_status_register()
+    assert simulated.status_register == 0
+    transceiver.reset_rate = 1.
+    with pytest.raises(I2cNackError):
+        sht3x.read_status_register()
+    assert simulated.status_register != 0  # reset detected
+    assert transceiver.injected['reset'] == 1
+
+
+def test_multi_channel():
+    """
+    Test if faults are injected per channel.
+    """
+    transceiver = FaultInjectingI2cTransceiver(SimulatedI2cTransceiver(
+        channels=[[SimulatedSht4x()], [SimulatedSht4x()]]),
+        crc_error_rate=1.)
+    sht4x = Sht4xI2cDevice(I2cConnection(transceiver))
+    serials = sht4x.read_serial_number()
+    assert [type(s) for s in serials] == [I2cChecksumError] * 2
+
+
+def test_run_stress():
+    """
+    Test if failures and recovery times are reported.
+    """
+    outcomes = iter([True, False, False, True, True])
+
+    def measure():
+        if not next(outcomes):
+            raise I2cNackError(None, b'')
+
+    report = run_stress(measure, 5)
+    assert report.iterations == 5
+    assert report.successes == 3
+    assert report.errors == {'I2cNackError': 2}
+    assert len(report.recovery_times) == 1
+    assert report.as_dict()['recovery_count'] == 1
+
+
+def test_latency_percentiles():
+    """
+    Test the nearest-rank latency percentiles.
+    """
+    report = StressReport([float(i) for i in range(1, 101)], {}, [], 1.)
+    assert report.latency(50) == 50.
+    assert report.latency(99) == 99.
+    assert report.latency(100) == 100.
+    assert report.throughput == 100.
+    assert StressReport([], {}, [], 0.).latency(50) is None
+
+
+@pytest.mark.parametrize("family", sorted(FAMILIES))
+def test_stress_family(family):
+    """
+    Test if all families can be stressed without faults.
+    """
+    report = stress_family(family, iterations=2)
+    assert report.successes == 2
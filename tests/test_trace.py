@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+from sensirion_i2c_driver import I2cConnection
+from sensirion_i2c_sht.instrumentation import Transaction, TimingCollector
+from sensirion_i2c_sht.metrics import MetricsRegistry
+from sensirion_i2c_sht.scheduler import MeasurementScheduler
+from sensirion_i2c_sht.simulation import SimulatedI2cTransceiver, \
+    SimulatedSht3x, SimulatedSht4x
+from sensirion_i2c_sht.sht3x import Sht3xI2cDevice
+from sensirion_i2c_sht.sht4x import Sht4xI2cDevice
+from sensirion_i2c_sht.sht4x.commands import Sht4xI2cCmdMeasHighRes
+from sensirion_i2c_sht.trace import TraceRecorder
+import json
+
+
+def test_shared_bus(tmpdir):
+    """
+    Test if the commands of devices sharing a bus are recorded as events.
+    """
+    connection = I2cConnection(SimulatedI2cTransceiver(
+        [SimulatedSht3x(slave_address=0x45), SimulatedSht4x()]))
+    sht3x = Sht3xI2cDevice(connection, slave_address=0x45)
+    sht4x = Sht4xI2cDevice(connection)
+    recorder = TraceRecorder()
+    recorder.attach(sht3x, name='sht3x')
+    recorder.attach(sht4x)
+    MeasurementScheduler([sht3x, sht4x]).sweep()
+    path = str(tmpdir.join('trace.json'))
+    recorder.save(path)
+    with open(path) as f:
+        events = json.load(f)['traceEvents']
+    names = dict((e['tid'], e['args']['name']) for e in events
+                 if e['name'] == 'thread_name')
+    assert sorted(names.values()) == ['0x44', 'sht3x']
+    assert [e['pid'] for e in events if e['name'] == 'process_name'] == [1]
+    commands = [e for e in events if e.get('cat') == 'command']
+    assert sorted(e['name'] for e in commands) == [
+        'Sht3xI2cCmdMeasHighRes', 'Sht4xI2cCmdMeasHighRes']
+    phases = [e for e in events if e.get('cat') == 'phase']
+    phase_names = set(e['name'] for e in phases)
+    assert phase_names >= set(['write', 'read_delay', 'read'])
+    for event in phases:
+        assert event['ph'] == 'X'
+        assert event['dur'] >= 0.
+        assert event['args']['address'] in ('0x44', '0x45')
+
+
+
+def test_connections_sharing_transceiver():
+    """
+    Test if devices with separate connections over the same transceiver are
+    shown on the same bus, and devices on other transceivers are not.
+    """
+    transceiver = SimulatedI2cTransceiver(
+        [SimulatedSht3x(slave_address=0x45), SimulatedSht4x()])
+    sht3x = Sht3xI2cDevice(I2cConnection(transceiver), slave_address=0x45)
+    sht4x = Sht4xI2cDevice(I2cConnection(transceiver))
+    other = Sht4xI2cDevice(I2cConnection(SimulatedI2cTransceiver(
+        [SimulatedSht4x()])))
+    recorder = TraceRecorder()
+    for device in (sht3x, sht4x, other):
+        recorder.attach(device)
+    MeasurementScheduler([sht3x, sht4x, other]).sweep()
+    events = recorder.as_dict()['traceEvents']
+    assert [e['pid'] for e in events if e['name'] == 'process_name'] == [1, 2]
+    pids = dict((e['args']['address'], e['pid']) for e in events
+                if e.get('cat') == 'command' and e['tid'] != 3)
+    assert pids == {'0x44': 1, '0x45': 1}
+    assert set(e['pid'] for e in events
+               if e.get('cat') == 'command' and e['tid'] == 3) == set([2])
+
+
+def test_bounded_buffer():
+    """
+    Test if the oldest events are discarded.
+    """
+    recorder = TraceRecorder(max_events=4)
+    for i in range(3):
+        transaction = Transaction(Sht4xI2cCmdMeasHighRes(), 0x44)
+        transaction.add('write', float(i), i + 0.5)
+        recorder.record(transaction)
+    events = recorder.as_dict()['traceEvents']
+    assert len(events) == 4
+    assert events[0]['ts'] == 1e6  # command event of the second transaction
+    assert recorder.dropped == 2
+    recorder.clear()
+    assert recorder.as_dict()['traceEvents'] == []
+
+
+def test_chained_callbacks():
+    """
+    Test if the recorder is chained with other instrumentation callbacks.
+    """
+    sht4x = Sht4xI2cDevice(I2cConnection(SimulatedI2cTransceiver(
+        [SimulatedSht4x()])))
+    registry = MetricsRegistry()
+    registry.attach(sht4x)
+    recorder = TraceRecorder()
+    recorder.attach(sht4x)
+    collector = TimingCollector()
+    with collector.attach(sht4x):
+        sht4x.single_shot_measurement()
+    assert len(sht4x.instrumentation.callbacks) == 2
+    sht4x.single_shot_measurement()
+    assert len(collector.transactions) == 1
+    assert registry.snapshot()['0x44']['Sht4xI2cCmdMeasHighRes'].count == 2
+    assert len([e for e in recorder.as_dict()['traceEvents']
+                if e.get('cat') == 'command']) == 2